@@ -186,6 +186,8 @@ function NBASeasonStatsSection({
     { key: "fgPct", label: "FG%", fmt: (v: number) => `${(v * 100).toFixed(1)}%` },
     { key: "fg3Pct", label: "3P%", fmt: (v: number) => `${(v * 100).toFixed(1)}%` },
     { key: "ftPct", label: "FT%", fmt: (v: number) => `${(v * 100).toFixed(1)}%` },
+    { key: "tsPct", label: "TS%", fmt: (v: number) => `${(v * 100).toFixed(1)}%` },
+    { key: "usgPct", label: "USG%", fmt: (v: number) => `${v.toFixed(1)}%` },
     { key: "minutesPerGame", label: "MPG" },
     { key: "turnoversPerGame", label: "TOV" },
   ];
@@ -988,6 +988,9 @@ export default function TeamBuilder() {
                             <th className="text-right py-2 px-1.5 font-medium text-muted-foreground">3P%</th>
                             <th className="text-right py-2 px-1.5 font-medium text-muted-foreground">FT%</th>
                             <th className="text-right py-2 px-1.5 font-medium text-muted-foreground">TOV</th>
+                            <th className="text-right py-2 px-1.5 font-medium text-muted-foreground">TS%</th>
+                            <th className="text-right py-2 px-1.5 font-medium text-muted-foreground">USG%</th>
+                            <th className="text-right py-2 px-1.5 font-medium text-muted-foreground">Value</th>
                           </tr>
                         </thead>
                         <tbody>
@@ -1021,6 +1024,9 @@ export default function TeamBuilder() {
                                 <td className="text-right py-2 px-1.5 font-mono">{s.fg3Pct != null ? `${(Number(s.fg3Pct) * 100).toFixed(1)}` : "—"}</td>
                                 <td className="text-right py-2 px-1.5 font-mono">{s.ftPct != null ? `${(Number(s.ftPct) * 100).toFixed(1)}` : "—"}</td>
                                 <td className="text-right py-2 px-1.5 font-mono text-muted-foreground">{s.turnoversPerGame != null ? Number(s.turnoversPerGame).toFixed(1) : "—"}</td>
+                                <td className="text-right py-2 px-1.5 font-mono">{s.tsPct != null ? `${(Number(s.tsPct) * 100).toFixed(1)}` : "—"}</td>
+                                <td className="text-right py-2 px-1.5 font-mono">{s.usgPct != null ? Number(s.usgPct).toFixed(1) : "—"}</td>
+                                <td className="text-right py-2 px-1.5 font-mono" title={s.valuePerMillion != null ? `${s.valuePerMillion} game score per $1M` : undefined}>{s.valueScore != null ? Math.round(Number(s.valueScore)) : "—"}</td>
                               </tr>
                             ))}
                         </tbody>
@@ -0,0 +1,6 @@
+"""Roster data pipeline: scraping, matching and seed generation for the NBA roster data.
+
+Modules are import-safe (no work happens at import time) and keep heavy
+dependencies such as requests, bs4 and numpy behind the commands that need
+them. Run ``python -m pipeline --help`` for the command list.
+"""
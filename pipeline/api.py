@@ -0,0 +1,36 @@
+"""Minimal JSON client for the app's HTTP API (stdlib only)."""
+
+import json
+import os
+import sys
+
+DEFAULT_API = os.environ.get("DEGEN_API", "http://localhost:5000")
+
+
+def fetch_json(base_url, path):
+    import urllib.request
+
+    with urllib.request.urlopen(f"{base_url.rstrip('/')}{path}", timeout=30) as resp:
+        return json.load(resp)
+
+
+def post_json(base_url, path, body=None):
+    import urllib.request
+
+    data = json.dumps(body or {}).encode()
+    req = urllib.request.Request(
+        f"{base_url.rstrip('/')}{path}", data=data, method="POST",
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(req, timeout=120) as resp:
+        return json.load(resp)
+
+
+def cmd_warm_cache(args):
+    body = {"sports": args.sports} if args.sports else {}
+    report = post_json(args.api, "/api/cache/warm", body)
+    print(f"Warmed {len(report['entries'])} responses in {report['durationMs']}ms")
+    for entry in report["failed"]:
+        print(f"  FAILED {entry['key']}: {entry['error']}")
+    if report["failed"]:
+        sys.exit(1)
@@ -0,0 +1,342 @@
+"""Basketball Reference contract and roster page scraping.
+
+``requests`` and ``bs4`` are imported on first use so that commands which
+never touch the network do not pay for them.
+"""
+
+import re
+import time
+
+from pipeline.profiling import stage
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+CURRENT_SEASON_START = 2025
+ROSTER_SEASON = 2026
+DELAY = 3.1
+
+POSITION_MAP = {
+    'PG': 'PG', 'SG': 'SG', 'SF': 'SF', 'PF': 'PF', 'C': 'C',
+    'G': 'SG', 'F': 'SF', 'G-F': 'SG', 'F-G': 'SF', 'F-C': 'PF', 'C-F': 'C',
+}
+
+
+def contracts_url(bbref_code):
+    return f"https://www.basketball-reference.com/contracts/{bbref_code}.html"
+
+
+def roster_url(bbref_code, season=ROSTER_SEASON):
+    return f"https://www.basketball-reference.com/teams/{bbref_code}/{season}.html"
+
+
+def parse_salary(val):
+    if not val or val.strip() in ('', '-'):
+        return None
+    val = val.strip().replace('$', '').replace(',', '')
+    try:
+        return round(float(val) / 1_000_000, 2)
+    except ValueError:
+        return None
+
+
+def normalize_name(name):
+    name = name.strip()
+    name = re.sub(r'\s*\(TW\)\s*$', '', name)
+    name = name.replace('\xa0', ' ')
+    return name
+
+
+def fetch_page(url):
+    import requests
+
+    with stage("fetch"):
+        resp = requests.get(url, headers=HEADERS, timeout=30)
+        resp.raise_for_status()
+        resp.encoding = 'utf-8'
+        return resp.text
+
+
+def _soup(html):
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, 'html.parser')
+
+
+def parse_roster_page(html):
+    """{player name: position} from a team season page; {} when there is no roster table."""
+    with stage("parse"):
+        soup = _soup(html)
+        table = soup.find('table', {'id': 'roster'})
+        if not table:
+            return {}
+        tbody = table.find('tbody')
+        if not tbody:
+            return {}
+        roster = {}
+        for row in tbody.find_all('tr'):
+            name_td = row.find('td', {'data-stat': 'player'})
+            pos_td = row.find('td', {'data-stat': 'pos'})
+            if not name_td or not pos_td:
+                continue
+            name_link = name_td.find('a')
+            name = normalize_name(name_link.get_text(strip=True) if name_link else name_td.get_text(strip=True))
+            pos = pos_td.get_text(strip=True)
+            pos = POSITION_MAP.get(pos, pos.split('-')[0] if '-' in pos else pos)
+            roster[name] = pos
+        return roster
+
+
+def parse_contracts_page(html):
+    """Contract rows from a team contracts page; None when the page has no contracts table."""
+    with stage("parse"):
+        soup = _soup(html)
+
+        table = soup.find('table', {'id': 'contracts'})
+        if not table:
+            return None
+
+        thead = table.find('thead')
+        header_rows = thead.find_all('tr') if thead else []
+        last_header = header_rows[-1] if header_rows else None
+
+        year_map = {}
+        if last_header:
+            for th in last_header.find_all('th'):
+                stat = th.get('data-stat', '')
+                text = th.get_text(strip=True)
+                match = re.match(r'(\d{4})-(\d{2})', text)
+                if match and stat.startswith('y'):
+                    year_map[stat] = int(match.group(1))
+
+        tbody = table.find('tbody')
+        if not tbody:
+            return []
+
+        players = []
+        for row in tbody.find_all('tr'):
+            if row.get('class') and ('thead' in row['class'] or 'over_header' in row['class']):
+                continue
+
+            th = row.find('th', {'data-stat': 'player'})
+            if not th:
+                continue
+
+            player_link = th.find('a')
+            if not player_link:
+                continue
+
+            name = normalize_name(player_link.get_text(strip=True))
+
+            age_td = row.find('td', {'data-stat': 'age_today'})
+            age = None
+            if age_td:
+                try:
+                    age = int(age_td.get_text(strip=True))
+                except (ValueError, TypeError):
+                    pass
+
+            salary_by_year = {}
+            option_info = {}
+
+            for stat_key, year in year_map.items():
+                td = row.find('td', {'data-stat': stat_key})
+                if not td:
+                    continue
+
+                salary = parse_salary(td.get_text(strip=True))
+                cell_classes = td.get('class', [])
+
+                if 'iz' in cell_classes:
+                    continue
+
+                option_type = None
+                if 'salary-pl' in cell_classes:
+                    option_type = 'player'
+                elif 'salary-tm' in cell_classes:
+                    option_type = 'team'
+                elif 'salary-et' in cell_classes:
+                    option_type = 'early_termination'
+
+                if salary is not None and salary > 0:
+                    salary_by_year[str(year)] = salary
+                    if option_type:
+                        option_info[str(year)] = option_type
+
+            gtd_td = row.find('td', {'data-stat': 'remain_gtd'})
+            guaranteed = None
+            if gtd_td:
+                guaranteed = parse_salary(gtd_td.get_text(strip=True))
+
+            if not salary_by_year:
+                continue
+
+            years_list = sorted([int(y) for y in salary_by_year.keys()])
+            cap_hit = salary_by_year.get(str(CURRENT_SEASON_START))
+            if not cap_hit:
+                cap_hit = salary_by_year.get(str(years_list[0]))
+
+            players.append({
+                "name": name,
+                "age": age,
+                "salary_by_year": salary_by_year,
+                "cap_hit": cap_hit,
+                "contract_years": len(years_list),
+                "contract_end_year": max(years_list) + 1,
+                "option_type": option_info.get(str(years_list[-1]), "none"),
+                "guaranteed": guaranteed,
+            })
+
+        return players
+
+
+def merge_roster_contracts(our_code, roster, contracts):
+    """Join contract rows with roster positions into full-roster records."""
+    merged = []
+    for c in contracts:
+        pos = roster.get(c['name'], None)
+        if not pos:
+            for rname, rpos in roster.items():
+                if rname.split()[-1] == c['name'].split()[-1] and rname[0] == c['name'][0]:
+                    pos = rpos
+                    break
+        if not pos:
+            pos = 'SF'
+
+        merged.append({
+            "teamCode": our_code,
+            "name": c['name'],
+            "position": pos,
+            "age": c['age'],
+            "capHit": c['cap_hit'],
+            "contractYears": c['contract_years'],
+            "contractEndYear": c['contract_end_year'],
+            "optionType": c['option_type'],
+            "salaryByYear": c['salary_by_year'],
+            "on_roster": c['name'] in roster,
+        })
+    return merged
+
+
+def scrape_contracts(teams, delay=3.5, fetch=fetch_page):
+    """Scrape contract pages for {bbref code: our code}; failed teams map to []."""
+    all_contracts = {}
+    total = len(teams)
+    for idx, (bbref_code, our_code) in enumerate(teams.items()):
+        print(f"[{idx+1}/{total}] Scraping {bbref_code} -> {our_code}...")
+        try:
+            players = parse_contracts_page(fetch(contracts_url(bbref_code)))
+            if players is None:
+                print(f"  No contracts table found for {bbref_code}")
+                players = []
+            all_contracts[our_code] = players
+            print(f"  Found {len(players)} players with contracts")
+        except Exception as e:
+            print(f"  ERROR: {e}")
+            all_contracts[our_code] = []
+
+        if idx < total - 1:
+            time.sleep(delay)
+    return all_contracts
+
+
+def scrape_full_rosters(teams, delay=DELAY, fetch=fetch_page, existing=None):
+    """Scrape roster + contract pages for {bbref code: our code} and merge them per team."""
+    all_teams = dict(existing or {})
+    total = len(teams)
+    for idx, (bbref_code, our_code) in enumerate(teams.items()):
+        print(f"[{idx+1}/{total}] {bbref_code} -> {our_code}...", end=" ", flush=True)
+        try:
+            roster = parse_roster_page(fetch(roster_url(bbref_code)))
+            print(f"roster={len(roster)}", end=" ", flush=True)
+            time.sleep(delay)
+            contracts = parse_contracts_page(fetch(contracts_url(bbref_code))) or []
+            print(f"contracts={len(contracts)}", end=" ", flush=True)
+
+            with stage("merge"):
+                merged = merge_roster_contracts(our_code, roster, contracts)
+            all_teams[our_code] = merged
+            print(f"OK ({len(merged)} players)")
+        except Exception as e:
+            print(f"ERROR: {e}")
+            all_teams[our_code] = []
+
+        if idx < total - 1:
+            time.sleep(delay)
+    return all_teams
+
+
+def select_teams(codes=None, batch=0, teams=None):
+    """{bbref code: our code} for the requested subset (our or bbref codes, or batch 1/2 of 15)
+    of ``teams`` (default: every bbref team)."""
+    if teams is None:
+        from pipeline.teams import BBREF_TEAMS
+
+        teams = BBREF_TEAMS
+    if codes:
+        wanted = {c.upper() for c in codes}
+        return {b: o for b, o in teams.items() if b in wanted or o in wanted}
+    if batch == 1:
+        return dict(list(teams.items())[:15])
+    if batch == 2:
+        return dict(list(teams.items())[15:])
+    return teams
+
+
+def _page_source(args, batch=0):
+    """(teams, fetch, delay): live bbref, or a generate-synthetic dump when --from-dir is set."""
+    if not args.from_dir:
+        return select_teams(args.teams, batch), fetch_page, None
+
+    import os
+
+    from pipeline.seed import read_json
+    from pipeline.synthetic import local_fetch
+
+    teams = select_teams(args.teams, batch, read_json(os.path.join(args.from_dir, "teams.json")))
+    return teams, local_fetch(os.path.join(args.from_dir, "html")), 0
+
+
+def cmd_scrape_contracts(args):
+    from pipeline.seed import write_json
+
+    teams, fetch, delay = _page_source(args)
+    all_contracts = scrape_contracts(teams, 3.5 if delay is None else delay, fetch)
+    with stage("write"):
+        write_json(args.out, all_contracts)
+
+    total_players = sum(len(v) for v in all_contracts.values())
+    print(f"\nDone! Scraped {total_players} player contracts across {len(all_contracts)} teams")
+
+    for team in ["BOS", "LAL", "GSW"]:
+        print(f"\n=== {team} Sample ===")
+        for p in all_contracts.get(team, [])[:3]:
+            print(f"  {p['name']:25s} cap=${p['cap_hit']:.2f}M  years={p['contract_years']}  end={p['contract_end_year']}  opt={p['option_type']}  salary={p['salary_by_year']}")
+
+
+def cmd_scrape_rosters(args):
+    import os
+
+    from pipeline.seed import read_json, write_json
+
+    if args.teams:
+        print(f"=== TEAMS: {', '.join(args.teams)} ===")
+    elif args.batch == 1:
+        print("=== BATCH 1: Teams 1-15 ===")
+    elif args.batch == 2:
+        print("=== BATCH 2: Teams 16-30 ===")
+    else:
+        print("=== ALL TEAMS ===")
+
+    existing = {}
+    if (args.batch == 2 or args.teams) and os.path.exists(args.out):
+        existing = read_json(args.out)
+
+    teams, fetch, delay = _page_source(args, args.batch)
+    all_teams = scrape_full_rosters(teams, DELAY if delay is None else delay, fetch, existing)
+    with stage("write"):
+        write_json(args.out, all_teams)
+
+    total_players = sum(len(v) for v in all_teams.values())
+    print(f"\nSaved {total_players} players across {len(all_teams)} teams to {args.out}")
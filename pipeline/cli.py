@@ -0,0 +1,179 @@
+"""Single entry point for the roster pipeline: ``python -m pipeline <command>``.
+
+Only argparse and the defaults in ``pipeline.paths`` are imported up front;
+each command's module (and its heavy dependencies) is imported when the
+command runs.
+"""
+
+import argparse
+import importlib
+import sys
+
+from pipeline import paths
+
+
+def _add_seed(p):
+    p.add_argument("--seed", default=paths.ROSTER_SEED_TS, help="TS roster seed file")
+
+
+def _add_scraped(p):
+    p.add_argument("--scraped", default=paths.SCRAPED_ROSTERS_JSON, help="scraped {name: {name, team}} JSON")
+    _add_seed(p)
+
+
+def _add_from_dir(p):
+    p.add_argument("--from-dir", metavar="DIR", help="read pages from a generate-synthetic dump instead of bbref")
+
+
+def _build_parser():
+    from pipeline.api import DEFAULT_API
+    from pipeline.profiling import DEFAULT_PROFILE_DIR, MODES
+
+    common = argparse.ArgumentParser(add_help=False)
+    group = common.add_argument_group("profiling")
+    group.add_argument("--profile", action="store_true", help="profile each stage of the command")
+    group.add_argument("--profile-dir", default=DEFAULT_PROFILE_DIR, help="where .prof/.collapsed files go")
+    group.add_argument("--profile-mode", choices=MODES, default="both")
+
+    parser = argparse.ArgumentParser(prog="python -m pipeline", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    def command(name, handler, help):
+        p = sub.add_parser(name, help=help, description=help, parents=[common])
+        p.set_defaults(handler=handler)
+        return p
+
+    p = command("scrape-contracts", "pipeline.bbref:cmd_scrape_contracts", "scrape bbref contract pages")
+    p.add_argument("--teams", nargs="+", help="only these team codes (ours or bbref)")
+    p.add_argument("--out", default=paths.CONTRACTS_JSON)
+    _add_from_dir(p)
+
+    p = command("scrape-rosters", "pipeline.bbref:cmd_scrape_rosters", "scrape bbref roster + contract pages")
+    p.add_argument("batch", nargs="?", type=int, default=0, choices=(0, 1, 2),
+                   help="1 = teams 1-15, 2 = teams 16-30 merged into --out, 0 = all")
+    p.add_argument("--teams", nargs="+", help="only these team codes, merged into --out")
+    p.add_argument("--out", default=paths.FULL_ROSTERS_JSON)
+    _add_from_dir(p)
+
+    p = command("refresh-rosters", "pipeline.transactions:cmd_refresh",
+                "re-scrape only the teams named in new league transactions")
+    p.add_argument("--season", type=int, default=2026, help="season end year")
+    p.add_argument("--out", default=paths.FULL_ROSTERS_JSON, help="full-rosters JSON to merge into")
+    p.add_argument("--state", default=paths.REFRESH_STATE_JSON, help="transactions seen on the last refresh")
+    p.add_argument("--full", action="store_true", help="ignore the state file and re-scrape every team")
+    p.add_argument("--dry-run", action="store_true", help="print the plan without scraping")
+    _add_from_dir(p)
+
+    p = command("scrape-season-totals", "pipeline.season_totals:cmd_scrape", "player -> team map from season totals")
+    p.add_argument("--season", type=int, default=2026, help="season end year")
+    p.add_argument("--out", help="write JSON here instead of stdout")
+
+    p = command("apply-contracts", "pipeline.contracts:cmd_apply", "apply scraped contracts to the TS seed")
+    p.add_argument("--contracts", default=paths.CONTRACTS_JSON)
+    _add_seed(p)
+
+    p = command("compare", "pipeline.rosters:cmd_compare", "report seed players whose team differs from the scrape")
+    _add_scraped(p)
+    p.add_argument("--out", default=paths.SYNC_RESULTS_JSON)
+
+    p = command("apply-roster-updates", "pipeline.rosters:cmd_apply_updates", "move seed players to their scraped team")
+    _add_scraped(p)
+
+    p = command("fix-remaining", "pipeline.rosters:cmd_fix_remaining", "re-match the known hard-to-match players")
+    _add_scraped(p)
+
+    p = command("generate", "pipeline.seed:cmd_generate", "render the TS seed from scraped full rosters")
+    p.add_argument("--rosters", default=paths.FULL_ROSTERS_JSON)
+    _add_seed(p)
+
+    p = command("roster-artifact", "pipeline.roster_artifact:cmd_build", "write the columnar roster artifact from the TS seed")
+    _add_seed(p)
+    p.add_argument("--out", help="artifact path (default: server/data/nbaRosters2026.json.gz for the default seed)")
+
+    p = command("generate-synthetic", "pipeline.synthetic:cmd_generate", "write a seeded synthetic league for scale tests")
+    p.add_argument("--scale", type=int, default=1, help="number of 30-team leagues (1 ~ the real seed)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--out", default=paths.SYNTHETIC_DIR)
+    p.add_argument("--no-html", action="store_true", help="skip the bbref-style HTML pages")
+
+    p = command("contract-index", "pipeline.contract_index:cmd_build", "build the contract-year index from the TS seed")
+    _add_seed(p)
+    p.add_argument("--index", default=paths.CONTRACT_INDEX)
+
+    p = command("contracts", "pipeline.contract_index:cmd_query", "query the contract-year index")
+    group = p.add_mutually_exclusive_group(required=True)
+    group.add_argument("--free-agents", type=int, metavar="YEAR", help="free-agent class of the YEAR offseason")
+    group.add_argument("--season", type=int, help="salary band in this season (start year)")
+    p.add_argument("--min", type=float, default=0.0, help="band floor, $M")
+    p.add_argument("--max", type=float, default=float("inf"), help="band ceiling, $M")
+    p.add_argument("--index", default=paths.CONTRACT_INDEX)
+
+    p = command("free-agents", "pipeline.contract_index:cmd_free_agents", "derive free_agents rows from the contract index")
+    p.add_argument("--year", type=int, default=2026, help="offseason the class hits the market")
+    p.add_argument("--index", default=paths.CONTRACT_INDEX)
+    p.add_argument("--out", help="write JSON here instead of stdout")
+
+    p = command("league-dataset", "pipeline.league_data:cmd_build",
+                "write the memory-mapped league dataset for pool workers")
+    p.add_argument("--artifact", default=paths.ROSTER_ARTIFACT, help="roster artifact to build from")
+    p.add_argument("--out", default=paths.LEAGUE_DATASET)
+
+    p = command("simulate-draft", "pipeline.mock_sim:cmd_simulate", "Monte Carlo mock drafts -> landing-spot odds")
+    p.add_argument("--sport", choices=("NFL", "NBA"), default="NBA")
+    p.add_argument("--year", type=int, default=2026)
+    p.add_argument("--drafts", type=int, default=20000, help="number of simulated drafts")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--workers", type=int, help="process pool size (default: all cores)")
+    p.add_argument("--board-noise", type=float, default=1.5, help="sd of per-draft grade noise")
+    p.add_argument("--pick-noise", type=float, default=4.0, help="sd of per-pick score noise")
+    p.add_argument("--api", default=DEFAULT_API)
+    p.add_argument("--input", help='JSON dump with "prospects", "teams" and "draftOrder" arrays')
+    p.add_argument("--out", help="odds JSON (default: server/data/draft-odds-<sport>.json)")
+
+    p = command("warm-cache", "pipeline.api:cmd_warm_cache", "preload the server's hot API responses after a refresh")
+    p.add_argument("--api", default=DEFAULT_API)
+    p.add_argument("--sport", action="append", choices=("NBA", "NFL"), dest="sports",
+                   help="only this sport (repeatable; default both)")
+
+    p = command("search-index", "pipeline.search_index:cmd_build",
+                "build the player-name typeahead index served by /api/players/search")
+    p.add_argument("--api", default=DEFAULT_API)
+    p.add_argument("--input", help='JSON dump with "roster", "freeAgents" and "prospects" arrays')
+    p.add_argument("--sport", action="append", choices=("NBA", "NFL"), dest="sports",
+                   help="only this sport (repeatable; default both)")
+    p.add_argument("--out", default=paths.PLAYER_SEARCH_INDEX)
+
+    p = command("player-index", "pipeline.player_index:cmd_build", "build the player similarity index")
+    p.add_argument("--api", default=DEFAULT_API)
+    p.add_argument("--input", help='JSON dump with "nbaStats", "collegeStats" and "prospects" arrays')
+    p.add_argument("--index", default=paths.PLAYER_INDEX)
+    p.add_argument("--comps", default=paths.PROSPECT_COMPS_JSON)
+    p.add_argument("--min-games", type=int, default=10)
+    p.add_argument("-k", type=int, default=5)
+
+    p = command("similar", "pipeline.player_index:cmd_query", "query the player similarity index")
+    p.add_argument("name")
+    p.add_argument("--pool", choices=("nba", "college"), default="nba")
+    p.add_argument("--index", default=paths.PLAYER_INDEX)
+    p.add_argument("-k", type=int, default=10)
+
+    return parser
+
+
+def _resolve(handler):
+    module, func = handler.split(":")
+    return getattr(importlib.import_module(module), func)
+
+
+def main(argv=None):
+    args = _build_parser().parse_args(sys.argv[1:] if argv is None else argv)
+    handler = _resolve(args.handler)
+
+    from pipeline import profiling
+
+    if args.profile:
+        profiling.activate(args.command, args.profile_dir, args.profile_mode)
+    try:
+        handler(args)
+    finally:
+        profiling.finish()
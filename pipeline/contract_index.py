@@ -0,0 +1,262 @@
+"""Sorted index over contract spans and per-season salaries.
+
+Two sorted views answer every query with an offset lookup and at most one
+binary search instead of a scan over decoded salaryByYear JSON:
+
+- ``fa_rows``: players ordered by (contractEndYear, has option), with
+  ``fa_keys``/``fa_ptr`` offsets, so a free-agent class and its option
+  players are contiguous slices.
+- ``sal_rows``/``sal_amount``: one entry per (player, season) salary,
+  ordered by season then amount, with ``seasons``/``season_ptr`` offsets,
+  so "under contract in season Y" is a slice and "earns between $X and $Z
+  in Y" is a binary search within it.
+
+The arrays are written as a compressed .npz; ``ContractIndex.load`` reads
+it back for queries.
+"""
+
+import json
+import sys
+import time
+
+import numpy as np
+
+from pipeline.bbref import CURRENT_SEASON_START
+from pipeline.paths import CONTRACT_INDEX
+from pipeline.profiling import stage
+
+OPTION_TYPES = ("none", "player", "team", "early_termination")
+
+# marketValue floors for the free_agents tiers, in $M.
+TIER_FLOORS = (("Elite", 24.0), ("Starter", 12.0), ("Rotation", 4.0), ("Depth", 0.0))
+
+
+def build_index(players):
+    """Index arrays for seed_players()-style dicts."""
+    end_year = np.array([p["contractEndYear"] or 0 for p in players], dtype=np.int16)
+    option = np.array([OPTION_TYPES.index(p["optionType"]) if p["optionType"] in OPTION_TYPES else 0
+                       for p in players], dtype=np.int8)
+
+    rows, seasons, amounts = [], [], []
+    for i, p in enumerate(players):
+        for season, salary in p["salaryByYear"].items():
+            rows.append(i)
+            seasons.append(int(season))
+            amounts.append(salary)
+    rows = np.array(rows, dtype=np.int32)
+    seasons = np.array(seasons, dtype=np.int16)
+    amounts = np.array(amounts, dtype=np.float64)
+    order = np.lexsort((amounts, seasons))
+    season_keys, season_counts = np.unique(seasons, return_counts=True)
+
+    fa_key = end_year.astype(np.int32) * 2 + (option > 0)
+    fa_order = np.argsort(fa_key, kind="stable").astype(np.int32)
+    fa_keys, fa_counts = np.unique(fa_key, return_counts=True)
+    return {
+        "names": np.array([p["name"] for p in players], dtype=str),
+        "teams": np.array([p["teamCode"] for p in players], dtype=str),
+        "positions": np.array([p["position"] for p in players], dtype=str),
+        "ages": np.array([p["age"] for p in players], dtype=np.int16),
+        "cap_hits": np.array([p["capHit"] for p in players], dtype=np.float32),
+        "end_year": end_year,
+        "option": option,
+        "fa_keys": fa_keys.astype(np.int32),
+        "fa_ptr": np.concatenate(([0], np.cumsum(fa_counts))),
+        "fa_rows": fa_order,
+        "seasons": season_keys.astype(np.int16),
+        "season_ptr": np.concatenate(([0], np.cumsum(season_counts))),
+        "sal_amount": amounts[order],
+        "sal_rows": rows[order],
+    }
+
+
+def _slices(keys, ptr):
+    return {int(k): (int(ptr[i]), int(ptr[i + 1])) for i, k in enumerate(keys)}
+
+
+class ContractIndex:
+    def __init__(self, arrays):
+        self.names = arrays["names"]
+        self.teams = arrays["teams"]
+        self.positions = arrays["positions"]
+        self.ages = arrays["ages"]
+        self.cap_hits = arrays["cap_hits"]
+        self.end_year = arrays["end_year"]
+        self.option = arrays["option"]
+        self.fa_rows = arrays["fa_rows"]
+        self.sal_amount = arrays["sal_amount"]
+        self.sal_rows = arrays["sal_rows"]
+        self._fa_slices = _slices(arrays["fa_keys"], arrays["fa_ptr"])
+        self._season_slices = _slices(arrays["seasons"], arrays["season_ptr"])
+        self._final_salary = None
+
+    @classmethod
+    def load(cls, path=CONTRACT_INDEX):
+        with np.load(path) as data:
+            return cls({k: data[k] for k in data.files})
+
+    def _season_slice(self, season):
+        return self._season_slices.get(season, (0, 0))
+
+    def under_contract(self, season):
+        """Rows with a salary in ``season`` (the season's start year), lowest paid first."""
+        lo, hi = self._season_slice(season)
+        return self.sal_rows[lo:hi]
+
+    def salary_band(self, season, low=0.0, high=np.inf):
+        """Rows earning between ``low`` and ``high`` ($M, inclusive) in ``season``."""
+        lo, hi = self._season_slice(season)
+        amounts = self.sal_amount[lo:hi]
+        start = lo + np.searchsorted(amounts, low, "left")
+        stop = lo + np.searchsorted(amounts, high, "right")
+        return self.sal_rows[start:stop]
+
+    def expiring(self, year):
+        """Rows whose contract ends before the ``year`` season (contractEndYear == year)."""
+        spans = [span for span in (self._fa_slices.get(year * 2), self._fa_slices.get(year * 2 + 1)) if span]
+        if not spans:
+            return self.fa_rows[:0]
+        return self.fa_rows[spans[0][0]:spans[-1][1]]
+
+    def free_agent_class(self, year, include_options=True):
+        """(unrestricted rows, option rows) for the ``year`` offseason.
+
+        Option rows are players whose final season, ``year``, is a player,
+        team or early-termination option and who could therefore hit the
+        market a year early.
+        """
+        unrestricted = self.expiring(year)
+        if not include_options:
+            return unrestricted, self.fa_rows[:0]
+        lo, hi = self._fa_slices.get((year + 1) * 2 + 1, (0, 0))
+        return unrestricted, self.fa_rows[lo:hi]
+
+    def salaries_in(self, rows, season):
+        """Each row's salary in ``season``, NaN where it has none."""
+        lo, hi = self._season_slice(season)
+        salary = np.full(len(self.names), np.nan, dtype=self.sal_amount.dtype)
+        salary[self.sal_rows[lo:hi]] = self.sal_amount[lo:hi]
+        return salary[rows]
+
+    def final_salary(self, rows):
+        """Salary in each row's last contract season."""
+        if self._final_salary is None:
+            final = np.zeros(len(self.names), dtype=self.sal_amount.dtype)
+            # Entries are in season order, so a row's last entry is its final season.
+            held, last = np.unique(self.sal_rows[::-1], return_index=True)
+            final[held] = self.sal_amount[::-1][last]
+            self._final_salary = final
+        return self._final_salary[rows]
+
+    def records(self, rows, season=None):
+        rows = np.asarray(rows)
+        salaries = self.salaries_in(rows, season).tolist() if season is not None else None
+        out = []
+        for i, row in enumerate(rows.tolist()):
+            rec = {
+                "name": str(self.names[row]),
+                "teamCode": str(self.teams[row]),
+                "position": str(self.positions[row]),
+                "age": int(self.ages[row]),
+                "capHit": round(float(self.cap_hits[row]), 2),
+                "contractEndYear": int(self.end_year[row]),
+                "optionType": OPTION_TYPES[self.option[row]],
+            }
+            if season is not None:
+                rec["salary"] = None if np.isnan(salaries[i]) else salaries[i]
+            out.append(rec)
+        return out
+
+    def free_agent_rows(self, year, sport="NBA"):
+        """InsertFreeAgent-shaped rows for the ``year`` class, priced off each final salary."""
+        rows, _ = self.free_agent_class(year, include_options=False)
+        result = []
+        for rec, market in zip(self.records(rows), self.final_salary(rows).tolist()):
+            # Seed ages are as of the current season; later classes sign older.
+            age = rec["age"] + max(0, year - 1 - CURRENT_SEASON_START)
+            market = round(market, 1)
+            years = 4 if age <= 27 else 3 if age <= 31 else 2 if age <= 34 else 1
+            result.append({
+                "name": rec["name"],
+                "position": rec["position"],
+                "age": age,
+                "prevTeam": rec["teamCode"],
+                "marketValue": market,
+                "tier": next(tier for tier, floor in TIER_FLOORS if market >= floor),
+                "sport": sport,
+                "projectedYears": years,
+                "projectedTotal": round(market * years, 1),
+            })
+        result.sort(key=lambda r: -r["marketValue"])
+        return result
+
+
+def check_free_agent_rows(index, players):
+    """Compare every class's free_agent_rows with a plain scan of ``players``;
+    returns a list of mismatch descriptions (empty when they agree)."""
+    problems = []
+    for year in sorted({p["contractEndYear"] for p in players if p["contractEndYear"]}):
+        expected = {}
+        for p in players:
+            if p["contractEndYear"] == year:
+                final = p["salaryByYear"][max(p["salaryByYear"], key=int)] if p["salaryByYear"] else 0.0
+                expected[(p["name"], p["teamCode"])] = round(final, 1)
+        actual = {(r["name"], r["prevTeam"]): r["marketValue"] for r in index.free_agent_rows(year)}
+        if actual.keys() != expected.keys():
+            problems.append(f"{year}: {len(actual)} free agents, expected {len(expected)}")
+        problems += [f"{year}: {name} ({team}) marketValue {actual[(name, team)]}, expected {value}"
+                     for (name, team), value in expected.items()
+                     if (name, team) in actual and actual[(name, team)] != value]
+    return problems
+
+
+def cmd_build(args):
+    from pipeline.seed import read_text, seed_players
+
+    with stage("load"):
+        players = seed_players(read_text(args.seed))
+    with stage("build"):
+        arrays = build_index(players)
+    with stage("verify"):
+        problems = check_free_agent_rows(ContractIndex(arrays), players)
+        if problems:
+            raise SystemExit("free-agent rows disagree with the seed:\n  " + "\n  ".join(problems[:20]))
+    with stage("write"):
+        np.savez_compressed(args.index, **arrays)
+    print(f"Indexed {len(players)} contracts ({len(arrays['sal_rows'])} salary-seasons) -> {args.index}")
+
+
+def cmd_query(args):
+    with stage("load"):
+        index = ContractIndex.load(args.index)
+    with stage("query"):
+        start = time.perf_counter()
+        if args.free_agents:
+            rows, option_rows = index.free_agent_class(args.free_agents)
+        else:
+            rows, option_rows = index.salary_band(args.season, args.min, args.max), None
+        elapsed = (time.perf_counter() - start) * 1e6
+
+    if args.free_agents:
+        print(f"{args.free_agents} free agents: {len(rows)} unrestricted, "
+              f"{len(option_rows)} with an option ({elapsed:.1f} us)")
+        for label, group in (("FA", rows), ("OPT", option_rows)):
+            for rec in index.records(group):
+                print(f"  {label:3s} {rec['name']:28s} {rec['teamCode']:5s} {rec['optionType']}")
+    else:
+        print(f"{len(rows)} players earning ${args.min}M-${args.max}M in {args.season} ({elapsed:.1f} us)")
+        for rec in reversed(index.records(rows, args.season)):
+            print(f"  {rec['name']:28s} {rec['teamCode']:5s} ${rec['salary']:.2f}M")
+
+
+def cmd_free_agents(args):
+    with stage("load"):
+        index = ContractIndex.load(args.index)
+    rows = index.free_agent_rows(args.year)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"Wrote {len(rows)} {args.year} free agents -> {args.out}", file=sys.stderr)
+    else:
+        json.dump(rows, sys.stdout, indent=2)
+        print()
@@ -0,0 +1,126 @@
+"""Apply scraped contracts (salaryByYear, contractEndYear, optionType) to the roster seed."""
+
+import json
+
+from pipeline.names import first_last, normalize
+from pipeline.profiling import stage
+from pipeline.seed import ROSTER_ENTRY_RE
+
+
+class ContractMatcher:
+    """Looks up a scraped contract by roster name.
+
+    Exact normalized names and "first last" keys are hashed; the fuzzy
+    fallback (same last name, matching first-name prefix or initials) only
+    scans contracts that share the last name.
+    """
+
+    def __init__(self, contracts):
+        self.players = []
+        for team_code, players in contracts.items():
+            for p in players:
+                p["_bbref_team"] = team_code
+                self.players.append(p)
+
+        self.by_norm = {}
+        self.by_last = {}
+        for p in self.players:
+            norm = normalize(p["name"])
+            if norm not in self.by_norm:
+                self.by_norm[norm] = p
+            fl = first_last(p["name"])
+            if fl:
+                key2 = f"{fl[0]} {fl[1]}"
+                if key2 not in self.by_norm:
+                    self.by_norm[key2] = p
+                self.by_last.setdefault(fl[1], []).append((fl[0], p))
+
+    def find(self, name):
+        c = self.by_norm.get(normalize(name))
+        if c:
+            return c
+        fl = first_last(name)
+        if fl:
+            first, last = fl
+            for cfirst, p in self.by_last.get(last, ()):
+                if cfirst[:3] == first[:3]:
+                    return p
+                if len(first) <= 2 and cfirst.startswith(first):
+                    return p
+        return None
+
+
+def contract_fields(contract, old_cap, old_years, old_age):
+    sby = contract["salary_by_year"]
+
+    cap_hit = sby.get("2025")
+    if not cap_hit or cap_hit == 0:
+        cap_hit = sby.get("2026")
+    if not cap_hit:
+        for y in sorted(sby.keys()):
+            if sby[y] > 0:
+                cap_hit = sby[y]
+                break
+    if not cap_hit:
+        cap_hit = float(old_cap)
+
+    future_salaries = {k: v for k, v in sby.items() if v > 0}
+    return {
+        "capHit": cap_hit,
+        "contractYears": len(future_salaries) if future_salaries else int(old_years),
+        "salaryByYear": future_salaries,
+        "contractEndYear": contract.get("contract_end_year"),
+        "optionType": contract.get("option_type", "none"),
+        "age": contract.get("age") or int(old_age),
+    }
+
+
+def apply_contracts(content, contracts):
+    """Rewrite every matched seed entry with its contract; returns (content, matched, not_found)."""
+    with stage("index"):
+        matcher = ContractMatcher(contracts)
+
+    matched = 0
+    not_found = []
+
+    def replace_entry(m):
+        nonlocal matched
+        team, name, pos, depth, old_age, old_cap, old_years, status = m.groups()
+
+        contract = matcher.find(name)
+        if not contract:
+            not_found.append(f"{name} ({team})")
+            return m.group(0)
+
+        matched += 1
+        c = contract_fields(contract, old_cap, old_years, old_age)
+        salary_json = json.dumps(c["salaryByYear"])
+        return (
+            f'{{ teamCode: "{team}", name: "{name}", position: "{pos}", depthOrder: {depth}, '
+            f'age: {c["age"]}, capHit: {c["capHit"]}, contractYears: {c["contractYears"]}, '
+            f'status: "{status}", sport: "NBA", salaryByYear: {salary_json}, '
+            f'contractEndYear: {c["contractEndYear"]}, optionType: "{c["optionType"]}" }}'
+        )
+
+    with stage("apply"):
+        new_content = ROSTER_ENTRY_RE.sub(replace_entry, content)
+    return new_content, matched, not_found
+
+
+def cmd_apply(args):
+    from pipeline.seed import read_json, read_text, write_seed
+
+    with stage("load"):
+        contracts = read_json(args.contracts)
+        content = read_text(args.seed)
+
+    new_content, matched, not_found = apply_contracts(content, contracts)
+
+    with stage("write"):
+        write_seed(args.seed, new_content)
+
+    print(f"Matched: {matched}, Not matched: {len(not_found)}")
+    if not_found:
+        print(f"\nNot found ({len(not_found)}):")
+        for n in sorted(not_found):
+            print(f"  {n}")
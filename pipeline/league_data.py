@@ -0,0 +1,200 @@
+"""Read-only, memory-mapped league dataset shared by process-pool workers.
+
+``build_dataset`` writes one uncompressed ``.npy`` file per array into a
+directory, plus a ``manifest.json``:
+
+- the contract-index arrays (``contract_index.build_index``), so a
+  ``ContractIndex`` can run straight off the mapped files;
+- ``depth``/``contract_years`` columns and ``team_codes``/``team_ids``;
+- ``salary``: a dense players x ``salary_seasons`` float32 matrix, 0 where
+  a player has no salary that season.
+
+``LeagueDataset.attach`` maps every file with ``mmap_mode="r"``: nothing is
+read until a page is touched, the pages live in the OS page cache and are
+shared by every process that maps them, and the arrays are not writeable.
+A dataset pickles as its build directory path, so handing one to a pool worker
+costs a path, not a copy; ``worker_pool`` attaches it once per worker.
+
+Each build goes into its own ``builds/<id>`` directory under the dataset
+path, and ``current`` is a symlink to the live one, switched with a single
+``os.replace`` once the build is complete. ``attach`` resolves the link
+once and maps every file from that build, checking each array against the
+manifest, so a worker attaching mid-rebuild gets either the old build or
+the new one, never a mix. The last ``KEEP_BUILDS`` superseded builds stay
+on disk so datasets pickled by path before a rebuild still reattach.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from pipeline.contract_index import ContractIndex, build_index
+from pipeline.paths import LEAGUE_DATASET
+
+DATASET_VERSION = 1
+MANIFEST = "manifest.json"
+BUILDS = "builds"
+CURRENT = "current"
+KEEP_BUILDS = 2
+
+
+def build_arrays(players):
+    """Dataset arrays for roster rows (roster_artifact / seed_players shape)."""
+    arrays = build_index(players)
+    seasons = sorted({int(s) for p in players for s in p["salaryByYear"]})
+    column = {season: j for j, season in enumerate(seasons)}
+    salary = np.zeros((len(players), len(seasons)), dtype=np.float32)
+    for i, p in enumerate(players):
+        for season, amount in p["salaryByYear"].items():
+            salary[i, column[int(season)]] = amount
+
+    team_codes, team_ids = np.unique(arrays["teams"], return_inverse=True)
+    arrays.update({
+        "depth": np.array([p["depthOrder"] for p in players], dtype=np.int8),
+        "contract_years": np.array([p["contractYears"] for p in players], dtype=np.int8),
+        "team_codes": team_codes,
+        "team_ids": team_ids.astype(np.int16),
+        "salary_seasons": np.array(seasons, dtype=np.int16),
+        "salary": salary,
+    })
+    return arrays
+
+
+def resolve_build(path):
+    """The build directory ``path`` currently points at (``path`` itself when
+    it is a build directory rather than a dataset root)."""
+    current = os.path.join(path, CURRENT)
+    return os.path.realpath(current) if os.path.lexists(current) else path
+
+
+def write_dataset(path, arrays):
+    """Write a new build under ``path`` and make it current."""
+    os.makedirs(os.path.join(path, BUILDS), exist_ok=True)
+    # mkdtemp keeps two builds started in the same second apart.
+    build = tempfile.mkdtemp(prefix=time.strftime("%Y%m%dT%H%M%S-"), dir=os.path.join(path, BUILDS))
+    build_id = os.path.basename(build)
+    for name, array in arrays.items():
+        with open(os.path.join(build, f"{name}.npy"), "wb") as f:
+            np.save(f, np.ascontiguousarray(array), allow_pickle=False)
+
+    manifest = {
+        "version": DATASET_VERSION,
+        "build": build_id,
+        "players": len(arrays["names"]),
+        "arrays": {name: {"dtype": a.dtype.str, "shape": list(a.shape)} for name, a in arrays.items()},
+    }
+    with open(os.path.join(build, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    link = os.path.join(path, f".{CURRENT}.tmp")
+    if os.path.lexists(link):
+        os.remove(link)
+    os.symlink(os.path.join(BUILDS, build_id), link)
+    os.replace(link, os.path.join(path, CURRENT))
+    _prune_builds(path, build_id)
+    return manifest
+
+
+def _prune_builds(path, current_id):
+    root = os.path.join(path, BUILDS)
+    builds = sorted((b for b in os.listdir(root) if b != current_id),
+                    key=lambda b: os.stat(os.path.join(root, b)).st_mtime_ns)
+    for old in builds[:-KEEP_BUILDS] if KEEP_BUILDS else builds:
+        shutil.rmtree(os.path.join(root, old), ignore_errors=True)
+
+
+class LeagueDataset:
+    def __init__(self, path, manifest, arrays):
+        self.path = path
+        self.manifest = manifest
+        self.arrays = arrays
+        self._season_columns = {int(s): j for j, s in enumerate(arrays["salary_seasons"].tolist())}
+
+    @classmethod
+    def attach(cls, path=LEAGUE_DATASET):
+        """Map the current build under ``path`` (or the build directory ``path``)."""
+        build = resolve_build(path)
+        with open(os.path.join(build, MANIFEST)) as f:
+            manifest = json.load(f)
+        if manifest.get("version") != DATASET_VERSION:
+            raise ValueError(f"{build}: unsupported league dataset version {manifest.get('version')!r}")
+        arrays = {}
+        for name, spec in manifest["arrays"].items():
+            array = np.load(os.path.join(build, f"{name}.npy"), mmap_mode="r", allow_pickle=False)
+            if array.dtype.str != spec["dtype"] or list(array.shape) != spec["shape"]:
+                raise ValueError(f"{build}: {name}.npy is {array.dtype.str}{list(array.shape)}, "
+                                 f"manifest says {spec['dtype']}{spec['shape']}")
+            arrays[name] = array
+        return cls(build, manifest, arrays)
+
+    def __reduce__(self):
+        # self.path is the resolved build, so the unpickled copy maps the same build.
+        return (self.attach, (self.path,))
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["arrays"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __len__(self):
+        return self.manifest["players"]
+
+    def season_salaries(self, season):
+        """Every player's salary in ``season`` (0 when not under contract)."""
+        j = self._season_columns.get(season)
+        return np.zeros(len(self), dtype=np.float32) if j is None else self.arrays["salary"][:, j]
+
+    def team_payrolls(self, season):
+        """{team code: total salary} for ``season``."""
+        totals = np.bincount(self.arrays["team_ids"], weights=self.season_salaries(season),
+                             minlength=len(self.arrays["team_codes"]))
+        return {str(code): round(float(t), 2) for code, t in zip(self.arrays["team_codes"], totals)}
+
+    def contract_index(self):
+        return ContractIndex(self.arrays)
+
+
+_worker_dataset = None
+
+
+def _attach_worker(path):
+    global _worker_dataset
+    _worker_dataset = LeagueDataset.attach(path)
+
+
+def worker_dataset():
+    """The dataset attached by ``worker_pool`` in this worker process."""
+    if _worker_dataset is None:
+        raise RuntimeError("no league dataset attached; create the pool with worker_pool()")
+    return _worker_dataset
+
+
+def worker_pool(path=LEAGUE_DATASET, processes=None):
+    """A spawn pool whose workers each map the dataset once at startup, all
+    from the build that is current when the pool is created."""
+    import multiprocessing
+
+    return multiprocessing.get_context("spawn").Pool(processes, initializer=_attach_worker,
+                                                     initargs=(resolve_build(path),))
+
+
+def cmd_build(args):
+    from pipeline.profiling import stage
+    from pipeline.roster_artifact import read_artifact
+
+    with stage("load"):
+        players = read_artifact(args.artifact)
+    with stage("build"):
+        arrays = build_arrays(players)
+    with stage("write"):
+        manifest = write_dataset(args.out, arrays)
+
+    size = sum(a.nbytes for a in arrays.values())
+    seasons = arrays["salary_seasons"]
+    print(f"Wrote {manifest['players']} players, {len(arrays['team_codes'])} teams and a "
+          f"{seasons[0]}-{seasons[-1]} salary matrix -> {args.out} build {manifest['build']} ({len(arrays)} arrays, {size / 1024:.1f} KB)")
@@ -0,0 +1,266 @@
+"""Monte Carlo mock drafts: landing-spot odds per prospect and slot.
+
+Each simulated draft uses the client's CPU pick rule (MockDraft.tsx
+getCpuPick): a best-available window over the board, 55% board rank and
+45% team need, with needs crossed off as a team fills them. Two sources of
+noise turn that one deterministic draft into a distribution:
+
+- ``board_noise``: each draft re-ranks the board from grade + N(0, sd).
+- ``pick_noise``: each pick adds N(0, sd) to every candidate's score.
+
+A batch of drafts runs in lockstep as numpy arrays (drafts x prospects),
+and batches are spread over a process pool. Every batch seeds its own
+generator from (seed, batch number), so the counts do not depend on the
+worker count.
+"""
+
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from pipeline.api import fetch_json
+from pipeline.paths import DRAFT_ODDS_JSON
+from pipeline.profiling import stage
+
+# Mirrors posNeedMap in client/src/pages/MockDraft.tsx.
+POS_NEED_MAP = {
+    "QB": ["QB"], "RB": ["RB"], "WR": ["WR"], "TE": ["TE"],
+    "OT": ["OT", "OL"], "OL": ["OL", "OT", "G", "C"],
+    "G": ["OL", "G"], "C": ["OL", "C"],
+    "DT": ["DT", "DL"], "DL": ["DL", "DT", "EDGE"],
+    "EDGE": ["EDGE", "DL"], "LB": ["LB"],
+    "CB": ["CB", "DB"], "S": ["S", "DB"], "DB": ["CB", "S", "DB"],
+    "PG": ["PG"], "SG": ["SG"], "SF": ["SF"], "PF": ["PF"],
+}
+NEED_SCORES = (100.0, 80.0, 60.0)
+DEEP_NEED_SCORE = 40.0
+BPA_WEIGHT = 0.55
+NEED_WEIGHT = 0.45
+
+BATCH_SIZE = 500
+MIN_PROBABILITY = 0.01
+TOP_PER_SLOT = 10
+
+
+def load_source(api, input_path, sport, year):
+    if input_path:
+        with open(input_path) as f:
+            data = json.load(f)
+        return data["prospects"], data["teams"], data["draftOrder"]
+    query = f"?sport={sport}&year={year}"
+    return (
+        fetch_json(api, f"/api/prospects{query}"),
+        fetch_json(api, f"/api/teams?sport={sport}"),
+        fetch_json(api, f"/api/draft-order{query}"),
+    )
+
+
+def build_problem(prospects, teams, draft_order):
+    """Dense arrays for the simulator.
+
+    The board keeps the source order (the order the client shows) and is
+    stably re-sorted by grade; needs become a per-team ordered list of
+    token ids plus a prospect x token coverage matrix.
+    """
+    board = sorted(range(len(prospects)), key=lambda i: -prospects[i]["grade"])
+    prospects = [prospects[i] for i in board]
+    slots = sorted(draft_order, key=lambda d: d["pickNumber"])
+
+    tokens = {}
+
+    def token(name):
+        return tokens.setdefault(name, len(tokens))
+
+    team_needs = {}
+    for t in teams:
+        team_needs[t["code"]] = [token(n) for n in (t.get("needs") or [])]
+    covers_lists = [[token(n) for n in POS_NEED_MAP.get(p["position"], [p["position"]])] for p in prospects]
+
+    covers = np.zeros((len(prospects), len(tokens)), dtype=bool)
+    for i, ids in enumerate(covers_lists):
+        covers[i, ids] = True
+
+    team_codes = sorted({s["teamCode"] for s in slots} | set(team_needs))
+    team_ids = {code: i for i, code in enumerate(team_codes)}
+    return {
+        "prospects": prospects,
+        "grades": np.array([p["grade"] for p in prospects], dtype=np.float64),
+        "covers": covers,
+        "slots": slots,
+        "slot_teams": np.array([team_ids[s["teamCode"]] for s in slots], dtype=np.int32),
+        "team_codes": team_codes,
+        "team_needs": [team_needs.get(code, []) for code in team_codes],
+    }
+
+
+def simulate_batch(problem, n_drafts, rng, board_noise=1.5, pick_noise=4.0):
+    """(slot x prospect) pick counts for ``n_drafts`` simulated drafts."""
+    grades = problem["grades"]
+    covers = problem["covers"]
+    n_prospects = len(grades)
+    n_slots = min(len(problem["slots"]), n_prospects)
+    draft_idx = np.arange(n_drafts)
+
+    scores = grades[None, :] + rng.normal(0.0, board_noise, (n_drafts, n_prospects)) if board_noise else \
+        np.broadcast_to(grades, (n_drafts, n_prospects))
+    # Stable sort keeps the source order for equal grades, as the client does.
+    board = np.argsort(-scores, axis=1, kind="stable")
+    # Availability is kept in board order, so a draft's candidates are simply
+    # its first `window` available board positions.
+    on_board = np.ones((n_drafts, n_prospects), dtype=bool)
+    filled = np.zeros((n_drafts, len(problem["team_codes"]), covers.shape[1]), dtype=bool)
+    counts = np.zeros((n_slots, n_prospects), dtype=np.int32)
+    # Columns before `lo` are taken in every draft. A draft's window can't end
+    # past slot + window, since everything before it is either in the window
+    # or already picked.
+    lo = 0
+
+    for slot in range(n_slots):
+        team = problem["slot_teams"][slot]
+        needs = problem["team_needs"][team]
+        n_available = n_prospects - slot
+        window = min(n_available, max(15, math.ceil(n_available * 0.15)))
+
+        if needs:
+            while not on_board[:, lo].any():
+                lo += 1
+            span = on_board[:, lo:min(n_prospects, slot + window)]
+            in_window = span & (np.cumsum(span, axis=1, dtype=np.int16) <= window)
+            cand_pos = lo + np.nonzero(in_window)[1].reshape(n_drafts, window)
+            cand = board[draft_idx[:, None], cand_pos]
+
+            open_needs = ~filled[:, team, needs]
+            # With every need filled, the team goes back to its full list.
+            open_needs[~open_needs.any(axis=1)] = True
+            priority = np.cumsum(open_needs, axis=1) - 1
+            need_value = np.where(priority < len(NEED_SCORES),
+                                  np.take(NEED_SCORES, np.minimum(priority, len(NEED_SCORES) - 1)),
+                                  DEEP_NEED_SCORE) * open_needs
+            # A prospect scores for the first open need it covers; need values
+            # fall with priority, so that is the largest covered value.
+            need_score = (covers[cand][:, :, needs] * need_value[:, None, :]).max(axis=2)
+
+            total = BPA_WEIGHT * (100.0 - np.arange(window) / window * 100.0) + NEED_WEIGHT * need_score
+            if pick_noise:
+                total = total + rng.normal(0.0, pick_noise, total.shape)
+            picked_pos = cand_pos[draft_idx, np.argmax(total, axis=1)]
+        else:
+            # The client takes the top of the board when a team has no needs.
+            picked_pos = np.argmax(on_board, axis=1)
+
+        picked = board[draft_idx, picked_pos]
+        on_board[draft_idx, picked_pos] = False
+        filled[draft_idx, team] |= covers[picked]
+        counts[slot] += np.bincount(picked, minlength=n_prospects).astype(np.int32)
+    return counts
+
+
+def _run_batch(job):
+    problem, n_drafts, seed, batch, board_noise, pick_noise = job
+    rng = np.random.default_rng([seed, batch])
+    return simulate_batch(problem, n_drafts, rng, board_noise, pick_noise)
+
+
+def simulate(problem, n_drafts, seed=0, workers=None, board_noise=1.5, pick_noise=4.0, batch_size=BATCH_SIZE):
+    """Summed pick counts over ``n_drafts`` drafts, split into batches across a process pool."""
+    sizes = [batch_size] * (n_drafts // batch_size)
+    if n_drafts % batch_size:
+        sizes.append(n_drafts % batch_size)
+    jobs = [(problem, size, seed, i, board_noise, pick_noise) for i, size in enumerate(sizes)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        results = map(_run_batch, jobs)
+        return sum(results)
+
+    import multiprocessing
+
+    with multiprocessing.get_context("spawn").Pool(min(workers, len(jobs))) as pool:
+        return sum(pool.imap_unordered(_run_batch, jobs))
+
+
+def odds_tables(problem, counts, n_drafts, min_probability=MIN_PROBABILITY, top_per_slot=TOP_PER_SLOT):
+    """Compact landing-spot tables: per prospect (slot odds, team odds, expected
+    pick) and per slot (most likely picks)."""
+    slots = problem["slots"]
+    probs = counts / n_drafts
+    slot_numbers = np.array([s["pickNumber"] for s in slots[:len(counts)]], dtype=np.float64)
+    drafted = probs.sum(axis=0)
+
+    by_prospect = []
+    for i, p in enumerate(problem["prospects"]):
+        col = probs[:, i]
+        if drafted[i] < min_probability:
+            continue
+        slot_odds = [[int(slot_numbers[s]), round(float(col[s]), 4)]
+                     for s in np.flatnonzero(col >= min_probability)]
+        team_odds = {}
+        for s in np.flatnonzero(col):
+            code = slots[s]["teamCode"]
+            team_odds[code] = team_odds.get(code, 0.0) + float(col[s])
+        by_prospect.append({
+            "id": p.get("id"),
+            "name": p["name"],
+            "position": p["position"],
+            "grade": p["grade"],
+            "drafted": round(float(drafted[i]), 4),
+            "expectedPick": round(float((col * slot_numbers).sum() / drafted[i]), 1),
+            "slots": slot_odds,
+            "teams": {k: round(v, 4) for k, v in sorted(team_odds.items(), key=lambda kv: -kv[1])
+                      if v >= min_probability},
+        })
+    by_prospect.sort(key=lambda r: r["expectedPick"])
+
+    by_slot = []
+    for s, row in enumerate(probs):
+        top = np.argsort(-row, kind="stable")[:top_per_slot]
+        by_slot.append({
+            "pickNumber": slots[s]["pickNumber"],
+            "round": slots[s].get("round", 1),
+            "teamCode": slots[s]["teamCode"],
+            "picks": [[problem["prospects"][i]["name"], round(float(row[i]), 4)] for i in top if row[i] > 0],
+        })
+    return by_prospect, by_slot
+
+
+def cmd_simulate(args):
+    from pipeline.seed import write_json
+
+    with stage("load"):
+        prospects, teams, draft_order = load_source(args.api, args.input, args.sport, args.year)
+    if not prospects or not draft_order:
+        print(f"No {args.sport} prospects or draft order to simulate", file=sys.stderr)
+        sys.exit(1)
+    with stage("build"):
+        problem = build_problem(prospects, teams, draft_order)
+    with stage("simulate"):
+        start = time.perf_counter()
+        counts = simulate(problem, args.drafts, args.seed, args.workers, args.board_noise, args.pick_noise)
+        elapsed = time.perf_counter() - start
+    with stage("aggregate"):
+        by_prospect, by_slot = odds_tables(problem, counts, args.drafts)
+    out = args.out or DRAFT_ODDS_JSON.format(sport=args.sport.lower())
+    with stage("write"):
+        os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+        write_json(out, {
+            "sport": args.sport,
+            "year": args.year,
+            "drafts": args.drafts,
+            "seed": args.seed,
+            "boardNoise": args.board_noise,
+            "pickNoise": args.pick_noise,
+            "generatedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "prospects": by_prospect,
+            "slots": by_slot,
+        })
+
+    print(f"Simulated {args.drafts} {args.sport} drafts of {len(by_slot)} picks in {elapsed:.1f}s "
+          f"({args.drafts / elapsed:.0f} drafts/s) -> {out}")
+    for r in by_prospect[:5]:
+        best = max(r["slots"], key=lambda s: s[1]) if r["slots"] else None
+        print(f"  {r['name']:28s} exp #{r['expectedPick']:<6} most likely #{best[0]} ({best[1]:.0%})" if best else
+              f"  {r['name']:28s} exp #{r['expectedPick']}")
@@ -0,0 +1,40 @@
+"""Player-name normalization used to match names across sources."""
+
+import re
+import unicodedata
+
+SUFFIX_RE = re.compile(r'\s+(jr|sr|ii|iii|iv|v)$')
+
+
+def strip_accents(s):
+    return ''.join(c for c in unicodedata.normalize('NFD', s) if unicodedata.category(c) != 'Mn')
+
+
+def normalize(name):
+    """Lowercase, accent-free, punctuation-free name without generational suffix."""
+    n = strip_accents(name.lower())
+    n = n.replace(".", "").replace("'", "").replace("’", "").replace("-", " ").strip()
+    n = SUFFIX_RE.sub('', n)
+    return n
+
+
+def first_last(name):
+    """Accent-free lowercase (first, last) tokens, or None for single-token names."""
+    parts = name.split()
+    if len(parts) < 2:
+        return None
+    return strip_accents(parts[0]).lower(), strip_accents(parts[-1]).lower()
+
+
+def normalize_to_ascii(name):
+    nfkd = unicodedata.normalize('NFKD', name)
+    ascii_name = ''.join(c for c in nfkd if not unicodedata.combining(c))
+    ascii_name = ascii_name.replace('ё', 'e').replace('Ё', 'E')
+    ascii_name = ascii_name.replace('ø', 'o').replace('Ø', 'O')
+    ascii_name = ascii_name.replace('đ', 'd').replace('Đ', 'D')
+    return ascii_name
+
+
+def name_key(name):
+    """Case/accent/punctuation-insensitive key that keeps suffixes (exact lookups)."""
+    return " ".join(strip_accents(name.lower()).replace(".", "").replace("'", "").split())
@@ -0,0 +1,24 @@
+"""Default locations of the pipeline's intermediate and output files."""
+
+ROSTER_SEED_TS = "server/nbaRosterData2026.ts"
+# Columnar copy of the seed that /api/seed-nba and /api/reseed-nba load.
+ROSTER_ARTIFACT = "server/data/nbaRosters2026.json.gz"
+
+CONTRACTS_JSON = "/tmp/nba_contracts.json"
+FULL_ROSTERS_JSON = "/tmp/nba_full_rosters.json"
+SCRAPED_ROSTERS_JSON = "/tmp/scraped_rosters.json"
+SYNC_RESULTS_JSON = "/tmp/roster-sync-results.json"
+REFRESH_STATE_JSON = "/tmp/nba_refresh_state.json"
+
+PLAYER_INDEX = "/tmp/player_index.npz"
+PROSPECT_COMPS_JSON = "/tmp/prospect_comps.json"
+CONTRACT_INDEX = "/tmp/contract_index.npz"
+# Directory of raw .npy files that pool workers memory-map.
+LEAGUE_DATASET = "/tmp/league_dataset"
+
+# Served by GET /api/draft-odds.
+DRAFT_ODDS_JSON = "server/data/draft-odds-{sport}.json"
+# Served by GET /api/players/search.
+PLAYER_SEARCH_INDEX = "server/data/playerSearch.json.gz"
+
+SYNTHETIC_DIR = "/tmp/synthetic-league"
@@ -0,0 +1,257 @@
+"""Nearest-neighbor player comparison index over per-game stat lines."""
+
+import json
+import sys
+import time
+
+import numpy as np
+
+from pipeline.api import fetch_json
+from pipeline.names import name_key
+from pipeline.paths import PLAYER_INDEX
+from pipeline.profiling import stage
+
+# Per-game fields shared by player_season_stats and college_stats.
+FEATURES = [
+    "minutesPerGame", "pointsPerGame", "reboundsPerGame", "assistsPerGame",
+    "stealsPerGame", "blocksPerGame", "turnoversPerGame",
+    "fgPct", "fg3Pct", "ftPct",
+    "fgaPerGame", "fg3aPerGame", "ftaPerGame",
+    "offRebPerGame", "defRebPerGame",
+]
+
+POOLS = ("nba", "college")
+KDTREE_MIN_POOL = 5000
+
+
+def load_source(api, input_path):
+    if input_path:
+        with open(input_path) as f:
+            data = json.load(f)
+        return data["nbaStats"], data["collegeStats"], data.get("prospects", [])
+    return (
+        fetch_json(api, "/api/nba-stats"),
+        fetch_json(api, "/api/college-stats?sport=NBA"),
+        fetch_json(api, "/api/prospects?sport=NBA"),
+    )
+
+
+def latest_college_lines(college_stats):
+    latest = {}
+    for row in college_stats:
+        key = name_key(row["playerName"])
+        if key not in latest or row["season"] > latest[key]["season"]:
+            latest[key] = row
+    return latest
+
+
+def standardize(matrix):
+    mean = np.nanmean(matrix, axis=0)
+    std = np.nanstd(matrix, axis=0)
+    std[~np.isfinite(std) | (std == 0)] = 1.0
+    mean[~np.isfinite(mean)] = 0.0
+    z = (matrix - mean) / std
+    # Missing stats sit at the pool mean so they neither help nor hurt a comp.
+    z[~np.isfinite(z)] = 0.0
+    return z.astype(np.float32), mean.astype(np.float32), std.astype(np.float32)
+
+
+def stat_matrix(rows):
+    return np.array(
+        [[np.nan if r.get(f) is None else float(r[f]) for f in FEATURES] for r in rows],
+        dtype=np.float64,
+    )
+
+
+def merge_stints(nba_stats):
+    """One line per player: a traded player's per-team rows (player_season_stats
+    is keyed by name and team) become a games-weighted average, listed under
+    the team with the most games."""
+    stints = {}
+    for r in nba_stats:
+        stints.setdefault(name_key(r["name"]), []).append(r)
+
+    merged = []
+    for rows in stints.values():
+        if len(rows) == 1:
+            merged.append(rows[0])
+            continue
+        rows = sorted(rows, key=lambda r: -(r.get("gamesPlayed") or 0))
+        games = [r.get("gamesPlayed") or 0 for r in rows]
+        line = dict(rows[0], gamesPlayed=sum(games))
+        for f in FEATURES:
+            pairs = [(r[f], g) for r, g in zip(rows, games) if r.get(f) is not None and g > 0]
+            total = sum(g for _, g in pairs)
+            line[f] = sum(v * g for v, g in pairs) / total if total else None
+        merged.append(line)
+    return merged
+
+
+def build_index(nba_stats, college_stats, prospects, min_games=10):
+    nba_rows = [r for r in merge_stints(nba_stats) if (r.get("gamesPlayed") or 0) >= min_games]
+    prospect_keys = {name_key(p["name"]) for p in prospects}
+    college_rows = list(latest_college_lines(college_stats).values())
+
+    names, pools, teams, is_prospect, blocks, means, stds = [], [], [], [], [], [], []
+    for pool, rows in (("nba", nba_rows), ("college", college_rows)):
+        if not rows:
+            continue
+        z, mean, std = standardize(stat_matrix(rows))
+        blocks.append(z)
+        means.append(mean)
+        stds.append(std)
+        for r in rows:
+            name = r["name"] if pool == "nba" else r["playerName"]
+            names.append(name)
+            pools.append(pool)
+            teams.append(r["teamCode"] if pool == "nba" else r["college"])
+            is_prospect.append(pool == "college" and name_key(name) in prospect_keys)
+
+    vectors = np.vstack(blocks) if blocks else np.zeros((0, len(FEATURES)), dtype=np.float32)
+    return {
+        "features": np.array(FEATURES),
+        "vectors": vectors,
+        "sq_norms": (vectors.astype(np.float64) ** 2).sum(axis=1),
+        "names": np.array(names),
+        "keys": np.array([name_key(n) for n in names]),
+        "pools": np.array(pools),
+        "teams": np.array(teams),
+        "is_prospect": np.array(is_prospect, dtype=bool),
+        "pool_means": np.array(means),
+        "pool_stds": np.array(stds),
+        "built_at": np.array(time.time()),
+    }
+
+
+class PlayerIndex:
+    def __init__(self, arrays):
+        self.vectors = arrays["vectors"]
+        self.sq_norms = arrays["sq_norms"]
+        self.names = arrays["names"]
+        self.keys = arrays["keys"]
+        self.pools = arrays["pools"]
+        self.teams = arrays["teams"]
+        self.is_prospect = arrays["is_prospect"]
+        self.row_by_key = {}
+        for i, (key, pool) in enumerate(zip(self.keys.tolist(), self.pools.tolist())):
+            self.row_by_key.setdefault((pool, key), i)
+        self.pool_rows = {pool: np.flatnonzero(self.pools == pool) for pool in POOLS}
+        self._trees = {}
+
+    @classmethod
+    def load(cls, path=PLAYER_INDEX):
+        with np.load(path) as data:
+            return cls({k: data[k] for k in data.files})
+
+    def find(self, name, pool=None):
+        key = name_key(name)
+        for p in ([pool] if pool else ("college", "nba")):
+            row = self.row_by_key.get((p, key))
+            if row is not None:
+                return row
+        return None
+
+    def _tree(self, pool):
+        if pool not in self._trees:
+            try:
+                from scipy.spatial import cKDTree
+            except ImportError:
+                self._trees[pool] = None
+            else:
+                self._trees[pool] = cKDTree(self.vectors[self.pool_rows[pool]])
+        return self._trees[pool]
+
+    def top_k_rows(self, query_rows, pool="nba", k=10):
+        """Exact Euclidean top-k for many query rows at once.
+
+        Returns (neighbor_rows, distances), each shaped (len(query_rows), k).
+        Large pools go through a KD-tree when scipy is installed; otherwise the
+        distance matrix is computed in one batch as |q|^2 + |x|^2 - 2 q.x.
+        """
+        query_rows = np.asarray(query_rows, dtype=np.int64)
+        candidates = self.pool_rows[pool]
+        k = min(k, len(candidates))
+        if k == 0 or len(query_rows) == 0:
+            empty = np.zeros((len(query_rows), 0))
+            return empty.astype(np.int64), empty
+
+        queries = self.vectors[query_rows]
+        if len(candidates) >= KDTREE_MIN_POOL and self._tree(pool) is not None:
+            kk = min(k + 1, len(candidates))
+            dist, idx = self._tree(pool).query(queries, k=kk)
+            rows = candidates[np.asarray(idx).reshape(len(query_rows), kk)]
+            dist = np.asarray(dist, dtype=np.float64).reshape(len(query_rows), kk)
+            dist[rows == query_rows[:, None]] = np.inf
+            order = np.argsort(dist, axis=1, kind="stable")[:, :k]
+            return np.take_along_axis(rows, order, axis=1), np.take_along_axis(dist, order, axis=1)
+
+        d2 = (
+            self.sq_norms[query_rows][:, None]
+            + self.sq_norms[candidates][None, :]
+            - 2.0 * (queries.astype(np.float64) @ self.vectors[candidates].astype(np.float64).T)
+        )
+        np.maximum(d2, 0.0, out=d2)
+        # A player is never their own comp.
+        d2[query_rows[:, None] == candidates[None, :]] = np.inf
+        part = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        part_d = np.take_along_axis(d2, part, axis=1)
+        order = np.argsort(part_d, axis=1)
+        idx = np.take_along_axis(part, order, axis=1)
+        return candidates[idx], np.sqrt(np.take_along_axis(part_d, order, axis=1))
+
+    def similar(self, name, pool="nba", k=10):
+        row = self.find(name)
+        if row is None:
+            return None
+        rows, dists = self.top_k_rows([row], pool, k)
+        return [self._describe(r, d) for r, d in zip(rows[0].tolist(), dists[0].tolist()) if np.isfinite(d)]
+
+    def prospect_comps(self, k=5):
+        rows = np.flatnonzero(self.is_prospect)
+        neighbors, dists = self.top_k_rows(rows, "nba", k)
+        comps = {}
+        for row, nrow, ndist in zip(rows.tolist(), neighbors.tolist(), dists.tolist()):
+            comps[str(self.names[row])] = [self._describe(r, d) for r, d in zip(nrow, ndist)]
+        return comps
+
+    def _describe(self, row, dist):
+        return {
+            "name": str(self.names[row]),
+            "team": str(self.teams[row]),
+            "pool": str(self.pools[row]),
+            "distance": round(float(dist), 4),
+            "similarity": round(1.0 / (1.0 + float(dist)), 4),
+        }
+
+
+def cmd_build(args):
+    with stage("load"):
+        nba_stats, college_stats, prospects = load_source(args.api, args.input)
+    with stage("build"):
+        arrays = build_index(nba_stats, college_stats, prospects, args.min_games)
+    with stage("write"):
+        np.savez_compressed(args.index, **arrays)
+    with stage("comps"):
+        comps = PlayerIndex(arrays).prospect_comps(args.k)
+        with open(args.comps, "w") as f:
+            json.dump(comps, f, indent=2)
+
+    counts = {pool: int((arrays["pools"] == pool).sum()) for pool in POOLS}
+    print(f"Indexed {counts['nba']} NBA players and {counts['college']} college lines "
+          f"({int(arrays['is_prospect'].sum())} prospects) -> {args.index}")
+    print(f"Wrote top-{args.k} NBA comps for {len(comps)} prospects -> {args.comps}")
+
+
+def cmd_query(args):
+    with stage("load"):
+        index = PlayerIndex.load(args.index)
+    with stage("query"):
+        start = time.perf_counter()
+        results = index.similar(args.name, args.pool, args.k)
+        elapsed = (time.perf_counter() - start) * 1000
+    if results is None:
+        print(f"No stat line indexed for {args.name}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Top {len(results)} {args.pool.upper()} comps for {args.name} ({elapsed:.2f} ms):")
+    for r in results:
+        print(f"  {r['name']:28s} {r['team']:22s} sim={r['similarity']:.3f}")
@@ -0,0 +1,166 @@
+"""Opt-in per-stage profiling for pipeline commands (``--profile``)."""
+
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+DEFAULT_PROFILE_DIR = "/tmp/pipeline-profiles"
+SAMPLE_INTERVAL = 0.001
+MODES = ("both", "cprofile", "sample")
+
+
+class StackSampler:
+    """Samples the calling thread's stack on a background thread.
+
+    Stacks are accumulated in collapsed form ("root;child;leaf count"), which
+    flamegraph.pl, speedscope and inferno all read directly.
+    """
+
+    def __init__(self, root, interval=SAMPLE_INTERVAL):
+        import threading
+
+        self.root = root
+        self.interval = interval
+        self.counts = Counter()
+        self._target = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                if code.co_filename == __file__:
+                    # entering/leaving a stage; not part of the profiled work
+                    break
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if frame is not None:
+                continue
+            stack.append(self.root)
+            self.counts[";".join(reversed(stack))] += 1
+
+
+class PipelineProfiler:
+    """Per-stage profiler for the pipeline commands.
+
+    A stage may be entered many times (e.g. "fetch" once per team); its
+    profile data accumulates and is written once by finish().
+    """
+
+    def __init__(self, script, out_dir=None, mode="both"):
+        self.script = script
+        self.out_dir = out_dir
+        self.mode = mode
+        self.stages = {}
+
+    @property
+    def enabled(self):
+        return self.out_dir is not None
+
+    @contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        import cProfile
+
+        state = self.stages.get(name)
+        if state is None:
+            state = {
+                "profiler": cProfile.Profile() if self.mode in ("both", "cprofile") else None,
+                "collapsed": Counter(),
+                "calls": 0,
+                "elapsed": 0.0,
+            }
+            self.stages[name] = state
+        profiler = state["profiler"]
+        sampler = StackSampler(f"{self.script}:{name}") if self.mode in ("both", "sample") else None
+
+        start = time.perf_counter()
+        if sampler:
+            sampler.start()
+        if profiler:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler:
+                profiler.disable()
+            if sampler:
+                sampler.stop()
+                state["collapsed"].update(sampler.counts)
+            state["elapsed"] += time.perf_counter() - start
+            state["calls"] += 1
+
+    def finish(self):
+        if not self.enabled:
+            return
+        import io
+        import pstats
+
+        os.makedirs(self.out_dir, exist_ok=True)
+        combined = Counter()
+        for name, state in self.stages.items():
+            base = os.path.join(self.out_dir, f"{self.script}.{name}")
+            profiler = state["profiler"]
+            if profiler:
+                profiler.dump_stats(f"{base}.prof")
+                buf = io.StringIO()
+                pstats.Stats(profiler, stream=buf).sort_stats("cumulative").print_stats(40)
+                with open(f"{base}.txt", "w") as f:
+                    f.write(buf.getvalue())
+            if state["collapsed"]:
+                write_collapsed(f"{base}.collapsed", state["collapsed"])
+                combined.update(state["collapsed"])
+
+        if combined:
+            write_collapsed(os.path.join(self.out_dir, f"{self.script}.collapsed"), combined)
+        with open(os.path.join(self.out_dir, f"{self.script}.timings.tsv"), "w") as f:
+            f.write("stage\tcalls\tseconds\n")
+            for name, state in self.stages.items():
+                f.write(f"{name}\t{state['calls']}\t{state['elapsed']:.6f}\n")
+
+        print(f"\n=== PROFILE ({self.script}, mode={self.mode}) -> {self.out_dir} ===", file=sys.stderr)
+        for name, state in self.stages.items():
+            print(f"  {name:16s} x{state['calls']:<4d} {state['elapsed'] * 1000:10.1f} ms", file=sys.stderr)
+
+
+def write_collapsed(path, counts):
+    with open(path, "w") as f:
+        for stack, count in sorted(counts.items()):
+            f.write(f"{stack} {count}\n")
+
+
+_active = PipelineProfiler(None)
+
+
+def activate(script, out_dir=DEFAULT_PROFILE_DIR, mode="both"):
+    global _active
+    if mode not in MODES:
+        raise ValueError(f"profile mode must be one of {', '.join(MODES)}")
+    _active = PipelineProfiler(script, out_dir, mode)
+    return _active
+
+
+def stage(name):
+    """Profile a block as the named stage of the active profiler (a no-op when profiling is off)."""
+    return _active.stage(name)
+
+
+def finish():
+    _active.finish()
@@ -0,0 +1,115 @@
+"""Gzip'd columnar JSON copy of the roster seed, loaded by server/rosterArtifact.ts.
+
+Layout (``version`` 1)::
+
+    {"version": 1, "sport": "NBA", "count": N,
+     "dictionaries": {"teamCode": [...], "position": [...], ...},
+     "columns": {"teamCode": [0, 0, 1, ...], "name": [...], ...,
+                 "salaryStart": [2025, ...], "salaries": [[30.67], ...]}}
+
+Low-cardinality columns hold indexes into ``dictionaries``. ``salaryByYear``
+is stored as a first season plus the amounts for consecutive seasons, with a
+null start for players without a salary schedule. The gzip header carries
+no timestamp, so rebuilding from the same seed gives the same bytes.
+"""
+
+import gzip
+import json
+import os
+
+from pipeline.paths import ROSTER_ARTIFACT, ROSTER_SEED_TS
+
+ARTIFACT_VERSION = 1
+
+DICTIONARY_COLUMNS = ("teamCode", "position", "status", "optionType")
+PLAIN_COLUMNS = ("name", "depthOrder", "age", "capHit", "contractYears", "contractEndYear")
+
+
+def artifact_path(seed_path):
+    """Where the artifact for ``seed_path`` goes: next to the seed, or the
+    served location for the default seed."""
+    if os.path.normpath(seed_path) == os.path.normpath(ROSTER_SEED_TS):
+        return ROSTER_ARTIFACT
+    return os.path.splitext(seed_path)[0] + ".json.gz"
+
+
+def _salary_run(salary_by_year):
+    if not salary_by_year:
+        return None, []
+    seasons = sorted(int(s) for s in salary_by_year)
+    if seasons != list(range(seasons[0], seasons[0] + len(seasons))):
+        raise ValueError(f"salaryByYear seasons are not consecutive: {seasons}")
+    return seasons[0], [salary_by_year[str(s)] for s in seasons]
+
+
+def encode(players, sport="NBA"):
+    """Artifact dict for seed_players()-style rows."""
+    dictionaries = {}
+    columns = {}
+    for key in DICTIONARY_COLUMNS:
+        values = sorted({p[key] for p in players})
+        ids = {v: i for i, v in enumerate(values)}
+        dictionaries[key] = values
+        columns[key] = [ids[p[key]] for p in players]
+    for key in PLAIN_COLUMNS:
+        columns[key] = [p[key] for p in players]
+
+    runs = [_salary_run(p["salaryByYear"]) for p in players]
+    columns["salaryStart"] = [start for start, _ in runs]
+    columns["salaries"] = [amounts for _, amounts in runs]
+    return {
+        "version": ARTIFACT_VERSION,
+        "sport": sport,
+        "count": len(players),
+        "dictionaries": dictionaries,
+        "columns": columns,
+    }
+
+
+def decode(artifact):
+    """Rows back out of an artifact dict (the inverse of ``encode``)."""
+    if artifact.get("version") != ARTIFACT_VERSION:
+        raise ValueError(f"unsupported roster artifact version {artifact.get('version')!r}")
+    dictionaries = artifact["dictionaries"]
+    columns = artifact["columns"]
+    players = []
+    for i in range(artifact["count"]):
+        row = {key: dictionaries[key][columns[key][i]] for key in DICTIONARY_COLUMNS}
+        row.update({key: columns[key][i] for key in PLAIN_COLUMNS})
+        start = columns["salaryStart"][i]
+        row["salaryByYear"] = {} if start is None else \
+            {str(start + j): amount for j, amount in enumerate(columns["salaries"][i])}
+        players.append(row)
+    return players
+
+
+def write_artifact(path, players, sport="NBA"):
+    data = json.dumps(encode(players, sport), separators=(",", ":")).encode()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    return len(data)
+
+
+def read_artifact(path):
+    with open(path, "rb") as f:
+        return decode(json.loads(gzip.decompress(f.read())))
+
+
+def cmd_build(args):
+    from pipeline.profiling import stage
+    from pipeline.seed import read_text, seed_players
+
+    with stage("load"):
+        content = read_text(args.seed)
+        players = seed_players(content)
+    out = args.out or artifact_path(args.seed)
+    with stage("write"):
+        raw_size = write_artifact(out, players)
+    with stage("verify"):
+        if read_artifact(out) != players:
+            raise SystemExit(f"{out} does not round-trip the seed")
+
+    print(f"Wrote {len(players)} players -> {out} "
+          f"({os.path.getsize(out) / 1024:.1f} KB gzip, {raw_size / 1024:.1f} KB JSON, "
+          f"seed {len(content.encode()) / 1024:.1f} KB)")
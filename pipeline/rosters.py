@@ -0,0 +1,242 @@
+"""Cross-check roster seed team assignments against a scraped player -> team map."""
+
+from pipeline.names import first_last, normalize, strip_accents
+from pipeline.profiling import stage
+
+# Seed spellings that differ from Basketball Reference's.
+NAME_NORMALIZATIONS = {
+    "nic claxton": "nicolas claxton",
+    "cam thomas": "cameron thomas",
+    "cam johnson": "cameron johnson",
+    "pj tucker": "p.j. tucker",
+    "kj martin": "kenyon martin jr.",
+    "larry nance jr": "larry nance jr.",
+    "gary trent jr": "gary trent jr.",
+    "wendell carter jr": "wendell carter jr.",
+    "kelly oubre jr": "kelly oubre jr.",
+    "jaren jackson jr": "jaren jackson jr.",
+    "marcus morris sr": "marcus morris sr.",
+    "gary payton ii": "gary payton ii",
+    "tim hardaway jr": "tim hardaway jr.",
+    "dereck lively ii": "dereck lively ii",
+    "jabari smith jr": "jabari smith jr.",
+    "kenrich williams": "kenrich williams",
+}
+
+# Seed players the first matching pass could not place; re-checked by fix-remaining.
+REMAINING_PLAYERS = [
+    ("ATL", "Dejounte Murray"), ("ATL", "Bogdan Bogdanovic"),
+    ("BOS", "Jayson Tatum"), ("BOS", "Nikola Vucevic"),
+    ("BOS", "Jaden Springer"), ("BOS", "Xavier Tillman"),
+    ("BKN", "Ben Simmons"), ("BKN", "Dennis Schroder"),
+    ("BKN", "Keon Johnson"), ("BKN", "Dariq Whitehead"),
+    ("CHA", "Tidjane Salaun"), ("CHA", "Vasilije Micic"), ("CHA", "JT Thor"),
+    ("CHI", "Torrey Craig"),
+    ("CLE", "Max Strus"), ("CLE", "Tristan Thompson"),
+    ("DAL", "Kyrie Irving"),
+    ("DEN", "Nikola Jokic"), ("DEN", "Reggie Jackson"),
+    ("DET", "Alec Burks"), ("DET", "Dario Saric"),
+    ("GSW", "Kristaps Porzingis"),
+    ("HOU", "Alperen Sengun"), ("HOU", "Fred VanVleet"),
+    ("IND", "Tyrese Haliburton"),
+    ("LAC", "PJ Tucker"), ("LAC", "Brandon Boston Jr"),
+    ("LAL", "Luka Doncic"), ("LAL", "Christian Wood"),
+    ("LAL", "Cam Reddish"), ("LAL", "Jalen Hood-Schifino"), ("LAL", "Maxwell Lewis"),
+    ("MEM", "GG Jackson"), ("MEM", "Kenneth Lofton Jr"), ("MEM", "Georges Niang"),
+    ("MIA", "Terry Rozier"), ("MIA", "Nikola Jovic"),
+    ("MIA", "Josh Richardson"), ("MIA", "Haywood Highsmith"),
+    ("MIL", "Damian Lillard"), ("MIL", "Malik Beasley"), ("MIL", "Robin Lopez"),
+    ("NOP", "Dereon Seabron"), ("NOP", "Karlo Matkovic"),
+    ("NYK", "Keita Bates-Diop"),
+    ("OKC", "Lu Dort"), ("OKC", "Nikola Topic"),
+    ("PHI", "Robert Covington"), ("PHI", "KJ Martin"), ("PHI", "Jeff Dowtin Jr"), ("PHI", "Ricky Council IV"),
+    ("PHX", "Jusuf Nurkic"), ("PHX", "Nassir Little"), ("PHX", "Bol Bol"), ("PHX", "TyTy Washington"),
+    ("POR", "Robert Williams III"), ("POR", "Malcolm Brogdon"),
+    ("SAC", "Chris Duarte"), ("SAC", "Alex Len"), ("SAC", "Trey Lyles"), ("SAC", "Mason Jones"),
+    ("WAS", "Johnny Davis"), ("WAS", "Jonas Valanciunas"), ("WAS", "Dante Exum"),
+    ("IND", "TJ McConnell"), ("LAC", "Derrick Jones Jr"),
+    ("MIA", "Jaime Jaquez Jr"), ("MIL", "AJ Green"), ("MIL", "Andre Jackson Jr"),
+    ("MIN", "Terrence Shannon Jr"), ("NOP", "Herb Jones"),
+    ("CLE", "Craig Porter Jr"), ("MEM", "Scotty Pippen Jr"),
+    ("CHI", "Rob Dillingham"),
+]
+
+
+def _punct_key(name):
+    return name.replace(".", "").replace("'", "").replace("’", "").lower().strip()
+
+
+class ScrapedLookup:
+    """Index over a scraped {lowercase name: {name, team}} map."""
+
+    def __init__(self, scraped):
+        self.scraped = scraped
+        self.by_punct = {}
+        self.by_norm = {}
+        for key, val in scraped.items():
+            self.by_punct[_punct_key(key)] = val
+            parts = key.split()
+            if len(parts) >= 2:
+                self.by_punct[f"{parts[0]} {parts[-1]}".lower()] = val
+
+            self.by_norm[normalize(val["name"])] = val
+            fl = first_last(val["name"])
+            if fl:
+                self.by_norm[f"{fl[0]} {fl[1]}"] = val
+
+    def exact(self, name):
+        """Case-insensitive lookup with the curated spelling fixes, then first/last token match."""
+        key = name.lower()
+        player = self.scraped.get(NAME_NORMALIZATIONS.get(key, key)) or self.scraped.get(key)
+        if player:
+            return player
+        for scraped_key, scraped_player in self.scraped.items():
+            if key.split()[-1] == scraped_key.split()[-1] and key.split()[0] == scraped_key.split()[0]:
+                return scraped_player
+        return None
+
+    def loose(self, name):
+        """Punctuation-insensitive lookup, then last name + first-name prefix."""
+        key = name.lower()
+        if key in self.scraped:
+            return self.scraped[key]
+        norm = _punct_key(key)
+        if norm in self.by_punct:
+            return self.by_punct[norm]
+        parts = name.split()
+        if len(parts) >= 2:
+            short = f"{parts[0]} {parts[-1]}".lower()
+            if short in self.by_punct:
+                return self.by_punct[short]
+        for sval in self.scraped.values():
+            sname = sval["name"]
+            if parts[-1].lower() == sname.split()[-1].lower():
+                if parts[0].lower()[:3] == sname.split()[0].lower()[:3]:
+                    return sval
+        return None
+
+    def accent_insensitive(self, name):
+        """Accent/suffix-insensitive lookup, then last name + prefix or initials."""
+        player = self.by_norm.get(normalize(name))
+        if player:
+            return player
+        first, last = _edge_tokens(name)
+        for sval in self.scraped.values():
+            sfirst, slast = _edge_tokens(sval["name"])
+            if slast == last and sfirst[:3] == first[:3]:
+                return sval
+            if len(first) <= 3 and slast == last and sfirst.startswith(first):
+                return sval
+        return None
+
+
+def _edge_tokens(name):
+    parts = name.split()
+    if not parts:
+        return "", ""
+    return strip_accents(parts[0]).lower(), strip_accents(parts[-1]).lower()
+
+
+def check_teams(entries, find):
+    """Split (team, name) entries into matched count, team updates and not-found names."""
+    updates = []
+    matched = 0
+    not_found = []
+    for team_code, name in entries:
+        player = find(name)
+        if not player:
+            not_found.append(f"{name} ({team_code})")
+        elif player["team"] != team_code:
+            updates.append({
+                "name": name,
+                "oldTeam": team_code,
+                "newTeam": player["team"],
+                "scrapedName": player["name"],
+            })
+        else:
+            matched += 1
+    return matched, updates, not_found
+
+
+def _load(args):
+    from pipeline.seed import read_json, read_text
+
+    with stage("load"):
+        return read_json(args.scraped), read_text(args.seed)
+
+
+def cmd_compare(args):
+    from pipeline.seed import roster_entries, write_json
+
+    scraped, content = _load(args)
+    entries = roster_entries(content)
+    with stage("match"):
+        matched, updates, not_found = check_teams(entries, ScrapedLookup(scraped).exact)
+
+    print(f"Total roster players: {len(entries)}")
+    print(f"Matched (correct team): {matched}")
+    print(f"Need team update: {len(updates)}")
+    print(f"Not found in scrape: {len(not_found)}")
+
+    if updates:
+        print("\n=== TEAM CHANGES NEEDED ===")
+        for u in updates:
+            print(f"  {u['name']}: {u['oldTeam']} -> {u['newTeam']}")
+
+    if not_found:
+        print(f"\n=== NOT FOUND ({len(not_found)}) ===")
+        for n in not_found:
+            print(f"  {n}")
+
+    with stage("write"):
+        write_json(args.out, {"updates": updates, "not_found": not_found, "matched": matched})
+    print(f"\nResults saved to {args.out}")
+
+
+def cmd_apply_updates(args):
+    from pipeline.seed import move_players, roster_entries, write_seed
+
+    scraped, content = _load(args)
+    entries = roster_entries(content)
+    with stage("match"):
+        matched, updates, not_found = check_teams(entries, ScrapedLookup(scraped).loose)
+
+    print(f"Total: {len(entries)}, Matched: {matched}, Updates: {len(updates)}, Not found: {len(not_found)}")
+
+    if updates:
+        print(f"\n=== APPLYING {len(updates)} TEAM CHANGES ===")
+        with stage("apply"):
+            write_seed(args.seed, move_players(content, updates))
+        print("\nSeed file updated!")
+
+    if not_found:
+        print(f"\n=== NOT FOUND ({len(not_found)}) ===")
+        for n in not_found:
+            print(f"  {n}")
+
+    print("\nDone!")
+
+
+def cmd_fix_remaining(args):
+    from pipeline.seed import move_players, write_seed
+
+    scraped, content = _load(args)
+    lookup = ScrapedLookup(scraped)
+    with stage("match"):
+        matched, updates, still_not_found = check_teams(REMAINING_PLAYERS, lookup.accent_insensitive)
+
+    for u in updates:
+        print(f"  UPDATE: {u['name']} ({u['oldTeam']}) -> {u['newTeam']} [matched: {u['scrapedName']}]")
+    for n in still_not_found:
+        print(f"  NOT FOUND: {n}")
+    print(f"  OK: {matched} already on the scraped team")
+
+    if updates:
+        print(f"\nApplying {len(updates)} additional updates...")
+        with stage("apply"):
+            write_seed(args.seed, move_players(content, updates))
+        print("Seed file updated!")
+
+    print(f"\nStill not found: {len(still_not_found)}")
+    for n in still_not_found:
+        print(f"  {n}")
@@ -0,0 +1,177 @@
+"""Player-name typeahead index served by GET /api/players/search.
+
+Covers ``roster_players``, ``prospects`` and ``free_agents`` for every
+sport in one gzip'd JSON artifact (``version`` 1)::
+
+    {"version": 1, "count": N,
+     "dictionaries": {"kind": [...], "sport": [...], "team": [...], "position": [...]},
+     "columns": {"id": [...], "name": [...], "kind": [0, 2, ...], ...},
+     "names": {"keys": ["aaron gordon", ...], "entries": [17, ...]},
+     "tokens": {"keys": ["gordon", ...], "entries": [17, ...]},
+     "grams": {" aa": [17, 230], ...}}
+
+``names`` holds every entry's full search key (plus its alias keys) and
+``tokens`` the same keys from their second word on, each as a sorted key
+list with a parallel entry list, so a prefix query is a binary search and
+a short walk. ``grams`` maps the trigrams of the full keys to ascending
+entry lists for the misspelling fallback.
+
+Search keys are ``search_key`` names: ASCII-folded, lowercase, without
+periods or apostrophes, hyphens as spaces. A name with a generational
+suffix is indexed with and without it. server/playerSearch.ts folds the
+query the same way.
+"""
+
+import gzip
+import json
+import os
+
+from pipeline.api import fetch_json
+from pipeline.names import SUFFIX_RE, normalize_to_ascii, strip_accents
+
+INDEX_VERSION = 1
+GRAM = 3
+
+KINDS = ("roster", "freeAgent", "prospect")
+DICTIONARY_COLUMNS = ("kind", "sport", "team", "position")
+
+# Other names a player is commonly searched by, keyed by the name the app
+# stores. Keys are compared as suffix-free search keys, so "Robert Williams"
+# also covers a stored "Robert Williams III".
+ALIASES = {
+    "Luguentz Dort": ["Lu Dort"],
+    "Herbert Jones": ["Herb Jones"],
+    "Cameron Johnson": ["Cam Johnson"],
+    "Cam Thomas": ["Cameron Thomas"],
+    "Nic Claxton": ["Nicolas Claxton"],
+    "Alex Sarr": ["Alexandre Sarr"],
+    "Moritz Wagner": ["Moe Wagner"],
+    "Bub Carrington": ["Carlton Carrington"],
+    "Robert Williams": ["Rob Williams", "Robert Williams III"],
+    "Shai Gilgeous-Alexander": ["SGA"],
+    "Karl-Anthony Towns": ["KAT"],
+    "Michael Porter Jr.": ["MPJ"],
+    "Olivier-Maxence Prosper": ["OMP"],
+}
+
+
+def search_key(name):
+    n = strip_accents(normalize_to_ascii(name)).lower()
+    n = n.replace(".", "").replace("'", "").replace("’", "").replace("-", " ")
+    return " ".join(n.split())
+
+
+def key_variants(name):
+    key = search_key(name)
+    bare = SUFFIX_RE.sub("", key)
+    return [key] if bare == key else [key, bare]
+
+
+def trigrams(key):
+    padded = f" {key}"
+    return {padded[i:i + GRAM] for i in range(len(padded) - GRAM + 1)}
+
+
+def load_source(api, input_path, sports):
+    """[(kind, row)] for every roster player, free agent and prospect."""
+    if input_path:
+        with open(input_path) as f:
+            data = json.load(f)
+        tables = {"roster": data["roster"], "freeAgent": data["freeAgents"], "prospect": data["prospects"]}
+        # Every row the API serves carries its sport; a dump row without one
+        # can't be filtered or labelled, so refuse it rather than guess.
+        missing = [row["name"] for kind in KINDS for row in tables[kind] if not row.get("sport")]
+        if missing:
+            raise SystemExit(f"{input_path}: no sport on {len(missing)} row(s), first {missing[0]!r}")
+        tables = {kind: [row for row in rows if row["sport"] in sports] for kind, rows in tables.items()}
+    else:
+        tables = {kind: [] for kind in KINDS}
+        for sport in sports:
+            tables["roster"] += fetch_json(api, f"/api/roster?sport={sport}")
+            tables["freeAgent"] += fetch_json(api, f"/api/free-agents?sport={sport}")
+            tables["prospect"] += fetch_json(api, f"/api/prospects?sport={sport}")
+    return [(kind, row) for kind in KINDS for row in tables[kind]]
+
+
+def entry_row(kind, row):
+    team = {"roster": row.get("teamCode"), "freeAgent": row.get("prevTeam"), "prospect": row.get("college")}[kind]
+    return {
+        "id": row.get("id"),
+        "name": row["name"],
+        "kind": kind,
+        "sport": row["sport"],
+        "team": team or "",
+        "position": row.get("position") or "",
+    }
+
+
+def build_index(rows, aliases=ALIASES):
+    """Index dict for [(kind, row)] pairs."""
+    alias_keys = {key_variants(name)[-1]: names for name, names in aliases.items()}
+    entries = [entry_row(kind, row) for kind, row in rows]
+
+    names, tokens, grams = [], [], {}
+    for i, entry in enumerate(entries):
+        keys = key_variants(entry["name"])
+        for alias in alias_keys.get(keys[-1], []):
+            keys += [k for k in key_variants(alias) if k not in keys]
+        for key in keys:
+            names.append((key, i))
+            words = key.split(" ")
+            for start in range(1, len(words)):
+                tokens.append((" ".join(words[start:]), i))
+            for gram in trigrams(key):
+                grams.setdefault(gram, set()).add(i)
+
+    dictionaries = {}
+    columns = {}
+    for key in DICTIONARY_COLUMNS:
+        values = sorted({e[key] for e in entries})
+        ids = {v: j for j, v in enumerate(values)}
+        dictionaries[key] = values
+        columns[key] = [ids[e[key]] for e in entries]
+    columns["id"] = [e["id"] for e in entries]
+    columns["name"] = [e["name"] for e in entries]
+
+    def postings(pairs):
+        pairs = sorted(set(pairs))
+        return {"keys": [k for k, _ in pairs], "entries": [i for _, i in pairs]}
+
+    return {
+        "version": INDEX_VERSION,
+        "count": len(entries),
+        "dictionaries": dictionaries,
+        "columns": columns,
+        "names": postings(names),
+        "tokens": postings(tokens),
+        "grams": {gram: sorted(ids) for gram, ids in sorted(grams.items())},
+    }
+
+
+def write_index(path, index):
+    data = json.dumps(index, separators=(",", ":"), ensure_ascii=False).encode()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    # The server re-reads the file when its mtime changes; never let it see half of one.
+    os.replace(tmp, path)
+    return len(data)
+
+
+def cmd_build(args):
+    from pipeline.profiling import stage
+
+    with stage("load"):
+        rows = load_source(args.api, args.input, args.sports or ["NBA", "NFL"])
+    with stage("build"):
+        index = build_index(rows)
+    with stage("write"):
+        raw_size = write_index(args.out, index)
+
+    kinds = index["dictionaries"]["kind"]
+    counts = {kind: index["columns"]["kind"].count(j) for j, kind in enumerate(kinds)}
+    print(f"Indexed {index['count']} players ({', '.join(f'{n} {k}' for k, n in counts.items())}): "
+          f"{len(index['names']['keys'])} name keys, {len(index['tokens']['keys'])} token keys, "
+          f"{len(index['grams'])} trigrams -> {args.out} "
+          f"({os.path.getsize(args.out) / 1024:.1f} KB gzip, {raw_size / 1024:.1f} KB JSON)")
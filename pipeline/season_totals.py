@@ -0,0 +1,54 @@
+"""Player -> team map from Basketball Reference season totals (basketball_reference_web_scraper)."""
+
+import json
+import sys
+
+from pipeline.profiling import stage
+
+TEAM_ENUM_ABBREVS = {
+    "ATLANTA_HAWKS": "ATL", "BOSTON_CELTICS": "BOS", "BROOKLYN_NETS": "BKN",
+    "CHARLOTTE_HORNETS": "CHA", "CHICAGO_BULLS": "CHI", "CLEVELAND_CAVALIERS": "CLE",
+    "DALLAS_MAVERICKS": "DAL", "DENVER_NUGGETS": "DEN", "DETROIT_PISTONS": "DET",
+    "GOLDEN_STATE_WARRIORS": "GSW", "HOUSTON_ROCKETS": "HOU", "INDIANA_PACERS": "IND",
+    "LOS_ANGELES_CLIPPERS": "LAC", "LOS_ANGELES_LAKERS": "LAL", "MEMPHIS_GRIZZLIES": "MEM",
+    "MIAMI_HEAT": "MIA", "MILWAUKEE_BUCKS": "MIL", "MINNESOTA_TIMBERWOLVES": "MIN",
+    "NEW_ORLEANS_PELICANS": "NOP", "NEW_YORK_KNICKS": "NYK", "OKLAHOMA_CITY_THUNDER": "OKC",
+    "ORLANDO_MAGIC": "ORL", "PHILADELPHIA_76ERS": "PHI", "PHOENIX_SUNS": "PHX",
+    "PORTLAND_TRAIL_BLAZERS": "POR", "SACRAMENTO_KINGS": "SAC", "SAN_ANTONIO_SPURS": "SAS",
+    "TORONTO_RAPTORS": "TOR", "UTAH_JAZZ": "UTA", "WASHINGTON_WIZARDS": "WAS",
+}
+
+
+def scrape_season_totals(season_end_year=2026):
+    """{lowercase name: {name, team}} for every player with a season-totals row."""
+    from basketball_reference_web_scraper import client
+
+    print(f"Fetching season totals for {season_end_year - 1}-{str(season_end_year)[2:]}...", file=sys.stderr)
+    with stage("fetch"):
+        players = client.players_season_totals(season_end_year=season_end_year)
+    print(f"Got {len(players)} player records", file=sys.stderr)
+
+    all_players = {}
+    for p in players:
+        name = p.get("name", "")
+        team = p.get("team")
+        if team and name:
+            abbrev = TEAM_ENUM_ABBREVS.get(getattr(team, "name", None), str(team))
+            all_players[name.lower()] = {"name": name, "team": abbrev}
+    return all_players
+
+
+def cmd_scrape(args):
+    try:
+        all_players = scrape_season_totals(args.season)
+    except Exception as e:
+        print(f"Error fetching season totals: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"\nTotal unique players: {len(all_players)}", file=sys.stderr)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(all_players, f, indent=2)
+        print(f"Saved to {args.out}", file=sys.stderr)
+    else:
+        print(json.dumps(all_players, indent=2))
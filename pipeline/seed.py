@@ -0,0 +1,168 @@
+"""Reading, rewriting and rendering the TypeScript roster seed (server/nbaRosterData2026.ts)."""
+
+import json
+import re
+
+from pipeline.names import normalize_to_ascii
+from pipeline.teams import TEAM_NAMES, TEAM_ORDER
+
+TEAM_NAME_RE = re.compile(r'teamCode:\s*"([^"]+)",\s*name:\s*"([^"]+)"')
+
+ROSTER_ENTRY_RE = re.compile(
+    r'\{\s*teamCode:\s*"([^"]+)",\s*name:\s*"([^"]+)",\s*position:\s*"([^"]+)",\s*'
+    r'depthOrder:\s*(\d+),\s*age:\s*(\d+),\s*capHit:\s*([\d.]+),\s*'
+    r'contractYears:\s*(\d+),\s*status:\s*"([^"]+)",\s*sport:\s*"NBA"'
+    r'(?:,\s*salaryByYear:\s*\{[^}]*\})?'
+    r'(?:,\s*contractEndYear:\s*\w+)?'
+    r'(?:,\s*optionType:\s*"[^"]*")?'
+    r'\s*\}'
+)
+
+
+SEED_PLAYER_RE = re.compile(
+    r'\{\s*teamCode:\s*"(?P<team>[^"]+)",\s*name:\s*"(?P<name>(?:[^"\\]|\\.)+)",\s*position:\s*"(?P<position>[^"]+)",\s*'
+    r'depthOrder:\s*(?P<depth>\d+),\s*age:\s*(?P<age>\d+),\s*capHit:\s*(?P<cap_hit>[\d.]+),\s*'
+    r'contractYears:\s*(?P<years>\d+),\s*status:\s*"(?P<status>[^"]+)",\s*sport:\s*"NBA"'
+    r'(?:,\s*salaryByYear:\s*(?P<salary>\{[^}]*\}))?'
+    r'(?:,\s*contractEndYear:\s*(?P<end>\d+))?'
+    r'(?:,\s*optionType:\s*"(?P<option>[^"]*)")?'
+)
+
+
+def read_text(path):
+    with open(path) as f:
+        return f.read()
+
+
+def write_text(path, content):
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def write_seed(path, content):
+    """Write the TS seed and refresh its roster artifact from the written source."""
+    from pipeline.roster_artifact import artifact_path, write_artifact
+
+    write_text(path, content)
+    write_artifact(artifact_path(path), seed_players(content))
+
+
+def read_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_json(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def roster_entries(content):
+    """(teamCode, name) for every player in the seed, in file order."""
+    return TEAM_NAME_RE.findall(content)
+
+
+def seed_players(content):
+    """Contract fields of every seed entry, in file order."""
+    players = []
+    for m in SEED_PLAYER_RE.finditer(content):
+        cap_hit = float(m["cap_hit"])
+        players.append({
+            "teamCode": m["team"],
+            "name": m["name"].replace("\\'", "'"),
+            "position": m["position"],
+            "depthOrder": int(m["depth"]),
+            "age": int(m["age"]),
+            "capHit": cap_hit,
+            "contractYears": int(m["years"]),
+            "status": m["status"],
+            "salaryByYear": json.loads(m["salary"]) if m["salary"] else {},
+            "contractEndYear": int(m["end"]) if m["end"] else None,
+            "optionType": m["option"] or "none",
+        })
+    return players
+
+
+def move_players(content, updates, log=print):
+    """Rewrite the teamCode of each {name, oldTeam, newTeam} update in the seed source."""
+    for u in updates:
+        old = f'teamCode: "{u["oldTeam"]}", name: "{u["name"]}"'
+        new = f'teamCode: "{u["newTeam"]}", name: "{u["name"]}"'
+        if old in content:
+            content = content.replace(old, new, 1)
+            log(f"  {u['name']}: {u['oldTeam']} -> {u['newTeam']}")
+        else:
+            log(f"  SKIP (not found in file): {u['name']}")
+    return content
+
+
+def render_roster_ts(all_teams, team_order=TEAM_ORDER):
+    """Render scraped full rosters as the nbaRosters2026 TS module.
+
+    Returns (source, total_players, name_changes).
+    """
+    lines = []
+    lines.append('import type { InsertRosterPlayer } from "@shared/schema";')
+    lines.append('')
+    lines.append('export const nbaRosters2026: InsertRosterPlayer[] = [')
+
+    total_players = 0
+    name_changes = []
+
+    for team_code in team_order:
+        players = all_teams.get(team_code, [])
+        team_name = TEAM_NAMES.get(team_code, team_code)
+        lines.append(f'  // ========== {team_code} - {team_name} ==========')
+
+        sorted_players = sorted(players, key=lambda p: -p['capHit'])
+
+        for depth_idx, p in enumerate(sorted_players):
+            depth = (depth_idx // 5) + 1
+            if depth > 3:
+                depth = 3
+
+            original_name = p['name']
+            ascii_name = normalize_to_ascii(original_name)
+            if ascii_name != original_name:
+                name_changes.append(f"  {original_name} -> {ascii_name}")
+
+            name = ascii_name.replace("'", "\\'")
+            salary_str = json.dumps(p['salaryByYear'])
+
+            contract_years = p['contractYears']
+            salary_count = len(p['salaryByYear'])
+            if contract_years != salary_count:
+                contract_years = salary_count
+
+            line = (
+                f'  {{ teamCode: "{team_code}", name: "{name}", position: "{p["position"]}", '
+                f'depthOrder: {depth}, age: {p["age"] or 25}, capHit: {p["capHit"]}, '
+                f'contractYears: {contract_years}, status: "active", sport: "NBA", '
+                f'salaryByYear: {salary_str}, '
+                f'contractEndYear: {p["contractEndYear"]}, optionType: "{p["optionType"]}" }},'
+            )
+            lines.append(line)
+            total_players += 1
+
+        lines.append('')
+
+    lines.append('];')
+    lines.append('')
+    return '\n'.join(lines), total_players, name_changes
+
+
+def cmd_generate(args):
+    from pipeline.profiling import stage
+
+    with stage("load"):
+        all_teams = read_json(args.rosters)
+    with stage("render"):
+        output, total_players, name_changes = render_roster_ts(all_teams)
+    with stage("write"):
+        write_seed(args.seed, output)
+
+    print(f"Generated {args.seed} with {total_players} players across {len(TEAM_ORDER)} teams")
+    if name_changes:
+        print(f"\nNormalized {len(name_changes)} names with diacritics:")
+        for c in name_changes:
+            print(c)
@@ -0,0 +1,321 @@
+"""Deterministic synthetic league data for scale-testing the pipeline.
+
+``--scale N`` generates N leagues of 30 teams each (scale 1 is roughly the
+real 457-contract seed). Each run writes, under ``--out``:
+
+- ``contracts.json``      scrape-contracts output (input to apply-contracts)
+- ``full_rosters.json``   scrape-rosters output (input to generate)
+- ``scraped_rosters.json`` {name: {name, team}} (input to compare / apply-roster-updates)
+- ``seed.ts``             a stale TS seed: some players on old teams, old salaries
+- ``teams.json``          {bbref code: our code} for every synthetic team
+- ``html/``               bbref-style contract, roster and league transactions pages (skip with --no-html)
+- ``manifest.json``       scale, seed and row counts
+
+Names deliberately include accents, generational suffixes, initials,
+apostrophes, hyphens and both exact and first-initial/last-name collisions.
+The same ``--seed`` and ``--scale`` always produce the same bytes.
+"""
+
+import html
+import os
+import random
+
+from pipeline.bbref import POSITION_MAP, contracts_url, roster_url
+from pipeline.teams import BBREF_TEAMS, TEAM_NAMES
+
+FIRST_NAMES = [
+    "Aaron", "Alex", "Andre", "Anthony", "Ben", "Bogdan", "Brandon", "Cam", "Chris", "Cole",
+    "Daniel", "Darius", "David", "De'Aaron", "Dennis", "Derrick", "Devin", "Donovan", "Dyson", "Evan",
+    "Franz", "Gary", "Grant", "Herbert", "Isaiah", "Jalen", "Jamal", "Jaren", "Jaylen", "Jordan",
+    "Josh", "Jusuf", "Karl-Anthony", "Kelly", "Kevin", "Kristaps", "Luka", "Malik", "Marcus", "Mikal",
+    "Nikola", "Nicolas", "Onyeka", "Pascal", "RJ", "Scottie", "Shai", "Terry", "Tre", "Tyrese",
+    "Victor", "Walker", "Zach", "Alperen", "Dāvis", "Théo", "Vasilije", "Goga", "Dario", "Moussa",
+]
+INITIAL_FIRST_NAMES = ["T.J.", "A.J.", "P.J.", "C.J.", "R.J.", "O.G.", "J.T.", "D.J."]
+
+LAST_NAMES = [
+    "Adams", "Anderson", "Barnes", "Bridges", "Brown", "Carter", "Collins", "Davis", "Edwards", "Fox",
+    "Green", "Harris", "Hill", "Holiday", "Jackson", "Johnson", "Jones", "Lopez", "Martin", "Mitchell",
+    "Murray", "Payne", "Porter", "Robinson", "Smith", "Thompson", "Walker", "Williams", "Wright", "Young",
+    "Alexander-Walker", "Gilgeous-Alexander", "O'Neale", "Dončić", "Jokić", "Nurkić", "Bogdanović",
+    "Valančiūnas", "Şengün", "Porziņģis", "Schröder", "Šarić", "Micić", "Bitadze", "Diabaté", "Nikolić",
+    "Vučević", "Hernangómez", "Jović", "Mamukelashvili", "Antetokounmpo", "Ntilikina", "Yabusele",
+]
+SUFFIXES = ["Jr.", "Sr.", "II", "III", "IV"]
+
+BBREF_POSITIONS = ["PG", "SG", "SF", "PF", "C", "G", "F", "G-F", "F-G", "F-C", "C-F"]
+
+BASE_SEASON = 2025
+MAX_CONTRACT_YEARS = 5
+OPTION_CLASSES = {"player": "salary-pl", "team": "salary-tm", "early_termination": "salary-et"}
+
+
+def league_teams(league):
+    """{bbref code: our code} for one synthetic league; league 0 uses the real codes."""
+    if league == 0:
+        return dict(BBREF_TEAMS)
+    return {f"{b}{league}": f"{o}{league}" for b, o in BBREF_TEAMS.items()}
+
+
+def _name(rng, shared):
+    r = rng.random()
+    if r < 0.03:
+        return rng.choice(shared)
+    if r < 0.06:
+        # Same first initial and last name as a shared name, different player.
+        base = rng.choice(shared).split()
+        initial = base[0][0]
+        firsts = [f for f in FIRST_NAMES if f[0] == initial and f != base[0]] or FIRST_NAMES
+        return " ".join([rng.choice(firsts)] + base[1:])
+
+    first = rng.choice(INITIAL_FIRST_NAMES) if rng.random() < 0.05 else rng.choice(FIRST_NAMES)
+    name = f"{first} {rng.choice(LAST_NAMES)}"
+    if rng.random() < 0.07:
+        name += f" {rng.choice(SUFFIXES)}"
+    return name
+
+
+def _salary(rng, two_way):
+    if two_way:
+        return round(rng.uniform(0.5, 0.65), 2)
+    tier = rng.random()
+    if tier < 0.35:
+        return round(rng.uniform(1.1, 3.0), 2)
+    if tier < 0.75:
+        return round(rng.uniform(3.0, 15.0), 2)
+    if tier < 0.93:
+        return round(rng.uniform(15.0, 35.0), 2)
+    return round(rng.uniform(35.0, 55.0), 2)
+
+
+def _player(rng, shared, two_way):
+    cap_hit = _salary(rng, two_way)
+    years = 1 if two_way else rng.randint(1, MAX_CONTRACT_YEARS)
+    raise_pct = rng.choice((0.0, 0.05, 0.08))
+    salary_by_year = {str(BASE_SEASON + i): round(cap_hit * (1 + raise_pct) ** i, 2) for i in range(years)}
+    option = "none"
+    if years > 1:
+        option = rng.choices(("none", "player", "team", "early_termination"), (50, 20, 28, 2))[0]
+    return {
+        "name": _name(rng, shared),
+        "bbref_pos": rng.choice(BBREF_POSITIONS),
+        "age": rng.randint(19, 38),
+        "salary_by_year": salary_by_year,
+        "cap_hit": cap_hit,
+        "contract_years": years,
+        "contract_end_year": BASE_SEASON + years,
+        "option_type": option,
+        "guaranteed": round(sum(salary_by_year.values()) * rng.choice((1.0, 1.0, 0.85)), 2),
+        "two_way": two_way,
+    }
+
+
+def generate_league(league, seed):
+    """{our code: [player dicts]} for one league, from its own RNG stream."""
+    rng = random.Random(f"{seed}:{league}")
+    shared_rng = random.Random(f"{seed}:shared")
+    shared = [f"{shared_rng.choice(FIRST_NAMES)} {shared_rng.choice(LAST_NAMES)}" for _ in range(40)]
+
+    teams = {}
+    for our_code in league_teams(league).values():
+        standard = rng.randint(13, 17)
+        two_way = rng.randint(0, 3)
+        teams[our_code] = [_player(rng, shared, False) for _ in range(standard)] + \
+                          [_player(rng, shared, True) for _ in range(two_way)]
+    return teams
+
+
+def contract_row(p):
+    return {k: p[k] for k in ("name", "age", "salary_by_year", "cap_hit", "contract_years",
+                              "contract_end_year", "option_type", "guaranteed")}
+
+
+def full_roster_row(our_code, p):
+    pos = p["bbref_pos"]
+    return {
+        "teamCode": our_code,
+        "name": p["name"],
+        "position": POSITION_MAP.get(pos, pos.split("-")[0]),
+        "age": p["age"],
+        "capHit": p["cap_hit"],
+        "contractYears": p["contract_years"],
+        "contractEndYear": p["contract_end_year"],
+        "optionType": p["option_type"],
+        "salaryByYear": p["salary_by_year"],
+        "on_roster": True,
+    }
+
+
+def stale_seed_rows(rng, teams):
+    """What the seed looked like before the latest scrape: ~5% of players on another
+    team in their league and ~20% with last season's salary."""
+    codes = list(teams)
+    stale = {code: [] for code in codes}
+    for code, rows in teams.items():
+        for row in rows:
+            row = dict(row)
+            if rng.random() < 0.2:
+                old = round(row["capHit"] * rng.uniform(0.6, 1.1), 2)
+                row["capHit"] = old
+                row["salaryByYear"] = {str(BASE_SEASON): old}
+                row["contractYears"] = 1
+            dest = rng.choice(codes) if rng.random() < 0.05 else code
+            stale[dest].append(row)
+    return stale
+
+
+def contracts_page(bbref_code, players):
+    seasons = [BASE_SEASON + i for i in range(MAX_CONTRACT_YEARS + 1)]
+    head = "".join(f'<th data-stat="y{i + 1}">{y}-{str(y + 1)[2:]}</th>' for i, y in enumerate(seasons))
+    rows = []
+    for p in players:
+        if p["two_way"]:
+            continue
+        cells = []
+        last = str(max(int(y) for y in p["salary_by_year"]))
+        for i, y in enumerate(seasons):
+            salary = p["salary_by_year"].get(str(y))
+            if salary is None:
+                cells.append(f'<td class="iz" data-stat="y{i + 1}"></td>')
+                continue
+            cls = OPTION_CLASSES.get(p["option_type"], "") if str(y) == last else ""
+            cells.append(f'<td class="right {cls}" data-stat="y{i + 1}">${round(salary * 1_000_000):,}</td>')
+        rows.append(
+            f'<tr><th data-stat="player"><a href="/players/x/{bbref_code.lower()}.html">{html.escape(p["name"])}</a></th>'
+            f'<td data-stat="age_today">{p["age"]}</td>{"".join(cells)}'
+            f'<td data-stat="remain_gtd">${round(p["guaranteed"] * 1_000_000):,}</td></tr>'
+        )
+    return (
+        f"<html><body><h1>{bbref_code} Contracts</h1>"
+        '<table id="contracts"><thead>'
+        '<tr class="over_header"><th colspan="2"></th><th colspan="6">Salary</th></tr>'
+        f'<tr><th data-stat="player">Player</th><th data-stat="age_today">Age</th>{head}'
+        '<th data-stat="remain_gtd">Guaranteed</th></tr>'
+        f'</thead><tbody>{"".join(rows)}</tbody></table></body></html>'
+    )
+
+
+def roster_page(bbref_code, players):
+    rows = []
+    for p in players:
+        name = html.escape(p["name"]) + (" (TW)" if p["two_way"] else "")
+        rows.append(
+            f'<tr><td data-stat="player"><a href="/players/x/{bbref_code.lower()}.html">{name}</a></td>'
+            f'<td data-stat="pos">{p["bbref_pos"]}</td></tr>'
+        )
+    return (
+        f"<html><body><h1>{bbref_code} Roster</h1>"
+        f'<table id="roster"><tbody>{"".join(rows)}</tbody></table></body></html>'
+    )
+
+
+def transactions_page(rng, league_players, n_moves=6):
+    """A league transactions page naming a few signings, waivers and trades."""
+    days = []
+    for day in range(1, n_moves + 1):
+        league = rng.randrange(len(league_players))
+        teams = league_teams(league)
+        codes = rng.sample(sorted(teams), 2)
+        links = [f'<a href="/teams/{b}/{BASE_SEASON + 1}.html">{TEAM_NAMES.get(teams[b], teams[b])}</a>'
+                 for b in codes]
+        player = html.escape(rng.choice(league_players[league][teams[codes[0]]])["name"])
+        kind = rng.choice(("signed", "waived", "traded"))
+        if kind == "traded":
+            text = f"The {links[0]} traded {player} to the {links[1]} for cash considerations."
+        else:
+            text = f"The {links[0]} {kind} {player}."
+        days.append(f"<li><span>October {day}, {BASE_SEASON}</span><p>{text}</p></li>")
+    return (
+        f"<html><body><h1>{BASE_SEASON}-{str(BASE_SEASON + 1)[2:]} NBA Transactions</h1>"
+        f'<ul class="page_index">{"".join(days)}</ul></body></html>'
+    )
+
+
+def page_path(root, url):
+    """Local file for a bbref contracts/roster URL inside a synthetic html/ dump."""
+    return os.path.join(root, url.split("basketball-reference.com/", 1)[1])
+
+
+def local_fetch(root):
+    """A bbref.fetch_page replacement that reads pages written by generate-synthetic."""
+    from pipeline.profiling import stage
+
+    def fetch(url):
+        with stage("fetch"):
+            with open(page_path(root, url), encoding="utf-8") as f:
+                return f.read()
+    return fetch
+
+
+def generate(out, scale=1, seed=0, write_html=True):
+    from pipeline.profiling import stage
+    from pipeline.seed import render_roster_ts, write_json, write_text
+
+    os.makedirs(out, exist_ok=True)
+    html_root = os.path.join(out, "html")
+    all_teams = {}
+    contracts = {}
+    full_rosters = {}
+    scraped = {}
+    stale = {}
+    stale_rng = random.Random(f"{seed}:stale")
+    leagues = []
+
+    for league in range(scale):
+        with stage("generate"):
+            league_players = generate_league(league, seed)
+        leagues.append(league_players)
+        teams = league_teams(league)
+        league_full = {}
+        for bbref_code, our_code in teams.items():
+            players = league_players[our_code]
+            all_teams[bbref_code] = our_code
+            contracts[our_code] = [contract_row(p) for p in players if not p["two_way"]]
+            league_full[our_code] = [full_roster_row(our_code, p) for p in players if not p["two_way"]]
+            for p in players:
+                if stale_rng.random() < 0.02:
+                    continue
+                scraped[p["name"]] = {"name": p["name"], "team": our_code}
+
+            if write_html:
+                with stage("html"):
+                    for url, page in ((contracts_url(bbref_code), contracts_page(bbref_code, players)),
+                                      (roster_url(bbref_code), roster_page(bbref_code, players))):
+                        path = page_path(html_root, url)
+                        os.makedirs(os.path.dirname(path), exist_ok=True)
+                        write_text(path, page)
+        full_rosters.update(league_full)
+        stale.update(stale_seed_rows(stale_rng, league_full))
+
+    if write_html:
+        from pipeline.transactions import transactions_url
+
+        path = page_path(html_root, transactions_url())
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_text(path, transactions_page(random.Random(f"{seed}:transactions"), leagues))
+
+    with stage("write"):
+        write_json(os.path.join(out, "contracts.json"), contracts)
+        write_json(os.path.join(out, "full_rosters.json"), full_rosters)
+        write_json(os.path.join(out, "scraped_rosters.json"), scraped)
+        write_json(os.path.join(out, "teams.json"), all_teams)
+        seed_ts, seed_players, _ = render_roster_ts(stale, list(stale))
+        write_text(os.path.join(out, "seed.ts"), seed_ts)
+
+    manifest = {
+        "scale": scale,
+        "seed": seed,
+        "teams": len(all_teams),
+        "contracts": sum(len(v) for v in contracts.values()),
+        "seedPlayers": seed_players,
+        "scrapedNames": len(scraped),
+        "html": write_html,
+    }
+    write_json(os.path.join(out, "manifest.json"), manifest)
+    return manifest
+
+
+def cmd_generate(args):
+    manifest = generate(args.out, args.scale, args.seed, not args.no_html)
+    print(f"Wrote {manifest['contracts']} contracts across {manifest['teams']} teams "
+          f"({manifest['scale']}x, seed {manifest['seed']}) to {args.out}")
@@ -0,0 +1,135 @@
+"""Transaction-driven selective roster refresh.
+
+A full ``scrape-rosters`` run is 60 rate-limited page fetches. Most nights
+only a couple of teams make a move, so ``refresh-rosters`` first reads the
+league transactions page (one request) and compares it with the
+transactions seen on the previous refresh, kept in a small state file:
+
+- every team linked from a transaction not seen before is queued;
+- teams whose scrape failed last time stay queued until one succeeds;
+- with no state (or state from another season) every team is queued.
+
+Queued teams are scraped with ``bbref.scrape_full_rosters`` and merged into
+the existing full-rosters JSON; the rest keep their rows untouched.
+"""
+
+import hashlib
+import os
+import re
+import time
+
+from pipeline.bbref import DELAY, ROSTER_SEASON, _soup, fetch_page, scrape_full_rosters
+from pipeline.profiling import stage
+
+TEAM_HREF_RE = re.compile(r"/teams/([A-Z0-9]+)/\d{4}\.html")
+
+
+def transactions_url(season=ROSTER_SEASON):
+    return f"https://www.basketball-reference.com/leagues/NBA_{season}_transactions.html"
+
+
+def parse_transactions_page(html):
+    """[{date, text, teams}] in page order; ``teams`` are the bbref codes linked from each entry."""
+    with stage("parse"):
+        soup = _soup(html)
+        index = soup.find("ul", {"class": "page_index"})
+        if not index:
+            return []
+        transactions = []
+        for day in index.find_all("li", recursive=False):
+            span = day.find("span")
+            date = span.get_text(strip=True) if span else ""
+            for entry in day.find_all("p"):
+                teams = []
+                for link in entry.find_all("a", href=True):
+                    m = TEAM_HREF_RE.search(link["href"])
+                    if m and m.group(1) not in teams:
+                        teams.append(m.group(1))
+                transactions.append({"date": date, "text": " ".join(entry.get_text().split()), "teams": teams})
+        return transactions
+
+
+def transaction_key(t):
+    return hashlib.sha1(f"{t['date']}|{t['text']}".encode()).hexdigest()[:16]
+
+
+def plan_refresh(transactions, state, teams, season=ROSTER_SEASON):
+    """Teams to re-scrape: ({bbref code: our code}, {our code: [reasons]}).
+
+    ``teams`` is the {bbref code: our code} universe; ``state`` is the
+    previous refresh's state file contents ({} for none).
+    """
+    if not state or state.get("season") != season:
+        return dict(teams), {our: ["no previous refresh"] for our in teams.values()}
+
+    seen = set(state.get("seen", []))
+    reasons = {}
+    for our in state.get("pending", []):
+        reasons.setdefault(our, []).append("failed last refresh")
+    for t in transactions:
+        if transaction_key(t) in seen:
+            continue
+        for bbref in t["teams"]:
+            if bbref in teams:
+                reasons.setdefault(teams[bbref], []).append(f"{t['date']}: {t['text']}")
+
+    queue = {b: o for b, o in teams.items() if o in reasons}
+    return queue, reasons
+
+
+def _page_source(from_dir):
+    """({bbref code: our code}, fetch, delay): live bbref, or a generate-synthetic dump."""
+    if not from_dir:
+        from pipeline.teams import BBREF_TEAMS
+
+        return dict(BBREF_TEAMS), fetch_page, DELAY
+
+    from pipeline.seed import read_json
+    from pipeline.synthetic import local_fetch
+
+    return read_json(os.path.join(from_dir, "teams.json")), local_fetch(os.path.join(from_dir, "html")), 0
+
+
+def cmd_refresh(args):
+    from pipeline.seed import read_json, write_json
+
+    teams, fetch, delay = _page_source(args.from_dir)
+    state = {} if args.full or not os.path.exists(args.state) else read_json(args.state)
+
+    transactions = parse_transactions_page(fetch(transactions_url(args.season)))
+    with stage("plan"):
+        queue, reasons = plan_refresh(transactions, state, teams, args.season)
+
+    new = sum(1 for t in transactions if transaction_key(t) not in set(state.get("seen", [])))
+    print(f"{len(transactions)} transactions on the page, {new} new; "
+          f"re-scraping {len(queue)} of {len(teams)} teams ({1 + 2 * len(queue)} requests instead of {2 * len(teams)})")
+    for our in queue.values():
+        why = reasons[our]
+        print(f"  {our:5s} {why[0]}" + (f" (+{len(why) - 1} more)" if len(why) > 1 else ""))
+    if args.dry_run:
+        return
+
+    existing = read_json(args.out) if os.path.exists(args.out) else {}
+    if queue:
+        time.sleep(delay)
+        all_teams = scrape_full_rosters(queue, delay, fetch, existing)
+    else:
+        all_teams = existing
+    # scrape_full_rosters records a failed team as []; no real roster is empty.
+    # Failed teams keep their last good rows until a later refresh succeeds.
+    failed = [our for our in queue.values() if not all_teams.get(our)]
+    for our in failed:
+        if existing.get(our):
+            all_teams[our] = existing[our]
+
+    with stage("write"):
+        write_json(args.out, all_teams)
+        write_json(args.state, {
+            "season": args.season,
+            "refreshedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "seen": sorted(transaction_key(t) for t in transactions),
+            "pending": failed,
+        })
+
+    print(f"\nRefreshed {len(queue) - len(failed)} teams into {args.out}"
+          + (f"; {len(failed)} failed and stay queued: {', '.join(failed)}" if failed else ""))
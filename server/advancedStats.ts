@@ -0,0 +1,144 @@
+import type { InsertPlayerSeasonStats } from "@shared/schema";
+
+// Players with fewer games get metrics but no league value percentile.
+export const MIN_VALUE_GAMES = 5;
+
+type StatKey = keyof InsertPlayerSeasonStats;
+
+function column(rows: InsertPlayerSeasonStats[], key: StatKey): Float64Array {
+  const out = new Float64Array(rows.length);
+  for (let i = 0; i < rows.length; i++) {
+    const v = rows[i][key];
+    out[i] = typeof v === "number" ? v : NaN;
+  }
+  return out;
+}
+
+function rounded(v: number, digits: number): number | null {
+  if (!Number.isFinite(v)) return null;
+  const f = 10 ** digits;
+  return Math.round(v * f) / f;
+}
+
+// Roster and stats names differ in accents, punctuation and suffixes.
+export function statsNameKey(name: string): string {
+  return name
+    .normalize("NFD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .toLowerCase()
+    .replace(/[^a-z\s]/g, "")
+    .replace(/\s+(jr|sr|ii|iii|iv|v)$/, "")
+    .replace(/\s+/g, " ")
+    .trim();
+}
+
+// Cap hits keyed by `${statsNameKey(name)}|${teamCode}`, plus the bare name key
+// as a fallback for players the stats page still lists under an old team.
+export function capHitLookup(roster: { name: string; teamCode: string; capHit: number | null }[]): Map<string, number> {
+  const lookup = new Map<string, number>();
+  for (const p of roster) {
+    if (p.capHit == null) continue;
+    const key = statsNameKey(p.name);
+    lookup.set(`${key}|${p.teamCode}`, p.capHit);
+    if (!lookup.has(key)) lookup.set(key, p.capHit);
+  }
+  return lookup;
+}
+
+/**
+ * Adds shooting efficiency, a usage estimate, per-36 rates, Hollinger game
+ * score and a cap-joined value score to every stat line, computed column-wise
+ * over the whole league in one batch.
+ *
+ * Usage follows the Basketball Reference USG% formula with team totals
+ * rebuilt from the players' own lines (team games = most games played by
+ * anyone on the team), so it needs no extra team scrape.
+ */
+export function computeAdvancedStats(
+  rows: InsertPlayerSeasonStats[],
+  capHits: Map<string, number> = new Map(),
+): InsertPlayerSeasonStats[] {
+  const n = rows.length;
+  const gp = column(rows, "gamesPlayed");
+  const mp = column(rows, "minutesPerGame");
+  const pts = column(rows, "pointsPerGame");
+  const trb = column(rows, "reboundsPerGame");
+  const ast = column(rows, "assistsPerGame");
+  const stl = column(rows, "stealsPerGame");
+  const blk = column(rows, "blocksPerGame");
+  const tov = column(rows, "turnoversPerGame");
+  const orb = column(rows, "offRebPerGame");
+  const drb = column(rows, "defRebPerGame");
+  const pf = column(rows, "personalFouls");
+  const fga = column(rows, "fgaPerGame");
+  const fgm = column(rows, "fgmPerGame");
+  const fg3m = column(rows, "fg3mPerGame");
+  const fta = column(rows, "ftaPerGame");
+  const ftm = column(rows, "ftmPerGame");
+
+  const teamIds = new Int32Array(n);
+  const teamIndex = new Map<string, number>();
+  for (let i = 0; i < n; i++) {
+    let id = teamIndex.get(rows[i].teamCode);
+    if (id === undefined) {
+      id = teamIndex.size;
+      teamIndex.set(rows[i].teamCode, id);
+    }
+    teamIds[i] = id;
+  }
+  const teamGames = new Float64Array(teamIndex.size);
+  const teamMinutes = new Float64Array(teamIndex.size);
+  const teamPossessions = new Float64Array(teamIndex.size);
+  const possessions = new Float64Array(n);
+  for (let i = 0; i < n; i++) {
+    const t = teamIds[i];
+    const g = gp[i] || 0;
+    possessions[i] = (fga[i] || 0) + 0.44 * (fta[i] || 0) + (tov[i] || 0);
+    teamGames[t] = Math.max(teamGames[t], g);
+    teamMinutes[t] += (mp[i] || 0) * g;
+    teamPossessions[t] += possessions[i] * g;
+  }
+
+  const gameScore = new Float64Array(n);
+  for (let i = 0; i < n; i++) {
+    gameScore[i] = (pts[i] || 0) + 0.4 * (fgm[i] || 0) - 0.7 * (fga[i] || 0) - 0.4 * ((fta[i] || 0) - (ftm[i] || 0))
+      + 0.7 * (orb[i] || 0) + 0.3 * (drb[i] || 0) + (stl[i] || 0) + 0.7 * (ast[i] || 0) + 0.7 * (blk[i] || 0)
+      - 0.4 * (pf[i] || 0) - (tov[i] || 0);
+  }
+
+  // Percentile of game score among players with enough games.
+  const qualified: number[] = [];
+  for (let i = 0; i < n; i++) if ((gp[i] || 0) >= MIN_VALUE_GAMES) qualified.push(i);
+  qualified.sort((a, b) => gameScore[a] - gameScore[b]);
+  const valueScore = new Float64Array(n).fill(NaN);
+  for (let r = 0; r < qualified.length; r++) {
+    valueScore[qualified[r]] = qualified.length > 1 ? (r / (qualified.length - 1)) * 100 : 100;
+  }
+
+  return rows.map((row, i) => {
+    const t = teamIds[i];
+    const per36 = mp[i] > 0 ? 36 / mp[i] : NaN;
+    const shots = 2 * (fga[i] + 0.44 * fta[i]);
+    const teamPerGame = teamGames[t] > 0 ? teamPossessions[t] / teamGames[t] : NaN;
+    const teamMinutesPerGame = teamGames[t] > 0 ? teamMinutes[t] / teamGames[t] : NaN;
+    const nameKey = statsNameKey(row.name);
+    const capHit = capHits.get(`${nameKey}|${row.teamCode}`) ?? capHits.get(nameKey) ?? null;
+    return {
+      ...row,
+      tsPct: rounded(shots > 0 ? pts[i] / shots : NaN, 3),
+      efgPct: rounded(fga[i] > 0 ? (fgm[i] + 0.5 * fg3m[i]) / fga[i] : NaN, 3),
+      usgPct: rounded(mp[i] > 0 && teamPerGame > 0
+        ? (100 * possessions[i] * (teamMinutesPerGame / 5)) / (mp[i] * teamPerGame) : NaN, 1),
+      pointsPer36: rounded(pts[i] * per36, 1),
+      reboundsPer36: rounded(trb[i] * per36, 1),
+      assistsPer36: rounded(ast[i] * per36, 1),
+      stealsPer36: rounded(stl[i] * per36, 1),
+      blocksPer36: rounded(blk[i] * per36, 1),
+      turnoversPer36: rounded(tov[i] * per36, 1),
+      gameScore: rounded(gameScore[i], 1),
+      valueScore: rounded(valueScore[i], 1),
+      capHit,
+      valuePerMillion: capHit && capHit > 0 ? rounded(gameScore[i] / capHit, 2) : null,
+    };
+  });
+}
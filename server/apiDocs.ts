@@ -28,10 +28,19 @@ const endpoints: EndpointDoc[] = [
     { name: "sport", type: "NFL | NBA", required: false, description: "Sport filter (default: NFL)" },
     { name: "team", type: "string", required: false, description: "Team code filter" },
   ], response: "RosterPlayer[]", category: "Teams" },
+  { method: "GET", path: "/api/players/search", description: "Typeahead player-name search across rosters, free agents and prospects (accent-insensitive, with aliases such as \"Lu Dort\")", queryParams: [
+    { name: "q", type: "string", required: true, description: "Name prefix, a later word of the name, or a misspelling" },
+    { name: "sport", type: "NFL | NBA", required: false, description: "Sport filter (default: both)" },
+    { name: "kind", type: "roster | freeAgent | prospect", required: false, description: "Player table filter" },
+    { name: "limit", type: "number", required: false, description: "Max results, 1-50 (default: 10)" },
+  ], response: "{ id, name, kind, sport, team, position }[]", category: "Teams" },
   { method: "GET", path: "/api/draft-order", description: "Get draft order", queryParams: [
     { name: "sport", type: "NFL | NBA", required: false, description: "Sport filter (default: NFL)" },
     { name: "year", type: "number", required: false, description: "Draft year filter" },
   ], response: "DraftOrder[]", category: "Prospects & Draft" },
+  { method: "GET", path: "/api/draft-odds", description: "Monte Carlo landing-spot odds per prospect and pick slot", queryParams: [
+    { name: "sport", type: "NFL | NBA", required: false, description: "Sport filter (default: NFL)" },
+  ], response: "{ sport, year, drafts, prospects: { name, expectedPick, slots: [pick, p][], teams }[], slots: { pickNumber, teamCode, picks: [name, p][] }[] }", category: "Prospects & Draft" },
   { method: "GET", path: "/api/mock-drafts", description: "List all mock drafts", queryParams: [
     { name: "sport", type: "NFL | NBA", required: false, description: "Sport filter (default: NFL)" },
   ], response: "MockDraft[]", category: "Mock Drafts" },
@@ -46,6 +55,7 @@ const endpoints: EndpointDoc[] = [
   ], response: "CapSetting[]", category: "Trade Machine" },
   { method: "PUT", path: "/api/cap-settings/:year", description: "Update cap settings for a year", bodySchema: "{ salaryCap?: number, taxLine?: number, firstApron?: number, secondApron?: number, minSalary?: number, maxSalary?: number }", response: "CapSetting", category: "Trade Machine" },
   { method: "POST", path: "/api/trades/validate", description: "Validate a trade proposal against CBA rules", bodySchema: "{ teams: TradeTeamState[] (2-4 teams), year?: number }", response: "TradeValidationResult", category: "Trade Machine" },
+  { method: "POST", path: "/api/trades/validate-batch", description: "Validate up to 10,000 trade proposals in one call against a shared per-team salary/roster table (built from NBA rosters when teams is omitted)", bodySchema: "{ proposals: { id?: string | number, teams: TradeTeamLeg[] (2-4 teams) }[], teams?: { teamCode, currentSalary, capSpace?, rosterSize }[], year?: number }", response: "{ year, total, validCount, results: TradeValidationResult[] }", category: "Trade Machine" },
   { method: "GET", path: "/api/trades", description: "List trade proposals", queryParams: [
     { name: "sport", type: "NFL | NBA", required: false, description: "Sport filter (default: NBA)" },
   ], response: "TradeProposal[]", category: "Trade Machine" },
@@ -59,7 +69,7 @@ const endpoints: EndpointDoc[] = [
   ], response: "TeamBuilderSave[]", category: "Team Builder" },
   { method: "POST", path: "/api/team-builder-saves", description: "Save team builder state", bodySchema: "{ name: string, sport: string, state: object }", response: "TeamBuilderSave", category: "Team Builder" },
   { method: "DELETE", path: "/api/team-builder-saves/:id", description: "Delete a team builder save", response: "{ success: true }", category: "Team Builder" },
-  { method: "GET", path: "/api/nba-stats", description: "Get NBA season player statistics", response: "PlayerSeasonStats[]", category: "Stats" },
+  { method: "GET", path: "/api/nba-stats", description: "Get NBA season player statistics with TS%, eFG%, usage, per-36 rates and cap-joined value scores", response: "PlayerSeasonStats[]", category: "Stats" },
   { method: "POST", path: "/api/nba-stats/scrape", description: "Trigger NBA stats scrape from Basketball Reference", response: "{ success: true, count: number }", category: "Stats" },
   { method: "GET", path: "/api/nba-standings", description: "Get NBA team standings", response: "TeamStandings[]", category: "Stats" },
   { method: "POST", path: "/api/nba-standings/scrape", description: "Trigger NBA standings scrape", response: "{ success: true, count: number }", category: "Stats" },
@@ -67,6 +77,7 @@ const endpoints: EndpointDoc[] = [
     { name: "sport", type: "NFL | NBA", required: false, description: "Sport filter (default: NBA)" },
   ], response: "CollegeStats[]", category: "Stats" },
   { method: "POST", path: "/api/college-stats/scrape", description: "Trigger college stats scrape from Sports Reference", response: "{ success: true, count: number }", category: "Stats" },
+  { method: "POST", path: "/api/cache/warm", description: "Preload roster, teams, free agents, cap settings and NBA stats into the response cache (localhost only)", bodySchema: "{ sports?: (\"NFL\" | \"NBA\")[] }", response: "WarmReport", category: "System" },
 ];
 
 export function registerApiDocs(app: Express) {
@@ -10,7 +10,10 @@ class ResponseCache {
   private maxEntries = 500;
 
   set<T>(key: string, data: T, ttlMs = this.defaultTtl): void {
-    if (this.cache.size >= this.maxEntries) {
+    // Re-inserting moves a refreshed key to the back of the eviction order,
+    // and replacing an entry never needs to evict another.
+    const replaced = this.cache.delete(key);
+    if (!replaced && this.cache.size >= this.maxEntries) {
       const firstKey = this.cache.keys().next().value;
       if (firstKey) this.cache.delete(firstKey);
     }
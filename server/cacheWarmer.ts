@@ -0,0 +1,110 @@
+import type { Request, Response } from "express";
+import { responseCache } from "./cache";
+import { storage } from "./storage";
+import { getDefaultCapSettings } from "./tradeEngine";
+
+export interface HotPayload {
+  key: string;
+  ttlMs: number;
+  load: () => Promise<unknown>;
+}
+
+export interface WarmReport {
+  startedAt: string;
+  durationMs: number;
+  entries: { key: string; etag: string; ms: number }[];
+  failed: { key: string; error: string }[];
+}
+
+const WARM_CONCURRENCY = 4;
+const SPORTS = ["NBA", "NFL"];
+
+async function loadCapSettings(sport: string) {
+  const settings = await storage.getCapSettings(sport);
+  if (settings.length > 0) return settings;
+  const defaults = [];
+  for (let y = 2025; y <= 2031; y++) {
+    defaults.push({ year: y, sport, ...getDefaultCapSettings(y) });
+  }
+  return defaults;
+}
+
+// Cache key, TTL and loader for each hot GET route; the routes and the
+// warmer share these so a warmed entry is exactly what the route would cache.
+export const hotPayloads = {
+  teams: (sport: string): HotPayload => ({ key: `teams:${sport}`, ttlMs: 300000, load: () => storage.getTeams(sport) }),
+  freeAgents: (sport: string): HotPayload => ({ key: `free-agents:${sport}`, ttlMs: 300000, load: () => storage.getFreeAgents(sport) }),
+  roster: (sport: string, teamCode?: string): HotPayload => ({
+    key: `roster:${sport}:${teamCode || 'all'}`,
+    ttlMs: 120000,
+    load: () => storage.getRosterPlayers(sport, teamCode),
+  }),
+  nbaStats: (): HotPayload => ({ key: "nba-stats:NBA", ttlMs: 300000, load: () => storage.getPlayerSeasonStats("NBA") }),
+  capSettings: (sport: string): HotPayload => ({ key: `cap-settings:${sport}`, ttlMs: 300000, load: () => loadCapSettings(sport) }),
+};
+
+export async function sendCached(req: Request, res: Response, payload: HotPayload) {
+  let cached = responseCache.get(payload.key);
+  if (!cached) {
+    responseCache.set(payload.key, await payload.load(), payload.ttlMs);
+    cached = responseCache.get(payload.key)!;
+  }
+  res.set('ETag', cached.etag);
+  if (req.headers['if-none-match'] === cached.etag) return res.status(304).end();
+  res.json(cached.data);
+}
+
+// Per sport: teams, free agents, cap settings, the full roster and every
+// team's roster; NBA also gets the season stats.
+export async function hotTargets(sports: string[] = SPORTS): Promise<HotPayload[]> {
+  const targets: HotPayload[] = [];
+  for (const sport of sports) {
+    const teams = await storage.getTeams(sport);
+    targets.push(hotPayloads.teams(sport), hotPayloads.freeAgents(sport), hotPayloads.capSettings(sport), hotPayloads.roster(sport));
+    for (const team of teams) targets.push(hotPayloads.roster(sport, team.code));
+    if (sport === "NBA") targets.push(hotPayloads.nbaStats());
+  }
+  return targets;
+}
+
+let lastWarm: WarmReport | null = null;
+
+export function getLastCacheWarm(): WarmReport | null {
+  return lastWarm;
+}
+
+/**
+ * Loads each payload and stores it, with its ETag, in the response cache.
+ * Existing entries are replaced in place, so readers keep getting the old
+ * payload until the new one is ready and never fall through to Postgres.
+ */
+export async function warmCache(targets: HotPayload[], concurrency = WARM_CONCURRENCY): Promise<WarmReport> {
+  const startedAt = new Date();
+  const entries: WarmReport["entries"] = [];
+  const failed: WarmReport["failed"] = [];
+  let next = 0;
+
+  const worker = async () => {
+    while (next < targets.length) {
+      const target = targets[next++];
+      const start = Date.now();
+      try {
+        responseCache.set(target.key, await target.load(), target.ttlMs);
+        entries.push({ key: target.key, etag: responseCache.get(target.key)!.etag, ms: Date.now() - start });
+      } catch (err: any) {
+        failed.push({ key: target.key, error: err.message });
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(concurrency, targets.length) }, worker));
+
+  lastWarm = { startedAt: startedAt.toISOString(), durationMs: Date.now() - startedAt.getTime(), entries, failed };
+  return lastWarm;
+}
+
+export async function warmHotCache(sports: string[] = SPORTS): Promise<WarmReport> {
+  const report = await warmCache(await hotTargets(sports));
+  console.log(`[cache] Warmed ${report.entries.length} responses for ${sports.join(", ")} in ${report.durationMs}ms`
+    + (report.failed.length ? ` (${report.failed.length} failed)` : ""));
+  return report;
+}
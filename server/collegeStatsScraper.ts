@@ -1,4 +1,5 @@
 import * as cheerio from "cheerio";
+import { setTimeout as sleep } from "timers/promises";
 import type { InsertCollegeStats } from "@shared/schema";
 
 const CBB_BASE = "https://www.sports-reference.com/cbb";
@@ -105,10 +106,11 @@ function namesMatch(scraped: string, prospect: string): boolean {
   return false;
 }
 
-async function fetchWithRetry(url: string, retries = 3): Promise<string> {
+async function fetchWithRetry(url: string, signal?: AbortSignal, retries = 3): Promise<string> {
   for (let i = 0; i < retries; i++) {
     try {
       const res = await fetch(url, {
+        signal,
         headers: {
           "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
           "Accept": "text/html,application/xhtml+xml",
@@ -117,7 +119,7 @@ async function fetchWithRetry(url: string, retries = 3): Promise<string> {
       });
       if (res.status === 429) {
         console.log(`[college-scraper] Rate limited, waiting ${(i + 1) * 15}s...`);
-        await new Promise(r => setTimeout(r, (i + 1) * 15000));
+        await sleep((i + 1) * 15000, undefined, { signal });
         continue;
       }
       if (res.status === 404) {
@@ -126,8 +128,8 @@ async function fetchWithRetry(url: string, retries = 3): Promise<string> {
       if (!res.ok) throw new Error(`HTTP ${res.status}`);
       return await res.text();
     } catch (err: any) {
-      if (i === retries - 1) throw err;
-      await new Promise(r => setTimeout(r, 3000));
+      if (i === retries - 1 || signal?.aborted) throw err;
+      await sleep(3000, undefined, { signal });
     }
   }
   throw new Error("Max retries exceeded");
@@ -159,15 +161,15 @@ interface SchoolPage {
   }>;
 }
 
-async function scrapeSchoolPage(college: string, slug: string, seasonYear: string): Promise<SchoolPage> {
+async function scrapeSchoolPage(college: string, slug: string, seasonYear: string, signal?: AbortSignal): Promise<SchoolPage> {
   const url = `${CBB_BASE}/schools/${slug}/men/${seasonYear}.html`;
   console.log(`[college-scraper] Fetching ${college}: ${url}`);
 
-  const html = await fetchWithRetry(url);
+  const html = await fetchWithRetry(url, signal);
   if (!html) {
     console.log(`[college-scraper] ${college} page not found (404), trying previous year...`);
     const prevYear = String(parseInt(seasonYear) - 1);
-    const prevHtml = await fetchWithRetry(`${CBB_BASE}/schools/${slug}/men/${prevYear}.html`);
+    const prevHtml = await fetchWithRetry(`${CBB_BASE}/schools/${slug}/men/${prevYear}.html`, signal);
     if (!prevHtml) {
       console.log(`[college-scraper] ${college} not found for either year`);
       return { college, slug, players: [] };
@@ -226,7 +228,7 @@ function parseSchoolHtml(html: string, college: string, slug: string, seasonYear
   return { college, slug, players };
 }
 
-export async function scrapeCollegeStats(prospects: ProspectInfo[]): Promise<InsertCollegeStats[]> {
+export async function scrapeCollegeStats(prospects: ProspectInfo[], signal?: AbortSignal): Promise<InsertCollegeStats[]> {
   console.log(`[college-scraper] Starting college stats scrape for ${prospects.length} prospects...`);
 
   const collegeProspects = new Map<string, ProspectInfo[]>();
@@ -253,7 +255,7 @@ export async function scrapeCollegeStats(prospects: ProspectInfo[]): Promise<Ins
     if (!slug) continue;
 
     try {
-      const page = await scrapeSchoolPage(college, slug, CURRENT_SEASON_YEAR);
+      const page = await scrapeSchoolPage(college, slug, CURRENT_SEASON_YEAR, signal);
 
       for (const prospect of collegePlayers) {
         const match = page.players.find(p => namesMatch(p.name, prospect.name));
@@ -272,9 +274,11 @@ export async function scrapeCollegeStats(prospects: ProspectInfo[]): Promise<Ins
 
       scraped++;
       if (scraped < collegeProspects.size) {
-        await new Promise(r => setTimeout(r, 3000));
+        await sleep(3000, undefined, { signal });
       }
     } catch (err: any) {
+      // An aborted scrape stops here instead of moving on to the next school.
+      if (signal?.aborted) throw err;
       console.error(`[college-scraper] Error scraping ${college}: ${err.message}`);
     }
   }
@@ -1,7 +1,7 @@
 import express, { type Request, Response, NextFunction } from "express";
 import { registerRoutes } from "./routes";
 import { serveStatic } from "./static";
-import { createServer } from "http";
+import { createServer, type IncomingMessage, type ServerResponse } from "http";
 import { requestId, errorHandler } from "./middleware";
 import { logger } from "./logger";
 import { metrics } from "./metrics";
@@ -15,13 +15,15 @@ declare module "http" {
   }
 }
 
-app.use(
-  express.json({
-    verify: (req, _res, buf) => {
-      req.rawBody = buf;
-    },
-  }),
-);
+const keepRawBody = (req: IncomingMessage, _res: ServerResponse, buf: Buffer) => {
+  req.rawBody = buf;
+};
+
+// Batch trade validation posts many proposals at once; only that route gets
+// the larger body limit. Its body is parsed here, so the global parser skips it.
+app.post("/api/trades/validate-batch", express.json({ limit: "10mb", verify: keepRawBody }));
+
+app.use(express.json({ verify: keepRawBody }));
 
 app.use(express.urlencoded({ extended: false }));
 
@@ -0,0 +1,216 @@
+export interface SourceLimits {
+  concurrency: number;
+  minIntervalMs: number;
+}
+
+export interface JobContext {
+  attempt: number;
+  signal: AbortSignal;
+  results: ReadonlyMap<string, unknown>;
+}
+
+export interface JobDefinition<T = unknown> {
+  name: string;
+  source: string;
+  dependsOn?: string[];
+  timeoutMs?: number;
+  retries?: number;
+  retryDelayMs?: number;
+  run: (ctx: JobContext) => Promise<T>;
+}
+
+export type JobStatus = "succeeded" | "failed" | "timed_out" | "skipped";
+
+export interface JobRunRecord {
+  name: string;
+  source: string;
+  status: JobStatus;
+  attempts: number;
+  startedAt: string | null;
+  waitMs: number;
+  durationMs: number;
+  error?: string;
+}
+
+export interface JobRunReport {
+  startedAt: string;
+  finishedAt: string;
+  durationMs: number;
+  jobs: JobRunRecord[];
+}
+
+export class JobTimeoutError extends Error {
+  constructor(name: string, timeoutMs: number) {
+    super(`Job ${name} timed out after ${timeoutMs}ms`);
+    this.name = "JobTimeoutError";
+  }
+}
+
+const DEFAULT_RETRY_DELAY_MS = 1000;
+
+const sleep = (ms: number) => new Promise<void>(r => setTimeout(r, ms));
+
+// A source runs at most `concurrency` attempts at once and starts each one at
+// least `minIntervalMs` after the previous attempt on it started and after the
+// last one finished, so a one-at-a-time site sees that much idle time between
+// requests.
+class SourceLimiter {
+  private active = 0;
+  private waiting: (() => void)[] = [];
+  private nextStartAt = 0;
+
+  constructor(private readonly limits: SourceLimits) {}
+
+  async acquire(): Promise<void> {
+    if (this.active < this.limits.concurrency) {
+      this.active++;
+    } else {
+      await new Promise<void>(r => this.waiting.push(r));
+    }
+    const now = Date.now();
+    const startAt = Math.max(now, this.nextStartAt);
+    this.nextStartAt = startAt + this.limits.minIntervalMs;
+    if (startAt > now) await sleep(startAt - now);
+  }
+
+  release(): void {
+    this.nextStartAt = Math.max(this.nextStartAt, Date.now() + this.limits.minIntervalMs);
+    const next = this.waiting.shift();
+    if (next) next();
+    else this.active--;
+  }
+}
+
+function withTimeout<T>(job: JobDefinition<T>, running: Promise<T>, controller: AbortController): Promise<T> {
+  if (!job.timeoutMs) return running;
+  let timer: ReturnType<typeof setTimeout> | undefined;
+  const timeout = new Promise<never>((_, reject) => {
+    timer = setTimeout(() => {
+      controller.abort();
+      reject(new JobTimeoutError(job.name, job.timeoutMs!));
+    }, job.timeoutMs);
+  });
+  return Promise.race([running, timeout]).finally(() => clearTimeout(timer));
+}
+
+function validateJobs(jobs: JobDefinition<any>[], sources: Record<string, SourceLimits>): Map<string, JobDefinition<any>> {
+  const byName = new Map<string, JobDefinition<any>>();
+  for (const job of jobs) {
+    if (byName.has(job.name)) throw new Error(`Duplicate job ${job.name}`);
+    if (!sources[job.source]) throw new Error(`Job ${job.name} uses unknown source ${job.source}`);
+    byName.set(job.name, job);
+  }
+
+  const state = new Map<string, "visiting" | "done">();
+  const visit = (name: string, path: string[]) => {
+    if (state.get(name) === "done") return;
+    if (state.get(name) === "visiting") throw new Error(`Job dependency cycle: ${[...path, name].join(" -> ")}`);
+    state.set(name, "visiting");
+    for (const dep of byName.get(name)!.dependsOn ?? []) {
+      if (!byName.has(dep)) throw new Error(`Job ${name} depends on unknown job ${dep}`);
+      visit(dep, [...path, name]);
+    }
+    state.set(name, "done");
+  };
+  for (const name of Array.from(byName.keys())) visit(name, []);
+  return byName;
+}
+
+/**
+ * Run jobs as soon as their dependencies succeed. Each source caps how many of
+ * its jobs run at once and how long it idles between them; jobs on different
+ * sources run in parallel. A job whose dependency did not succeed is
+ * skipped. Results are passed to dependents through `ctx.results`.
+ */
+export async function runJobs(
+  jobs: JobDefinition<any>[],
+  sources: Record<string, SourceLimits>,
+): Promise<JobRunReport> {
+  const byName = validateJobs(jobs, sources);
+  const limiters = new Map<string, SourceLimiter>();
+  for (const [name, limits] of Object.entries(sources)) limiters.set(name, new SourceLimiter(limits));
+  const results = new Map<string, unknown>();
+  const runs = new Map<string, Promise<JobRunRecord>>();
+  const startedAt = Date.now();
+
+  const execute = async (job: JobDefinition<any>, readyAt: number): Promise<JobRunRecord> => {
+    const limiter = limiters.get(job.source)!;
+    const maxAttempts = (job.retries ?? 0) + 1;
+    let firstStart: number | null = null;
+    let lastError: unknown;
+
+    for (let attempt = 1; attempt <= maxAttempts; attempt++) {
+      await limiter.acquire();
+      firstStart ??= Date.now();
+      const controller = new AbortController();
+      const running = new Promise<unknown>(resolve => resolve(job.run({ attempt, signal: controller.signal, results })));
+      // The slot is held until the attempt itself settles, not just until it
+      // times out, so an abandoned attempt that ignores the abort never
+      // overlaps the retry or the source's next job.
+      running.then(() => limiter.release(), () => limiter.release());
+      try {
+        const result = await withTimeout(job, running, controller);
+        results.set(job.name, result);
+        return {
+          name: job.name,
+          source: job.source,
+          status: "succeeded",
+          attempts: attempt,
+          startedAt: new Date(firstStart).toISOString(),
+          waitMs: firstStart - readyAt,
+          durationMs: Date.now() - firstStart,
+        };
+      } catch (err) {
+        lastError = err;
+      }
+      if (attempt < maxAttempts) {
+        await sleep((job.retryDelayMs ?? DEFAULT_RETRY_DELAY_MS) * 2 ** (attempt - 1));
+      }
+    }
+
+    return {
+      name: job.name,
+      source: job.source,
+      status: lastError instanceof JobTimeoutError ? "timed_out" : "failed",
+      attempts: maxAttempts,
+      startedAt: firstStart === null ? null : new Date(firstStart).toISOString(),
+      waitMs: (firstStart ?? readyAt) - readyAt,
+      durationMs: firstStart === null ? 0 : Date.now() - firstStart,
+      error: lastError instanceof Error ? lastError.message : String(lastError),
+    };
+  };
+
+  const start = (name: string): Promise<JobRunRecord> => {
+    let run = runs.get(name);
+    if (!run) {
+      const job = byName.get(name)!;
+      run = Promise.all((job.dependsOn ?? []).map(start)).then((deps): JobRunRecord | Promise<JobRunRecord> => {
+        const blocked = deps.find(d => d.status !== "succeeded");
+        if (blocked) {
+          return {
+            name: job.name,
+            source: job.source,
+            status: "skipped",
+            attempts: 0,
+            startedAt: null,
+            waitMs: 0,
+            durationMs: 0,
+            error: `Dependency ${blocked.name} ${blocked.status}`,
+          };
+        }
+        return execute(job, Date.now());
+      });
+      runs.set(name, run);
+    }
+    return run;
+  };
+
+  const records = await Promise.all(jobs.map(job => start(job.name)));
+  const finishedAt = Date.now();
+  return {
+    startedAt: new Date(startedAt).toISOString(),
+    finishedAt: new Date(finishedAt).toISOString(),
+    durationMs: finishedAt - startedAt,
+    jobs: records,
+  };
+}
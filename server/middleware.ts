@@ -140,6 +140,13 @@ export function errorHandler(err: any, req: Request, res: Response, next: NextFu
   });
 }
 
+const LOOPBACK = new Set(["127.0.0.1", "::1", "::ffff:127.0.0.1"]);
+
+// A request made on this machine, not relayed by a proxy.
+export function isLocalRequest(req: Request): boolean {
+  return LOOPBACK.has(req.socket.remoteAddress ?? "") && !req.headers["x-forwarded-for"];
+}
+
 export function sanitizeString(input: string): string {
   return input.trim().replace(/\0/g, "");
 }
@@ -1,4 +1,5 @@
 import * as cheerio from "cheerio";
+import { setTimeout as sleep } from "timers/promises";
 import type { InsertPlayerSeasonStats } from "@shared/schema";
 
 const BBR_BASE = "https://www.basketball-reference.com";
@@ -26,10 +27,11 @@ function normalizeName(name: string): string {
     .trim();
 }
 
-async function fetchWithRetry(url: string, retries = 3): Promise<string> {
+async function fetchWithRetry(url: string, signal?: AbortSignal, retries = 3): Promise<string> {
   for (let i = 0; i < retries; i++) {
     try {
       const res = await fetch(url, {
+        signal,
         headers: {
           "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
           "Accept": "text/html,application/xhtml+xml",
@@ -38,14 +40,14 @@ async function fetchWithRetry(url: string, retries = 3): Promise<string> {
       });
       if (res.status === 429) {
         console.log(`[bbr-scraper] Rate limited, waiting ${(i + 1) * 10}s...`);
-        await new Promise(r => setTimeout(r, (i + 1) * 10000));
+        await sleep((i + 1) * 10000, undefined, { signal });
         continue;
       }
       if (!res.ok) throw new Error(`HTTP ${res.status}`);
       return await res.text();
     } catch (err: any) {
-      if (i === retries - 1) throw err;
-      await new Promise(r => setTimeout(r, 3000));
+      if (i === retries - 1 || signal?.aborted) throw err;
+      await sleep(3000, undefined, { signal });
     }
   }
   throw new Error("Max retries exceeded");
@@ -63,11 +65,11 @@ function parseInt2(val: string | undefined): number | null {
   return isNaN(n) ? null : n;
 }
 
-export async function scrapeNBAPerGameStats(): Promise<InsertPlayerSeasonStats[]> {
+export async function scrapeNBAPerGameStats(signal?: AbortSignal): Promise<InsertPlayerSeasonStats[]> {
   console.log("[bbr-scraper] Fetching NBA per-game stats from Basketball Reference...");
 
   const url = `${BBR_BASE}/leagues/NBA_2026_per_game.html`;
-  const html = await fetchWithRetry(url);
+  const html = await fetchWithRetry(url, signal);
   const $ = cheerio.load(html);
 
   const stats: InsertPlayerSeasonStats[] = [];
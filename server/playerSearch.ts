@@ -0,0 +1,162 @@
+import fs from "fs";
+import path from "path";
+import { gunzip } from "zlib";
+import { promisify } from "util";
+
+const gunzipAsync = promisify(gunzip);
+
+// Written by `python -m pipeline search-index`; see pipeline/search_index.py.
+export const PLAYER_SEARCH_INDEX = path.resolve(process.cwd(), "server", "data", "playerSearch.json.gz");
+export const SEARCH_INDEX_VERSION = 1;
+
+const GRAM = 3;
+// Share of the query's trigrams a misspelled name must contain.
+const MIN_GRAM_OVERLAP = 0.5;
+
+const DICTIONARY_COLUMNS = ["kind", "sport", "team", "position"] as const;
+
+export type PlayerSearchKind = "roster" | "freeAgent" | "prospect";
+
+interface SortedKeys {
+  keys: string[];
+  entries: number[];
+}
+
+export interface SearchIndexArtifact {
+  version: number;
+  count: number;
+  dictionaries: Record<(typeof DICTIONARY_COLUMNS)[number], string[]>;
+  columns: Record<(typeof DICTIONARY_COLUMNS)[number], number[]> & {
+    id: (number | null)[];
+    name: string[];
+  };
+  names: SortedKeys;
+  tokens: SortedKeys;
+  grams: Record<string, number[]>;
+}
+
+export interface PlayerSearchResult {
+  id: number | null;
+  name: string;
+  kind: PlayerSearchKind;
+  sport: string;
+  team: string;
+  position: string;
+}
+
+export interface PlayerSearchIndex {
+  entries: PlayerSearchResult[];
+  names: SortedKeys;
+  tokens: SortedKeys;
+  grams: Map<string, number[]>;
+}
+
+// Mirrors pipeline/search_index.py search_key.
+export function searchKey(name: string): string {
+  return name
+    .replace(/ø/g, "o").replace(/Ø/g, "O").replace(/đ/g, "d").replace(/Đ/g, "D")
+    .normalize("NFKD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .toLowerCase()
+    .replace(/[.'’]/g, "")
+    .replace(/-/g, " ")
+    .replace(/\s+/g, " ")
+    .trim();
+}
+
+export function prepareSearchIndex(artifact: SearchIndexArtifact): PlayerSearchIndex {
+  if (artifact.version !== SEARCH_INDEX_VERSION) {
+    throw new Error(`Unsupported player search index version ${artifact.version}`);
+  }
+  const { dictionaries, columns } = artifact;
+  const entries: PlayerSearchResult[] = [];
+  for (let i = 0; i < artifact.count; i++) {
+    entries.push({
+      id: columns.id[i],
+      name: columns.name[i],
+      kind: dictionaries.kind[columns.kind[i]] as PlayerSearchKind,
+      sport: dictionaries.sport[columns.sport[i]],
+      team: dictionaries.team[columns.team[i]],
+      position: dictionaries.position[columns.position[i]],
+    });
+  }
+  return { entries, names: artifact.names, tokens: artifact.tokens, grams: new Map(Object.entries(artifact.grams)) };
+}
+
+function lowerBound(keys: string[], q: string): number {
+  let lo = 0;
+  let hi = keys.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (keys[mid] < q) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+/**
+ * Typeahead lookup: players whose name (or an alias) starts with the query,
+ * then players with a later word starting with it ("dort", "jones"), then,
+ * when those leave room, names sharing most of the query's trigrams so a
+ * misspelling still finds the player.
+ */
+export function searchPlayers(
+  index: PlayerSearchIndex,
+  query: string,
+  opts: { sport?: string; kind?: PlayerSearchKind; limit?: number } = {},
+): PlayerSearchResult[] {
+  const q = searchKey(query);
+  const limit = opts.limit ?? 10;
+  const results: PlayerSearchResult[] = [];
+  if (!q) return results;
+
+  const seen = new Set<number>();
+  const accept = (i: number) => {
+    if (seen.has(i)) return;
+    seen.add(i);
+    const entry = index.entries[i];
+    if (opts.sport && entry.sport !== opts.sport) return;
+    if (opts.kind && entry.kind !== opts.kind) return;
+    results.push(entry);
+  };
+
+  for (const list of [index.names, index.tokens]) {
+    for (let j = lowerBound(list.keys, q); j < list.keys.length && list.keys[j].startsWith(q); j++) {
+      if (results.length >= limit) return results;
+      accept(list.entries[j]);
+    }
+  }
+  if (results.length >= limit || q.length < GRAM) return results;
+
+  const padded = ` ${q}`;
+  const grams = new Set<string>();
+  for (let i = 0; i + GRAM <= padded.length; i++) grams.add(padded.slice(i, i + GRAM));
+  const shared = new Map<number, number>();
+  for (const gram of Array.from(grams)) {
+    for (const i of index.grams.get(gram) ?? []) {
+      if (!seen.has(i)) shared.set(i, (shared.get(i) ?? 0) + 1);
+    }
+  }
+  const minShared = Math.ceil(grams.size * MIN_GRAM_OVERLAP);
+  const fuzzy = Array.from(shared.entries())
+    .filter(([, n]) => n >= minShared)
+    .sort((a, b) => b[1] - a[1] || a[0] - b[0]);
+  for (const [i] of fuzzy) {
+    if (results.length >= limit) break;
+    accept(i);
+  }
+  return results;
+}
+
+let cached: { file: string; mtimeMs: number; index: PlayerSearchIndex } | null = null;
+
+// Re-read when the pipeline rewrites the file, so a rebuilt index is served
+// without restarting the server.
+export async function loadSearchIndex(file: string = PLAYER_SEARCH_INDEX): Promise<PlayerSearchIndex> {
+  const { mtimeMs } = await fs.promises.stat(file);
+  if (cached && cached.file === file && cached.mtimeMs === mtimeMs) return cached.index;
+  const raw = await gunzipAsync(await fs.promises.readFile(file));
+  const index = prepareSearchIndex(JSON.parse(raw.toString("utf-8")));
+  cached = { file, mtimeMs, index };
+  return index;
+}
@@ -0,0 +1,64 @@
+import fs from "fs";
+import path from "path";
+import { gunzip } from "zlib";
+import { promisify } from "util";
+import type { InsertRosterPlayer } from "@shared/schema";
+
+const gunzipAsync = promisify(gunzip);
+
+// Written by `python -m pipeline roster-artifact` (and by every pipeline
+// command that rewrites the TS seed); see pipeline/roster_artifact.py.
+export const NBA_ROSTER_ARTIFACT = path.resolve(process.cwd(), "server", "data", "nbaRosters2026.json.gz");
+export const ROSTER_ARTIFACT_VERSION = 1;
+
+const DICTIONARY_COLUMNS = ["teamCode", "position", "status", "optionType"] as const;
+const PLAIN_COLUMNS = ["name", "depthOrder", "age", "capHit", "contractYears", "contractEndYear"] as const;
+
+export interface RosterArtifact {
+  version: number;
+  sport: string;
+  count: number;
+  dictionaries: Record<(typeof DICTIONARY_COLUMNS)[number], string[]>;
+  columns: Record<(typeof DICTIONARY_COLUMNS)[number], number[]> & {
+    name: string[];
+    depthOrder: number[];
+    age: number[];
+    capHit: number[];
+    contractYears: number[];
+    contractEndYear: (number | null)[];
+    salaryStart: (number | null)[];
+    salaries: number[][];
+  };
+}
+
+export function decodeRosterArtifact(artifact: RosterArtifact): InsertRosterPlayer[] {
+  if (artifact.version !== ROSTER_ARTIFACT_VERSION) {
+    throw new Error(`Unsupported roster artifact version ${artifact.version}`);
+  }
+  const { dictionaries, columns } = artifact;
+  const rows: InsertRosterPlayer[] = [];
+  for (let i = 0; i < artifact.count; i++) {
+    const row: Record<string, unknown> = { sport: artifact.sport };
+    for (const key of DICTIONARY_COLUMNS) row[key] = dictionaries[key][columns[key][i]];
+    for (const key of PLAIN_COLUMNS) row[key] = columns[key][i];
+    const start = columns.salaryStart[i];
+    const salaryByYear: Record<string, number> = {};
+    if (start !== null) columns.salaries[i].forEach((amount, j) => { salaryByYear[String(start + j)] = amount; });
+    row.salaryByYear = salaryByYear;
+    rows.push(row as InsertRosterPlayer);
+  }
+  return rows;
+}
+
+let cached: { file: string; mtimeMs: number; rows: InsertRosterPlayer[] } | null = null;
+
+// Read lazily on first use and re-read when the file changes, so a refreshed
+// artifact is picked up without rebuilding or restarting the server.
+export async function loadRosterArtifact(file: string = NBA_ROSTER_ARTIFACT): Promise<InsertRosterPlayer[]> {
+  const { mtimeMs } = await fs.promises.stat(file);
+  if (cached && cached.file === file && cached.mtimeMs === mtimeMs) return cached.rows;
+  const raw = await gunzipAsync(await fs.promises.readFile(file));
+  const rows = decodeRosterArtifact(JSON.parse(raw.toString("utf-8")));
+  cached = { file, mtimeMs, rows };
+  return rows;
+}
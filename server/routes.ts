@@ -1,5 +1,7 @@
 import type { Express } from "express";
 import { createServer, type Server } from "http";
+import fs from "fs";
+import path from "path";
 import { eq } from "drizzle-orm";
 import { storage, db } from "./storage";
 import { draftLiveService } from "./draftLive";
@@ -8,14 +10,17 @@ import { generateCode, setupDraftSessionWS } from "./draftSession";
 import { prospects2026 } from "./prospects2026";
 import { nbaTeams2026, nbaDraftOrder2026, nbaProspects2026, nbaFreeAgents2026 } from "./nbaData2026";
 import { nflRosters2026 } from "./rosterData2026";
-import { nbaRosters2026 } from "./nbaRosterData2026";
-import { validateTrade, getDefaultCapSettings, getTeamTaxStatus, type TradeTeamState } from "./tradeEngine";
+import { loadRosterArtifact } from "./rosterArtifact";
+import { loadSearchIndex, searchPlayers, type PlayerSearchIndex } from "./playerSearch";
+import { validateTrade, validateTradeBatch, buildTeamCapTable, getDefaultCapSettings, getTeamTaxStatus, type TradeTeamState, type TeamCapTable } from "./tradeEngine";
 import { syncRosterTeams } from "./balldontlie";
 import { z } from "zod";
-import { asyncHandler, NotFoundError } from "./middleware";
+import { asyncHandler, AppError, NotFoundError, isLocalRequest } from "./middleware";
 import { registerApiDocs } from "./apiDocs";
 import { metrics } from "./metrics";
 import { responseCache } from "./cache";
+import { getLastSchedulerRun } from "./scheduler";
+import { hotPayloads, sendCached, warmCache, warmHotCache, getLastCacheWarm } from "./cacheWarmer";
 
 function buildNflDraftOrder2026(): { year: number; pickNumber: number; round: number; teamCode: string }[] {
   return [
@@ -72,10 +77,20 @@ export async function registerRoutes(
       timestamp: new Date().toISOString(),
       uptime: process.uptime(),
       memory: process.memoryUsage(),
-      cache: responseCache.stats(),
+      cache: { ...responseCache.stats(), lastWarm: getLastCacheWarm() },
+      lastScheduledRun: getLastSchedulerRun(),
     });
   });
 
+  // Run by `python -m pipeline warm-cache` at the end of a data refresh.
+  app.post("/api/cache/warm", asyncHandler(async (req, res) => {
+    if (!isLocalRequest(req)) throw new AppError("Cache warm-up is only available from localhost", 403);
+    const { sports } = z.object({
+      sports: z.array(z.enum(["NFL", "NBA"])).min(1).default(["NBA", "NFL"]),
+    }).parse(req.body ?? {});
+    res.json(await warmHotCache(sports));
+  }));
+
   const sportQuerySchema = z.object({
     sport: z.enum(["NFL", "NBA"]).default("NFL"),
     year: z.coerce.number().optional(),
@@ -99,16 +114,7 @@ export async function registerRoutes(
   // Teams
   app.get("/api/teams", asyncHandler(async (req, res) => {
     const { sport } = sportQuerySchema.parse(req.query);
-    const cacheKey = `teams:${sport}`;
-    const cached = responseCache.get(cacheKey);
-    if (cached) {
-      res.set('ETag', cached.etag);
-      if (req.headers['if-none-match'] === cached.etag) return res.status(304).end();
-      return res.json(cached.data);
-    }
-    const teams = await storage.getTeams(sport);
-    responseCache.set(cacheKey, teams, 300000);
-    res.json(teams);
+    await sendCached(req, res, hotPayloads.teams(sport));
   }));
 
   app.get("/api/teams/:code", asyncHandler(async (req, res) => {
@@ -121,32 +127,34 @@ export async function registerRoutes(
   // Free Agents
   app.get("/api/free-agents", asyncHandler(async (req, res) => {
     const { sport } = sportQuerySchema.parse(req.query);
-    const cacheKey = `free-agents:${sport}`;
-    const cached = responseCache.get(cacheKey);
-    if (cached) {
-      res.set('ETag', cached.etag);
-      if (req.headers['if-none-match'] === cached.etag) return res.status(304).end();
-      return res.json(cached.data);
-    }
-    const agents = await storage.getFreeAgents(sport);
-    responseCache.set(cacheKey, agents, 300000);
-    res.json(agents);
+    await sendCached(req, res, hotPayloads.freeAgents(sport));
   }));
 
   // Roster / Depth Chart
   app.get("/api/roster", asyncHandler(async (req, res) => {
     const { sport } = sportQuerySchema.parse(req.query);
     const teamCode = req.query.team as string | undefined;
-    const cacheKey = `roster:${sport}:${teamCode || 'all'}`;
-    const cached = responseCache.get(cacheKey);
-    if (cached) {
-      res.set('ETag', cached.etag);
-      if (req.headers['if-none-match'] === cached.etag) return res.status(304).end();
-      return res.json(cached.data);
+    await sendCached(req, res, hotPayloads.roster(sport, teamCode));
+  }));
+
+  // Player-name typeahead over the index written by `python -m pipeline search-index`
+  const playerSearchQuerySchema = z.object({
+    q: z.string().min(1).max(100),
+    sport: z.enum(["NFL", "NBA"]).optional(),
+    kind: z.enum(["roster", "freeAgent", "prospect"]).optional(),
+    limit: z.coerce.number().int().min(1).max(50).default(10),
+  });
+
+  app.get("/api/players/search", asyncHandler(async (req, res) => {
+    const { q, ...opts } = playerSearchQuerySchema.parse(req.query);
+    let index: PlayerSearchIndex;
+    try {
+      index = await loadSearchIndex();
+    } catch (err: any) {
+      if (err.code === "ENOENT") throw new NotFoundError("No player search index has been built");
+      throw err;
     }
-    const roster = await storage.getRosterPlayers(sport, teamCode);
-    responseCache.set(cacheKey, roster, 120000);
-    res.json(roster);
+    res.json(searchPlayers(index, q, opts));
   }));
 
   // Draft Order
@@ -164,6 +172,28 @@ export async function registerRoutes(
     res.json(order);
   }));
 
+  // Landing-spot odds written by `python -m pipeline simulate-draft`
+  app.get("/api/draft-odds", asyncHandler(async (req, res) => {
+    const { sport } = sportQuerySchema.parse(req.query);
+    const cacheKey = `draft-odds:${sport}`;
+    const cached = responseCache.get(cacheKey);
+    if (cached) {
+      res.set('ETag', cached.etag);
+      if (req.headers['if-none-match'] === cached.etag) return res.status(304).end();
+      return res.json(cached.data);
+    }
+    const file = path.resolve(process.cwd(), "server", "data", `draft-odds-${sport.toLowerCase()}.json`);
+    let odds: unknown;
+    try {
+      odds = JSON.parse(await fs.promises.readFile(file, "utf-8"));
+    } catch (err: any) {
+      if (err.code === "ENOENT") throw new NotFoundError(`No ${sport} draft odds have been simulated`);
+      throw err;
+    }
+    responseCache.set(cacheKey, odds, 300000);
+    res.json(odds);
+  }));
+
   // Mock Drafts
   app.get("/api/mock-drafts", asyncHandler(async (req, res) => {
     const { sport } = sportQuerySchema.parse(req.query);
@@ -340,6 +370,7 @@ export async function registerRoutes(
     if (existingRoster.length === 0) {
       await storage.createRosterPlayers(nflRosters2026);
     }
+    await warmHotCache(["NFL"]);
 
     res.json({ message: "Database seeded successfully" });
   }));
@@ -431,6 +462,7 @@ export async function registerRoutes(
 
       const draftOrderData = buildNflDraftOrder2026();
       await storage.createDraftOrderEntries(draftOrderData);
+      await warmHotCache(["NFL"]);
 
       res.json({ message: "Data refreshed successfully" });
   }));
@@ -458,8 +490,10 @@ export async function registerRoutes(
       })));
       await storage.createFreeAgents(nbaFreeAgents2026);
       await storage.createDraftOrderEntries(nbaDraftOrder2026);
-      await storage.createRosterPlayers(nbaRosters2026);
-      res.json({ message: "NBA data seeded successfully", roster: nbaRosters2026.length });
+      const nbaRosters = await loadRosterArtifact();
+      await storage.createRosterPlayers(nbaRosters);
+      await warmHotCache(["NBA"]);
+      res.json({ message: "NBA data seeded successfully", roster: nbaRosters.length });
   }));
 
   app.post("/api/reseed-nba", asyncHandler(async (_req, res) => {
@@ -487,8 +521,10 @@ export async function registerRoutes(
       })));
       await storage.createFreeAgents(nbaFreeAgents2026);
       await storage.createDraftOrderEntries(nbaDraftOrder2026);
-      await storage.createRosterPlayers(nbaRosters2026);
-      res.json({ message: "NBA data reseeded successfully", prospects: nbaProspects2026.length, teams: nbaTeams2026.length, freeAgents: nbaFreeAgents2026.length, roster: nbaRosters2026.length });
+      const nbaRosters = await loadRosterArtifact();
+      await storage.createRosterPlayers(nbaRosters);
+      await warmHotCache(["NBA"]);
+      res.json({ message: "NBA data reseeded successfully", prospects: nbaProspects2026.length, teams: nbaTeams2026.length, freeAgents: nbaFreeAgents2026.length, roster: nbaRosters.length });
   }));
 
   app.post("/api/reseed-prospects", asyncHandler(async (_req, res) => {
@@ -500,6 +536,7 @@ export async function registerRoutes(
   app.post("/api/reseed-roster", asyncHandler(async (_req, res) => {
       await db.delete(rosterPlayers);
       await storage.createRosterPlayers(nflRosters2026);
+      await warmHotCache();
       res.json({ message: "Roster data refreshed successfully", count: nflRosters2026.length });
   }));
 
@@ -579,16 +616,7 @@ export async function registerRoutes(
 
   app.get("/api/cap-settings", asyncHandler(async (req, res) => {
     const sport = (req.query.sport as string) || "NBA";
-    const settings = await storage.getCapSettings(sport);
-    if (settings.length === 0) {
-      const defaults = [];
-      for (let y = 2025; y <= 2031; y++) {
-        defaults.push({ year: y, sport, ...getDefaultCapSettings(y) });
-      }
-      res.json(defaults);
-    } else {
-      res.json(settings);
-    }
+    await sendCached(req, res, hotPayloads.capSettings(sport));
   }));
 
   const capSettingsBodySchema = z.object({
@@ -614,6 +642,27 @@ export async function registerRoutes(
     year: z.number().optional(),
   });
 
+  const tradeAssetSchemas = {
+    playersOut: z.array(z.object({ id: z.number(), name: z.string(), salary: z.number() })),
+    playersIn: z.array(z.object({ id: z.number(), name: z.string(), salary: z.number() })),
+    picksOut: z.array(z.object({ id: z.number(), description: z.string() })),
+    picksIn: z.array(z.object({ id: z.number(), description: z.string() })),
+  };
+
+  const tradeValidateBatchSchema = z.object({
+    proposals: z.array(z.object({
+      id: z.union([z.string(), z.number()]).optional(),
+      teams: z.array(z.object({ teamCode: z.string(), ...tradeAssetSchemas })).min(2).max(4),
+    })).min(1).max(10000),
+    teams: z.array(z.object({
+      teamCode: z.string(),
+      currentSalary: z.number(),
+      capSpace: z.number().default(0),
+      rosterSize: z.number(),
+    })).optional(),
+    year: z.number().optional(),
+  });
+
   const tradeCreateSchema = z.object({
     name: z.string(),
     sport: z.string().default("NBA"),
@@ -638,6 +687,7 @@ export async function registerRoutes(
         minSalary: minSalary ?? 1.1,
         maxSalary: maxSalary ?? 51.4,
       });
+      await warmCache([hotPayloads.capSettings(sport)]);
       res.json(result);
   }));
 
@@ -657,6 +707,7 @@ export async function registerRoutes(
         });
         results.push(result);
       }
+      await warmCache([hotPayloads.capSettings("NBA")]);
       res.json({ message: "Cap settings seeded", count: results.length });
   }));
 
@@ -668,6 +719,20 @@ export async function registerRoutes(
       res.json(result);
   }));
 
+  app.post("/api/trades/validate-batch", asyncHandler(async (req, res) => {
+      const parsed = tradeValidateBatchSchema.safeParse(req.body);
+      if (!parsed.success) return res.status(400).json({ error: parsed.error.message });
+      const { proposals, teams: teamStates, year = 2026 } = parsed.data;
+      let teamTable: TeamCapTable;
+      if (teamStates) {
+        teamTable = new Map(teamStates.map((t) => [t.teamCode, t]));
+      } else {
+        const [roster, nbaTeams] = await Promise.all([storage.getRosterPlayers("NBA"), storage.getTeams("NBA")]);
+        teamTable = buildTeamCapTable(roster, nbaTeams);
+      }
+      res.json(validateTradeBatch(proposals, teamTable, year));
+  }));
+
   app.get("/api/trades", asyncHandler(async (req, res) => {
     const sport = (req.query.sport as string) || "NBA";
     const proposals = await storage.getTradeProposals(sport);
@@ -787,15 +852,15 @@ export async function registerRoutes(
   }));
 
   // ===== NBA Season Stats Routes =====
-  app.get("/api/nba-stats", asyncHandler(async (_req, res) => {
-      const stats = await storage.getPlayerSeasonStats("NBA");
-      res.json(stats);
+  app.get("/api/nba-stats", asyncHandler(async (req, res) => {
+      await sendCached(req, res, hotPayloads.nbaStats());
   }));
 
   app.post("/api/nba-stats/scrape", asyncHandler(async (_req, res) => {
       const { scrapeNBAPerGameStats } = await import("./nbaStatsScraper");
       const stats = await scrapeNBAPerGameStats();
       await storage.upsertPlayerSeasonStats(stats);
+      await warmCache([hotPayloads.nbaStats()]);
       res.json({ success: true, count: stats.length });
   }));
 
@@ -1,53 +1,123 @@
 import cron from "node-cron";
+import { runJobs, type JobDefinition, type JobRunReport, type SourceLimits } from "./jobRunner";
 
 let schedulerStarted = false;
+let lastRun: JobRunReport | null = null;
 
-export function startScheduler() {
-  if (schedulerStarted) return;
-  schedulerStarted = true;
+// Each upstream site gets its own lane so the sites scrape in parallel; within
+// a site, scrapes still go one at a time with 5 s between the end of one and
+// the start of the next, as before.
+const SOURCES: Record<string, SourceLimits> = {
+  "basketball-reference": { concurrency: 1, minIntervalMs: 5000 },
+  "sports-reference-cbb": { concurrency: 1, minIntervalMs: 5000 },
+  database: { concurrency: 4, minIntervalMs: 0 },
+};
 
-  cron.schedule("0 0 * * *", async () => {
-    console.log("[scheduler] Starting nightly NBA data scrape (midnight PST)...");
+type ProspectInfo = { name: string; college: string };
 
-    try {
-      const { scrapeNBAPerGameStats } = await import("./nbaStatsScraper");
-      const { storage } = await import("./storage");
-      const stats = await scrapeNBAPerGameStats();
-      await storage.upsertPlayerSeasonStats(stats);
-      console.log(`[scheduler] Successfully scraped ${stats.length} player stat lines`);
-    } catch (err: any) {
-      console.error("[scheduler] Player stats scrape failed:", err.message);
-    }
+function nightlyJobs(): JobDefinition<any>[] {
+  return [
+    {
+      name: "nba-stats",
+      source: "basketball-reference",
+      timeoutMs: 180000,
+      retries: 1,
+      retryDelayMs: 30000,
+      run: async ({ signal }) => {
+        const { scrapeNBAPerGameStats } = await import("./nbaStatsScraper");
+        const { storage } = await import("./storage");
+        const stats = await scrapeNBAPerGameStats(signal);
+        signal.throwIfAborted();
+        await storage.upsertPlayerSeasonStats(stats);
+        console.log(`[scheduler] Successfully scraped ${stats.length} player stat lines`);
+        return stats.length;
+      },
+    },
+    {
+      name: "nba-standings",
+      source: "basketball-reference",
+      timeoutMs: 180000,
+      retries: 1,
+      retryDelayMs: 30000,
+      run: async ({ signal }) => {
+        const { scrapeNBAStandings } = await import("./nbaStandingsScraper");
+        const { storage } = await import("./storage");
+        const standings = await scrapeNBAStandings(signal);
+        signal.throwIfAborted();
+        await storage.upsertTeamStandings(standings);
+        console.log(`[scheduler] Successfully scraped ${standings.length} team standings`);
+        return standings.length;
+      },
+    },
+    {
+      name: "warm-cache",
+      source: "database",
+      dependsOn: ["nba-stats"],
+      timeoutMs: 60000,
+      run: async () => {
+        const { warmHotCache } = await import("./cacheWarmer");
+        const report = await warmHotCache(["NBA"]);
+        return report.entries.length;
+      },
+    },
+    {
+      name: "prospects",
+      source: "database",
+      timeoutMs: 30000,
+      retries: 2,
+      run: async (): Promise<ProspectInfo[]> => {
+        const { storage } = await import("./storage");
+        const allProspects = await storage.getProspects("NBA");
+        return allProspects
+          .filter(p => p.college && p.college !== "International" && p.college !== "N/A")
+          .map(p => ({ name: p.name, college: p.college! }));
+      },
+    },
+    {
+      name: "college-stats",
+      source: "sports-reference-cbb",
+      dependsOn: ["prospects"],
+      timeoutMs: 1800000,
+      run: async ({ results, signal }) => {
+        const { scrapeCollegeStats } = await import("./collegeStatsScraper");
+        const { storage } = await import("./storage");
+        const collegeData = await scrapeCollegeStats(results.get("prospects") as ProspectInfo[], signal);
+        signal.throwIfAborted();
+        await storage.upsertCollegeStats(collegeData);
+        console.log(`[scheduler] Successfully scraped ${collegeData.length} college stat lines`);
+        return collegeData.length;
+      },
+    },
+  ];
+}
 
-    await new Promise(r => setTimeout(r, 5000));
+export function getLastSchedulerRun(): JobRunReport | null {
+  return lastRun;
+}
 
-    try {
-      const { scrapeNBAStandings } = await import("./nbaStandingsScraper");
-      const { storage } = await import("./storage");
-      const standings = await scrapeNBAStandings();
-      await storage.upsertTeamStandings(standings);
-      console.log(`[scheduler] Successfully scraped ${standings.length} team standings`);
-    } catch (err: any) {
-      console.error("[scheduler] Standings scrape failed:", err.message);
-    }
+export async function runNightlyScrape(): Promise<JobRunReport> {
+  const report = await runJobs(nightlyJobs(), SOURCES);
+  for (const job of report.jobs) {
+    if (job.status === "succeeded") continue;
+    console.error(`[scheduler] ${job.name} ${job.status} after ${job.attempts} attempt(s): ${job.error}`);
+  }
+  const timings = report.jobs.map(j => `${j.name} ${(j.durationMs / 1000).toFixed(1)}s`).join(", ");
+  console.log(`[scheduler] Nightly scrape complete in ${(report.durationMs / 1000).toFixed(1)}s (${timings})`);
+  lastRun = report;
+  return report;
+}
 
-    await new Promise(r => setTimeout(r, 10000));
+export function startScheduler() {
+  if (schedulerStarted) return;
+  schedulerStarted = true;
 
+  cron.schedule("0 0 * * *", async () => {
+    console.log("[scheduler] Starting nightly NBA data scrape (midnight PST)...");
     try {
-      const { scrapeCollegeStats } = await import("./collegeStatsScraper");
-      const { storage } = await import("./storage");
-      const allProspects = await storage.getProspects("NBA");
-      const prospectInfos = allProspects
-        .filter(p => p.college && p.college !== "International" && p.college !== "N/A")
-        .map(p => ({ name: p.name, college: p.college! }));
-      const collegeData = await scrapeCollegeStats(prospectInfos);
-      await storage.upsertCollegeStats(collegeData);
-      console.log(`[scheduler] Successfully scraped ${collegeData.length} college stat lines`);
+      await runNightlyScrape();
     } catch (err: any) {
-      console.error("[scheduler] College stats scrape failed:", err.message);
+      console.error("[scheduler] Nightly scrape failed:", err.message);
     }
-
-    console.log("[scheduler] Nightly scrape complete");
   }, {
     timezone: "America/Los_Angeles",
   });
@@ -20,6 +20,7 @@ import {
   type CollegeStats, type InsertCollegeStats,
   collegeStats,
 } from "@shared/schema";
+import { computeAdvancedStats, capHitLookup } from "./advancedStats";
 
 const pool = new pg.Pool({ connectionString: process.env.DATABASE_URL });
 export const db = drizzle(pool);
@@ -311,10 +312,13 @@ export class DatabaseStorage implements IStorage {
   async upsertPlayerSeasonStats(stats: InsertPlayerSeasonStats[]): Promise<void> {
     if (stats.length === 0) return;
     await db.transaction(async (tx) => {
+      const roster = await tx.select({ name: rosterPlayers.name, teamCode: rosterPlayers.teamCode, capHit: rosterPlayers.capHit })
+        .from(rosterPlayers).where(eq(rosterPlayers.sport, "NBA"));
+      const rows = computeAdvancedStats(stats, capHitLookup(roster));
       await tx.delete(playerSeasonStats).where(eq(playerSeasonStats.sport, "NBA"));
       const BATCH = 50;
-      for (let i = 0; i < stats.length; i += BATCH) {
-        const batch = stats.slice(i, i + BATCH);
+      for (let i = 0; i < rows.length; i += BATCH) {
+        const batch = rows.slice(i, i + BATCH);
         await tx.insert(playerSeasonStats).values(batch);
       }
     });
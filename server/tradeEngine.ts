@@ -124,12 +124,67 @@ function calculateMaxIncoming(
   return { maxAllowed, taxStatus };
 }
 
-export function validateTrade(
-  teams: TradeTeamState[],
-  year: number,
-  capSettings?: CapSettingOverrides
-): TradeValidationResult {
-  const caps = resolveCapSettings(year, capSettings);
+type ResolvedCapSettings = { salaryCap: number; taxLine: number; firstApron: number; secondApron: number };
+
+function evaluateTeam(
+  team: TradeTeamState,
+  caps: ResolvedCapSettings
+): TradeValidationResult["teamResults"][number] {
+  const reasons: string[] = [];
+
+  let salaryOut = 0;
+  for (const p of team.playersOut) salaryOut += p.salary;
+  let salaryIn = 0;
+  for (const p of team.playersIn) salaryIn += p.salary;
+  const netChange = salaryIn - salaryOut;
+
+  const rosterSizeAfter = team.rosterSize - team.playersOut.length + team.playersIn.length;
+
+  if (rosterSizeAfter < MIN_ROSTER_SIZE) {
+    reasons.push(`Roster would drop to ${rosterSizeAfter} players (minimum ${MIN_ROSTER_SIZE}).`);
+  }
+  if (rosterSizeAfter > MAX_ROSTER_SIZE) {
+    reasons.push(`Roster would increase to ${rosterSizeAfter} players (maximum ${MAX_ROSTER_SIZE}).`);
+  }
+
+  const postTradeSalary = team.currentSalary + netChange;
+  const { maxAllowed, taxStatus } = calculateMaxIncoming(salaryOut, postTradeSalary, caps);
+
+  if (salaryIn > maxAllowed + 0.001) {
+    const formatM = (v: number) => `$${v.toFixed(1)}M`;
+    if (taxStatus === "under_cap") {
+      reasons.push(
+        `Team is under the cap but incoming salary (${formatM(salaryIn)}) exceeds available cap room (${formatM(maxAllowed)}).`
+      );
+    } else if (taxStatus === "second_apron") {
+      reasons.push(
+        `Team is above the second apron — incoming salary (${formatM(salaryIn)}) must not exceed outgoing (${formatM(salaryOut)}).`
+      );
+    } else if (taxStatus === "first_apron") {
+      reasons.push(
+        `Team is at/above the first apron — incoming salary (${formatM(salaryIn)}) exceeds 110% + $100K of outgoing (${formatM(maxAllowed)}).`
+      );
+    } else {
+      reasons.push(
+        `Salary matching failed — incoming (${formatM(salaryIn)}) exceeds max allowed (${formatM(maxAllowed)}) for outgoing (${formatM(salaryOut)}).`
+      );
+    }
+  }
+
+  return {
+    teamCode: team.teamCode,
+    salaryOut: Math.round(salaryOut * 100) / 100,
+    salaryIn: Math.round(salaryIn * 100) / 100,
+    netChange: Math.round(netChange * 100) / 100,
+    rosterSizeAfter,
+    taxStatus,
+    maxAllowedIncoming: Math.round(maxAllowed * 100) / 100,
+    passed: reasons.length === 0,
+    reasons,
+  };
+}
+
+function evaluateTrade(teams: TradeTeamState[], caps: ResolvedCapSettings): TradeValidationResult {
   const overallReasons: string[] = [];
   const teamResults: TradeValidationResult["teamResults"] = [];
 
@@ -145,63 +200,124 @@ export function validateTrade(
     overallReasons.push("No players or picks are being traded.");
   }
 
+  let allPassed = true;
   for (const team of teams) {
-    const reasons: string[] = [];
+    const result = evaluateTeam(team, caps);
+    if (!result.passed) allPassed = false;
+    teamResults.push(result);
+  }
 
-    const salaryOut = team.playersOut.reduce((sum, p) => sum + p.salary, 0);
-    const salaryIn = team.playersIn.reduce((sum, p) => sum + p.salary, 0);
-    const netChange = salaryIn - salaryOut;
+  const isValid = allPassed && overallReasons.length === 0;
 
-    const rosterSizeAfter = team.rosterSize - team.playersOut.length + team.playersIn.length;
+  return { isValid, teamResults, overallReasons };
+}
 
-    if (rosterSizeAfter < MIN_ROSTER_SIZE) {
-      reasons.push(`Roster would drop to ${rosterSizeAfter} players (minimum ${MIN_ROSTER_SIZE}).`);
-    }
-    if (rosterSizeAfter > MAX_ROSTER_SIZE) {
-      reasons.push(`Roster would increase to ${rosterSizeAfter} players (maximum ${MAX_ROSTER_SIZE}).`);
+export function validateTrade(
+  teams: TradeTeamState[],
+  year: number,
+  capSettings?: CapSettingOverrides
+): TradeValidationResult {
+  return evaluateTrade(teams, resolveCapSettings(year, capSettings));
+}
+
+// ===== Batch validation =====
+
+export interface TeamCapState {
+  teamCode: string;
+  currentSalary: number;
+  capSpace: number;
+  rosterSize: number;
+}
+
+export type TeamCapTable = Map<string, TeamCapState>;
+
+export interface BatchTradeTeamLeg {
+  teamCode: string;
+  playersOut: TradeTeamState["playersOut"];
+  playersIn: TradeTeamState["playersIn"];
+  picksOut: TradeTeamState["picksOut"];
+  picksIn: TradeTeamState["picksIn"];
+}
+
+export interface BatchTradeProposal {
+  id?: string | number;
+  teams: BatchTradeTeamLeg[];
+}
+
+export interface BatchTradeValidationResult {
+  year: number;
+  total: number;
+  validCount: number;
+  results: (TradeValidationResult & { id?: string | number })[];
+}
+
+export function buildTeamCapTable(
+  players: { teamCode: string; capHit: number | null }[],
+  teamCapSpace: { code: string; capSpace: number | null }[] = []
+): TeamCapTable {
+  const table: TeamCapTable = new Map();
+  for (const t of teamCapSpace) {
+    table.set(t.code, { teamCode: t.code, currentSalary: 0, capSpace: t.capSpace || 0, rosterSize: 0 });
+  }
+  for (const p of players) {
+    let entry = table.get(p.teamCode);
+    if (!entry) {
+      entry = { teamCode: p.teamCode, currentSalary: 0, capSpace: 0, rosterSize: 0 };
+      table.set(p.teamCode, entry);
     }
+    entry.currentSalary += p.capHit || 0;
+    entry.rosterSize++;
+  }
+  return table;
+}
 
-    const postTradeSalary = team.currentSalary + netChange;
-    const { maxAllowed, taxStatus } = calculateMaxIncoming(salaryOut, postTradeSalary, caps);
-
-    if (salaryIn > maxAllowed + 0.001) {
-      const formatM = (v: number) => `$${v.toFixed(1)}M`;
-      if (taxStatus === "under_cap") {
-        reasons.push(
-          `Team is under the cap but incoming salary (${formatM(salaryIn)}) exceeds available cap room (${formatM(maxAllowed)}).`
-        );
-      } else if (taxStatus === "second_apron") {
-        reasons.push(
-          `Team is above the second apron — incoming salary (${formatM(salaryIn)}) must not exceed outgoing (${formatM(salaryOut)}).`
-        );
-      } else if (taxStatus === "first_apron") {
-        reasons.push(
-          `Team is at/above the first apron — incoming salary (${formatM(salaryIn)}) exceeds 110% + $100K of outgoing (${formatM(maxAllowed)}).`
-        );
-      } else {
-        reasons.push(
-          `Salary matching failed — incoming (${formatM(salaryIn)}) exceeds max allowed (${formatM(maxAllowed)}) for outgoing (${formatM(salaryOut)}).`
-        );
+export function validateTradeBatch(
+  proposals: BatchTradeProposal[],
+  teamTable: TeamCapTable,
+  year: number,
+  capSettings?: CapSettingOverrides
+): BatchTradeValidationResult {
+  const caps = resolveCapSettings(year, capSettings);
+  const results: BatchTradeValidationResult["results"] = new Array(proposals.length);
+  let validCount = 0;
+
+  for (let i = 0; i < proposals.length; i++) {
+    const proposal = proposals[i];
+    const states: TradeTeamState[] = [];
+    const missing: string[] = [];
+
+    for (const leg of proposal.teams) {
+      const base = teamTable.get(leg.teamCode);
+      if (!base) {
+        missing.push(leg.teamCode);
+        continue;
       }
+      states.push({
+        teamCode: leg.teamCode,
+        currentSalary: base.currentSalary,
+        capSpace: base.capSpace,
+        rosterSize: base.rosterSize,
+        playersOut: leg.playersOut,
+        playersIn: leg.playersIn,
+        picksOut: leg.picksOut,
+        picksIn: leg.picksIn,
+      });
     }
 
-    const passed = reasons.length === 0;
-
-    teamResults.push({
-      teamCode: team.teamCode,
-      salaryOut: Math.round(salaryOut * 100) / 100,
-      salaryIn: Math.round(salaryIn * 100) / 100,
-      netChange: Math.round(netChange * 100) / 100,
-      rosterSizeAfter,
-      taxStatus,
-      maxAllowedIncoming: Math.round(maxAllowed * 100) / 100,
-      passed,
-      reasons,
-    });
-  }
+    let result: TradeValidationResult;
+    if (missing.length > 0) {
+      result = {
+        isValid: false,
+        teamResults: [],
+        overallReasons: missing.map((code) => `Unknown team ${code}.`),
+      };
+    } else {
+      result = evaluateTrade(states, caps);
+    }
 
-  const allPassed = teamResults.every((t) => t.passed);
-  const isValid = allPassed && overallReasons.length === 0;
+    if (result.isValid) validCount++;
+    results[i] = proposal.id !== undefined ? { id: proposal.id, ...result } : result;
+  }
 
-  return { isValid, teamResults, overallReasons };
+  return { year, total: proposals.length, validCount, results };
 }
@@ -185,6 +185,19 @@ export const playerSeasonStats = pgTable("player_season_stats", {
   fg3mPerGame: real("fg3m_per_game"),
   ftaPerGame: real("fta_per_game"),
   ftmPerGame: real("ftm_per_game"),
+  tsPct: real("ts_pct"),
+  efgPct: real("efg_pct"),
+  usgPct: real("usg_pct"),
+  pointsPer36: real("points_per_36"),
+  reboundsPer36: real("rebounds_per_36"),
+  assistsPer36: real("assists_per_36"),
+  stealsPer36: real("steals_per_36"),
+  blocksPer36: real("blocks_per_36"),
+  turnoversPer36: real("turnovers_per_36"),
+  gameScore: real("game_score"),
+  valueScore: real("value_score"),
+  capHit: real("cap_hit"),
+  valuePerMillion: real("value_per_million"),
   season: text("season").notNull().default("2025-26"),
   sport: text("sport").notNull().default("NBA"),
   updatedAt: timestamp("updated_at").defaultNow().notNull(),
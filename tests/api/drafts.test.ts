@@ -47,4 +47,34 @@ describe('Drafts API', () => {
     const res = await fetch(`${BASE_URL}/api/mock-drafts/999999`);
     expect(res.status).toBe(404);
   });
+
+  it('should return simulated draft odds', async () => {
+    const res = await fetch(`${BASE_URL}/api/draft-odds?sport=NBA`);
+    expect(res.status).toBe(200);
+    const data = await res.json();
+    expect(data.sport).toBe('NBA');
+    expect(data.slots.length).toBeGreaterThan(0);
+    expect(data.prospects.length).toBeGreaterThan(0);
+
+    // Each pick goes to one prospect and each prospect to at most one pick;
+    // the tables drop odds under 1%, so the listed ones can only sum lower.
+    for (const slot of data.slots) {
+      const total = slot.picks.reduce((sum: number, [, p]: [string, number]) => sum + p, 0);
+      expect(total).toBeGreaterThan(0);
+      expect(total).toBeLessThanOrEqual(1.001);
+    }
+    let expected = 0;
+    for (const prospect of data.prospects) {
+      expect(prospect.drafted).toBeLessThanOrEqual(1);
+      const total = prospect.slots.reduce((sum: number, [, p]: [number, number]) => sum + p, 0);
+      expect(total).toBeLessThanOrEqual(prospect.drafted + 0.001);
+      expect(prospect.expectedPick).toBeGreaterThanOrEqual(expected);
+      expected = prospect.expectedPick;
+    }
+  });
+
+  it('should return 404 for a sport with no simulated odds', async () => {
+    const res = await fetch(`${BASE_URL}/api/draft-odds?sport=NFL`);
+    expect(res.status).toBe(404);
+  });
 });
@@ -45,4 +45,19 @@ describe('Teams API', () => {
     const data = await res.json();
     expect(Array.isArray(data)).toBe(true);
   });
+
+  it('should warm the cache and serve warmed responses by ETag', async () => {
+    const warmRes = await fetch(`${BASE_URL}/api/cache/warm`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ sports: ['NBA'] }),
+    });
+    expect(warmRes.status).toBe(200);
+    const report = await warmRes.json();
+    const teamsEntry = report.entries.find((e: { key: string }) => e.key === 'teams:NBA');
+    expect(teamsEntry.etag).toBeTruthy();
+
+    const res = await fetch(`${BASE_URL}/api/teams?sport=NBA`, { headers: { 'If-None-Match': teamsEntry.etag } });
+    expect(res.status).toBe(304);
+  });
 });
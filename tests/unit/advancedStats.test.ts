@@ -0,0 +1,60 @@
+import { describe, it, expect } from 'vitest';
+import { computeAdvancedStats, capHitLookup, statsNameKey } from '../../server/advancedStats';
+import type { InsertPlayerSeasonStats } from '../../shared/schema';
+
+const line = (overrides: Partial<InsertPlayerSeasonStats>): InsertPlayerSeasonStats => ({
+  name: 'Player', teamCode: 'BOS', position: 'SF', gamesPlayed: 10, minutesPerGame: 24,
+  pointsPerGame: 12, reboundsPerGame: 6, assistsPerGame: 3, stealsPerGame: 1, blocksPerGame: 1,
+  turnoversPerGame: 2, offRebPerGame: 2, defRebPerGame: 4, personalFouls: 2,
+  fgaPerGame: 10, fgmPerGame: 5, fg3aPerGame: 4, fg3mPerGame: 2, ftaPerGame: 2, ftmPerGame: 1,
+  season: '2025-26', sport: 'NBA',
+  ...overrides,
+});
+
+describe('Advanced stats', () => {
+  it('should compute shooting efficiency and per-36 rates', () => {
+    const [row] = computeAdvancedStats([line({})]);
+    expect(row.tsPct).toBeCloseTo(12 / (2 * (10 + 0.44 * 2)), 2);
+    expect(row.efgPct).toBe(0.6);
+    expect(row.pointsPer36).toBe(18);
+    expect(row.reboundsPer36).toBe(9);
+    expect(row.gameScore).toBe(10.2);
+  });
+
+  it('should give each player their share of team possessions as usage', () => {
+    const rows = computeAdvancedStats([
+      line({ name: 'A', minutesPerGame: 48 }),
+      line({ name: 'B', minutesPerGame: 48 }),
+    ]);
+    // Two identical players who play every team minute: 100 * (96 / 5) / (48 * 2).
+    expect(rows[0].usgPct).toBe(rows[1].usgPct);
+    expect(rows[0].usgPct).toBe(20);
+  });
+
+  it('should rank value among qualified players and join cap hits', () => {
+    const rows = computeAdvancedStats([
+      line({ name: 'Luka Dončić', teamCode: 'LAL', pointsPerGame: 30 }),
+      line({ name: 'Bench Guy', pointsPerGame: 4 }),
+      line({ name: 'Call Up', gamesPlayed: 2 }),
+    ], capHitLookup([
+      { name: 'Luka Doncic', teamCode: 'LAL', capHit: 46 },
+      { name: 'Bench Guy', teamCode: 'NYK', capHit: 2 },
+    ]));
+    expect(rows.map(r => r.valueScore)).toEqual([100, 0, null]);
+    expect(rows[0].capHit).toBe(46);
+    expect(rows[0].valuePerMillion).toBeCloseTo(rows[0].gameScore! / 46, 1);
+    expect(rows[1].capHit).toBe(2);
+    expect(rows[2].capHit).toBeNull();
+  });
+
+  it('should leave metrics empty when the inputs are missing', () => {
+    const [row] = computeAdvancedStats([line({ minutesPerGame: 0, fgaPerGame: 0, ftaPerGame: 0 })]);
+    expect(row).toMatchObject({ tsPct: null, efgPct: null, usgPct: null, pointsPer36: null });
+  });
+
+  it('should match roster names across accents and suffixes', () => {
+    expect(statsNameKey('Nikola Jokić')).toBe('nikola jokic');
+    expect(statsNameKey('Jaren Jackson Jr.')).toBe('jaren jackson');
+    expect(statsNameKey("De'Aaron Fox")).toBe('deaaron fox');
+  });
+});
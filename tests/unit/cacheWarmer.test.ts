@@ -0,0 +1,44 @@
+import { describe, it, expect } from 'vitest';
+import { warmCache } from '../../server/cacheWarmer';
+import { responseCache } from '../../server/cache';
+
+const sleep = (ms: number) => new Promise(r => setTimeout(r, ms));
+
+describe('Cache warmer', () => {
+  it('should load targets into the response cache with ETags', async () => {
+    const report = await warmCache([
+      { key: 'warm-test:a', ttlMs: 60000, load: async () => [1, 2, 3] },
+      { key: 'warm-test:b', ttlMs: 60000, load: async () => { throw new Error('db down'); } },
+    ]);
+    expect(report.entries.map(e => e.key)).toEqual(['warm-test:a']);
+    expect(report.failed).toEqual([{ key: 'warm-test:b', error: 'db down' }]);
+    expect(responseCache.get('warm-test:a')).toEqual({ data: [1, 2, 3], etag: report.entries[0].etag });
+    expect(responseCache.get('warm-test:b')).toBeNull();
+  });
+
+  it('should keep serving the old entry until the new payload is loaded', async () => {
+    responseCache.set('warm-test:c', 'old');
+    const warming = warmCache([{ key: 'warm-test:c', ttlMs: 60000, load: async () => { await sleep(20); return 'new'; } }]);
+    expect(responseCache.get('warm-test:c')?.data).toBe('old');
+    await warming;
+    expect(responseCache.get('warm-test:c')?.data).toBe('new');
+  });
+
+  it('should bound concurrent loads', async () => {
+    let active = 0;
+    let maxActive = 0;
+    const targets = Array.from({ length: 10 }, (_, i) => ({
+      key: `warm-test:n${i}`,
+      ttlMs: 60000,
+      load: async () => {
+        maxActive = Math.max(maxActive, ++active);
+        await sleep(5);
+        active--;
+        return i;
+      },
+    }));
+    const report = await warmCache(targets, 3);
+    expect(report.entries).toHaveLength(10);
+    expect(maxActive).toBe(3);
+  });
+});
@@ -0,0 +1,119 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { runJobs } from '../../server/jobRunner';
+
+const sleep = (ms: number) => new Promise(r => setTimeout(r, ms));
+
+// Runs the jobs on fake timers, so the timing assertions below are exact
+// clock readings rather than wall-clock bounds.
+async function run(...args: Parameters<typeof runJobs>) {
+  const report = runJobs(...args);
+  await vi.runAllTimersAsync();
+  return report;
+}
+
+describe('Job runner', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('should run jobs on different sources in parallel', async () => {
+    const report = await run([
+      { name: 'a', source: 'one', run: () => sleep(50) },
+      { name: 'b', source: 'two', run: () => sleep(50) },
+    ], {
+      one: { concurrency: 1, minIntervalMs: 0 },
+      two: { concurrency: 1, minIntervalMs: 0 },
+    });
+    expect(report.jobs.map(j => j.status)).toEqual(['succeeded', 'succeeded']);
+    expect(report.durationMs).toBe(50);
+  });
+
+  it('should serialize and space jobs on the same source', async () => {
+    let active = 0;
+    let maxActive = 0;
+    const job = (name: string) => ({
+      name,
+      source: 'site',
+      run: async () => {
+        maxActive = Math.max(maxActive, ++active);
+        await sleep(10);
+        active--;
+      },
+    });
+    const report = await run([job('a'), job('b'), job('c')], { site: { concurrency: 1, minIntervalMs: 40 } });
+    expect(maxActive).toBe(1);
+    const starts = report.jobs.map(j => Date.parse(j.startedAt!)).sort((x, y) => x - y);
+    expect([starts[1] - starts[0], starts[2] - starts[1]]).toEqual([50, 50]);
+  });
+
+  it('should space jobs on a source from the end of the previous one', async () => {
+    const job = (name: string) => ({ name, source: 'site', run: () => sleep(30) });
+    const report = await run([job('a'), job('b')], { site: { concurrency: 1, minIntervalMs: 40 } });
+    const [first, second] = report.jobs.map(j => Date.parse(j.startedAt!)).sort((x, y) => x - y);
+    expect(second - first).toBe(70);
+  });
+
+  it('should hold the source until a timed-out attempt settles', async () => {
+    const starts: number[] = [];
+    let active = 0;
+    let maxActive = 0;
+    let aborted = 0;
+    const report = await run([
+      {
+        name: 'stuck',
+        source: 'site',
+        timeoutMs: 20,
+        retries: 1,
+        retryDelayMs: 1,
+        run: async ({ signal }) => {
+          starts.push(Date.now());
+          signal.addEventListener('abort', () => aborted++);
+          maxActive = Math.max(maxActive, ++active);
+          await sleep(80);
+          active--;
+        },
+      },
+    ], { site: { concurrency: 1, minIntervalMs: 0 } });
+    expect(report.jobs[0]).toMatchObject({ status: 'timed_out', attempts: 2 });
+    expect(aborted).toBe(2);
+    expect(maxActive).toBe(1);
+    expect(starts[1] - starts[0]).toBe(80);
+  });
+
+  it('should pass dependency results and skip dependents of failed jobs', async () => {
+    const sources = { db: { concurrency: 2, minIntervalMs: 0 } };
+    const report = await run([
+      { name: 'college', source: 'db', dependsOn: ['prospects'], run: async ({ results }) => (results.get('prospects') as string[]).length },
+      { name: 'prospects', source: 'db', run: async () => ['A', 'B'] },
+      { name: 'broken', source: 'db', run: async () => { throw new Error('boom'); } },
+      { name: 'after-broken', source: 'db', dependsOn: ['broken'], run: async () => 1 },
+    ], sources);
+    const byName = Object.fromEntries(report.jobs.map(j => [j.name, j]));
+    expect(byName.college.status).toBe('succeeded');
+    expect(byName.broken).toMatchObject({ status: 'failed', error: 'boom' });
+    expect(byName['after-broken']).toMatchObject({ status: 'skipped', attempts: 0 });
+  });
+
+  it('should retry failures and report timeouts', async () => {
+    let calls = 0;
+    const report = await run([
+      { name: 'flaky', source: 's', retries: 2, retryDelayMs: 1, run: async () => { if (++calls < 3) throw new Error('503'); return calls; } },
+      { name: 'slow', source: 's', timeoutMs: 20, run: () => sleep(200) },
+    ], { s: { concurrency: 2, minIntervalMs: 0 } });
+    expect(report.jobs[0]).toMatchObject({ status: 'succeeded', attempts: 3 });
+    expect(report.jobs[1].status).toBe('timed_out');
+    expect(report.jobs[1].durationMs).toBe(20);
+  });
+
+  it('should reject unknown sources and dependency cycles', async () => {
+    await expect(runJobs([{ name: 'a', source: 'nope', run: async () => 1 }], {})).rejects.toThrow('unknown source');
+    await expect(runJobs([
+      { name: 'a', source: 's', dependsOn: ['b'], run: async () => 1 },
+      { name: 'b', source: 's', dependsOn: ['a'], run: async () => 1 },
+    ], { s: { concurrency: 1, minIntervalMs: 0 } })).rejects.toThrow('cycle');
+  });
+});
@@ -0,0 +1,84 @@
+import { describe, it, expect } from 'vitest';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { gzipSync } from 'zlib';
+import { loadSearchIndex, prepareSearchIndex, searchKey, searchPlayers, type SearchIndexArtifact } from '../../server/playerSearch';
+
+// Built by pipeline/search_index.py build_index (grams trimmed to the ones the tests query).
+const artifact: SearchIndexArtifact = {
+  version: 1,
+  count: 5,
+  dictionaries: {
+    kind: ['freeAgent', 'prospect', 'roster'],
+    sport: ['NBA', 'NFL'],
+    team: ['CHI', 'DEN', 'Indiana', 'MEM', 'OKC'],
+    position: ['C', 'PF', 'PG', 'QB', 'SF'],
+  },
+  columns: {
+    kind: [2, 2, 2, 0, 1],
+    sport: [0, 0, 0, 0, 1],
+    team: [4, 1, 3, 0, 2],
+    position: [4, 0, 1, 2, 3],
+    id: [1, 2, 3, 4, 5],
+    name: ['Luguentz Dort', 'Nikola Jokić', 'Jaren Jackson Jr.', 'Tre Jones', 'Fernando Mendoza'],
+  },
+  names: {
+    keys: ['fernando mendoza', 'jaren jackson', 'jaren jackson jr', 'lu dort', 'luguentz dort', 'nikola jokic', 'tre jones'],
+    entries: [4, 2, 2, 0, 0, 1, 3],
+  },
+  tokens: {
+    keys: ['dort', 'jackson', 'jackson jr', 'jokic', 'jones', 'jr', 'mendoza'],
+    entries: [0, 2, 2, 1, 3, 2, 4],
+  },
+  grams: { ' jo': [1, 3], 'jok': [1] },
+};
+
+const index = prepareSearchIndex(artifact);
+const names = (q: string, opts?: Parameters<typeof searchPlayers>[2]) => searchPlayers(index, q, opts).map(r => r.name);
+
+describe('Player search', () => {
+  it('should fold names the way the pipeline does', () => {
+    expect(searchKey('Nikola Jokić')).toBe('nikola jokic');
+    expect(searchKey("  De'Aaron  Fox ")).toBe('deaaron fox');
+    expect(searchKey('Shai Gilgeous-Alexander')).toBe('shai gilgeous alexander');
+    expect(searchKey('Jaren Jackson Jr.')).toBe('jaren jackson jr');
+  });
+
+  it('should match name prefixes, aliases and later words', () => {
+    expect(names('Lu Dort')).toEqual(['Luguentz Dort']);
+    expect(names('JOKIĆ')).toEqual(['Nikola Jokić']);
+    expect(names('jaren jackson jr')).toEqual(['Jaren Jackson Jr.']);
+    expect(names('j')).toEqual(['Jaren Jackson Jr.', 'Nikola Jokić', 'Tre Jones']);
+    expect(searchPlayers(index, 'jones')[0]).toEqual({ id: 4, name: 'Tre Jones', kind: 'freeAgent', sport: 'NBA', team: 'CHI', position: 'PG' });
+  });
+
+  it('should fall back to trigrams for misspellings', () => {
+    expect(names('jokci')).toEqual(['Nikola Jokić']);
+    expect(names('xyz')).toEqual([]);
+  });
+
+  it('should filter by sport and kind and respect the limit', () => {
+    expect(names('mendoza', { sport: 'NBA' })).toEqual([]);
+    expect(names('mendoza', { sport: 'NFL', kind: 'prospect' })).toEqual(['Fernando Mendoza']);
+    expect(names('j', { kind: 'roster' })).toEqual(['Jaren Jackson Jr.', 'Nikola Jokić']);
+    expect(names('j', { limit: 1 })).toEqual(['Jaren Jackson Jr.']);
+    expect(names('  ')).toEqual([]);
+  });
+
+  it('should reject other index versions', () => {
+    expect(() => prepareSearchIndex({ ...artifact, version: 2 })).toThrow('version 2');
+  });
+
+  it('should load a gzipped index and reuse it until the file changes', async () => {
+    const file = path.join(fs.mkdtempSync(path.join(os.tmpdir(), 'player-search-')), 'playerSearch.json.gz');
+    fs.writeFileSync(file, gzipSync(JSON.stringify(artifact)));
+    const first = await loadSearchIndex(file);
+    expect(first.entries).toHaveLength(5);
+    expect(await loadSearchIndex(file)).toBe(first);
+
+    fs.writeFileSync(file, gzipSync(JSON.stringify({ ...artifact, count: 1 })));
+    fs.utimesSync(file, new Date(), new Date(Date.now() + 5000));
+    expect((await loadSearchIndex(file)).entries).toHaveLength(1);
+  });
+});
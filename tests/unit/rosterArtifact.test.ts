@@ -0,0 +1,61 @@
+import { describe, it, expect } from 'vitest';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { gzipSync } from 'zlib';
+import { decodeRosterArtifact, loadRosterArtifact, type RosterArtifact } from '../../server/rosterArtifact';
+
+const artifact: RosterArtifact = {
+  version: 1,
+  sport: 'NBA',
+  count: 2,
+  dictionaries: { teamCode: ['ATL', 'BOS'], position: ['PG', 'SF'], status: ['active'], optionType: ['none', 'player'] },
+  columns: {
+    teamCode: [0, 1],
+    name: ['CJ McCollum', 'Jaylen Brown'],
+    position: [0, 1],
+    depthOrder: [1, 1],
+    age: [34, 29],
+    capHit: [30.67, 53.14],
+    contractYears: [1, 2],
+    status: [0, 0],
+    contractEndYear: [2026, 2028],
+    optionType: [0, 1],
+    salaryStart: [2025, 2026],
+    salaries: [[30.67], [53.14, 57.1]],
+  },
+};
+
+describe('Roster artifact', () => {
+  it('should decode columns into roster rows', () => {
+    const rows = decodeRosterArtifact(artifact);
+    expect(rows).toHaveLength(2);
+    expect(rows[1]).toEqual({
+      teamCode: 'BOS', name: 'Jaylen Brown', position: 'SF', depthOrder: 1, age: 29, capHit: 53.14,
+      contractYears: 2, status: 'active', sport: 'NBA', salaryByYear: { '2026': 53.14, '2027': 57.1 },
+      contractEndYear: 2028, optionType: 'player',
+    });
+  });
+
+  it('should reject other artifact versions', () => {
+    expect(() => decodeRosterArtifact({ ...artifact, version: 2 })).toThrow('version 2');
+  });
+
+  it('should load a gzipped artifact and reuse it until the file changes', async () => {
+    const file = path.join(fs.mkdtempSync(path.join(os.tmpdir(), 'roster-artifact-')), 'rosters.json.gz');
+    fs.writeFileSync(file, gzipSync(JSON.stringify(artifact)));
+    const first = await loadRosterArtifact(file);
+    expect(first.map(r => r.name)).toEqual(['CJ McCollum', 'Jaylen Brown']);
+    expect(await loadRosterArtifact(file)).toBe(first);
+
+    fs.writeFileSync(file, gzipSync(JSON.stringify({ ...artifact, count: 1 })));
+    fs.utimesSync(file, new Date(), new Date(Date.now() + 5000));
+    expect(await loadRosterArtifact(file)).toHaveLength(1);
+  });
+
+  it('should ship the NBA roster artifact', async () => {
+    const rows = await loadRosterArtifact();
+    expect(rows.length).toBeGreaterThan(400);
+    expect(rows.every(r => r.sport === 'NBA' && r.teamCode && r.name)).toBe(true);
+  });
+});
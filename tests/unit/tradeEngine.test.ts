@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { validateTrade, getDefaultCapSettings } from '../../server/tradeEngine';
+import { validateTrade, validateTradeBatch, buildTeamCapTable, getDefaultCapSettings } from '../../server/tradeEngine';
 
 describe('Trade Engine', () => {
   describe('getDefaultCapSettings', () => {
@@ -22,4 +22,51 @@ describe('Trade Engine', () => {
       expect(result).toHaveProperty('isValid');
     });
   });
+
+  describe('validateTradeBatch', () => {
+    const table = buildTeamCapTable(
+      [
+        ...Array.from({ length: 14 }, (_, i) => ({ teamCode: 'LAL', capHit: i === 0 ? 40 : 10 })),
+        ...Array.from({ length: 13 }, (_, i) => ({ teamCode: 'BOS', capHit: i === 0 ? 50 : 12 })),
+        ...Array.from({ length: 15 }, () => ({ teamCode: 'SAS', capHit: 6 })),
+      ],
+      [{ code: 'LAL', capSpace: 0 }, { code: 'BOS', capSpace: -30 }, { code: 'SAS', capSpace: 62 }]
+    );
+
+    const legs = [
+      [
+        { teamCode: 'LAL', playersOut: [{ id: 1, name: 'A', salary: 40 }], playersIn: [{ id: 2, name: 'B', salary: 50 }], picksOut: [], picksIn: [] },
+        { teamCode: 'BOS', playersOut: [{ id: 2, name: 'B', salary: 50 }], playersIn: [{ id: 1, name: 'A', salary: 40 }], picksOut: [], picksIn: [] },
+      ],
+      [
+        { teamCode: 'SAS', playersOut: [], playersIn: [{ id: 3, name: 'C', salary: 12 }, { id: 4, name: 'D', salary: 12 }], picksOut: [], picksIn: [] },
+        { teamCode: 'BOS', playersOut: [{ id: 3, name: 'C', salary: 12 }, { id: 4, name: 'D', salary: 12 }], playersIn: [], picksOut: [], picksIn: [] },
+      ],
+      [
+        { teamCode: 'LAL', playersOut: [], playersIn: [], picksOut: [{ id: 9, description: 'R1 Pick #20' }], picksIn: [] },
+        { teamCode: 'SAS', playersOut: [], playersIn: [], picksOut: [], picksIn: [{ id: 9, description: 'R1 Pick #20' }] },
+      ],
+    ];
+
+    it('should build per-team salary and roster totals', () => {
+      expect(table.get('LAL')).toEqual({ teamCode: 'LAL', currentSalary: 170, capSpace: 0, rosterSize: 14 });
+      expect(table.get('SAS')?.rosterSize).toBe(15);
+    });
+
+    it('should match single-trade validation for every proposal', () => {
+      const batch = validateTradeBatch(legs.map((teams, i) => ({ id: i, teams })), table, 2026);
+      expect(batch.total).toBe(legs.length);
+      legs.forEach((teams, i) => {
+        const single = validateTrade(teams.map((t) => ({ ...table.get(t.teamCode)!, ...t })), 2026);
+        expect(batch.results[i]).toEqual({ id: i, ...single });
+      });
+      expect(batch.validCount).toBe(batch.results.filter((r) => r.isValid).length);
+    });
+
+    it('should reject proposals that reference unknown teams', () => {
+      const batch = validateTradeBatch([{ teams: [legs[2][0], { ...legs[2][1], teamCode: 'XXX' }] }], table, 2026);
+      expect(batch.results[0].isValid).toBe(false);
+      expect(batch.results[0].overallReasons).toEqual(['Unknown team XXX.']);
+    });
+  });
 });